@@ -0,0 +1 @@
+# Benchmark modülü başlatma dosyası
\ No newline at end of file
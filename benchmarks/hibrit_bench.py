@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Hibrit model çağrı başına gecikme ölçümü
+
+Kullanım (depo kök dizininden):
+    python -m benchmarks.hibrit_bench [--steps 300] [--seed 7]
+"""
+
+import argparse
+import copy
+import random
+import statistics
+import time
+
+from core.engine import AnalysisEngine, HIBRIT_MODEL
+from core.features import MatrixFeatures
+from models.combined import CombinedAnalysis
+from models.hibrit import HibritAnalysis
+from models.registry import COMBINED_MODEL, MODEL_ENTRY_POINTS, base_model_names, load_model_class
+
+
+def build_corpus(steps, seed):
+    """Sabit tohumla motoru ilerletip Hibrit girdilerinden oluşan bir derlem üretir"""
+    rng = random.Random(seed)
+    engine = AnalysisEngine()
+    corpus = []
+
+    for _ in range(steps):
+        engine.add_selection(rng.choice([1, 2]))
+        predictions = engine.analyze()
+        if predictions:
+            corpus.append((engine.matrix_data.copy(), list(engine.history),
+                           copy.deepcopy(engine.model_stats), dict(predictions)))
+
+    return corpus
+
+
+def legacy_models():
+    """
+    Eski Hibrit'in her çağrıda oluşturduğu model sözlüğü
+    
+    12 temel model ve kendi 12 alt modelini oluşturan yeni bir Karma modeli
+    (toplam 25 model nesnesi) her seferinde yeniden oluşturulur.
+    """
+    models = {name: load_model_class(MODEL_ENTRY_POINTS[name])() for name in base_model_names()}
+    combined = CombinedAnalysis()
+    combined.models.load_all()
+    models[COMBINED_MODEL] = combined
+    return models
+
+
+def _time_calls(corpus, call):
+    """Her derlem öğesi için çağrı süresini mikro saniye olarak ölçer"""
+    timings = []
+    for item in corpus:
+        start = time.perf_counter()
+        call(*item)
+        timings.append((time.perf_counter() - start) * 1e6)
+    return timings
+
+
+def run(steps=300, seed=7):
+    """Üç çalışma biçimini ölçer ve sonuçları sözlük olarak döndürür"""
+    corpus = build_corpus(steps, seed)
+
+    def legacy(matrix, history, model_stats, predictions):
+        # Eski davranış: her çağrıda tüm modeller (Karma ve alt modelleri dahil)
+        # yeniden oluşturulur, ardından yeterli tahmin yapmış olanlar çalıştırılır
+        hibrit = HibritAnalysis()
+        hibrit._models = legacy_models()
+        hibrit.analyze(matrix, history, model_stats)
+
+    standalone_model = HibritAnalysis()
+
+    def standalone(matrix, history, model_stats, predictions):
+        # Kalıcı kayıt defteri, tahminler Hibrit içinde hesaplanır
+        standalone_model.analyze(matrix, history, model_stats)
+
+    shared_model = HibritAnalysis()
+
+    def shared(matrix, history, model_stats, predictions):
+        # Motorun yaptığı gibi hazır tahminlerle
+        features = MatrixFeatures(matrix, history)
+        shared_model.analyze(matrix, history, model_stats, predictions=predictions,
+                             features=features)
+
+    results = {}
+    for label, call in (("önce (her çağrıda yeniden oluşturma)", legacy),
+                        ("kalıcı kayıt defteri", standalone),
+                        ("hazır tahminler", shared)):
+        timings = _time_calls(corpus, call)
+        results[label] = {
+            'calls': len(timings),
+            'mean_us': statistics.mean(timings),
+            'median_us': statistics.median(timings)
+        }
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hibrit model çağrı başına gecikme ölçümü")
+    parser.add_argument("--steps", type=int, default=300, help="Derlem için üretilecek hamle sayısı")
+    parser.add_argument("--seed", type=int, default=7, help="Rastgele tohum")
+    args = parser.parse_args()
+
+    results = run(args.steps, args.seed)
+    baseline = next(iter(results.values()))['mean_us']
+
+    print(f"{HIBRIT_MODEL} - çağrı başına gecikme")
+    for label, result in results.items():
+        speedup = baseline / result['mean_us'] if result['mean_us'] > 0 else 0
+        print(f"  {label:<40} ort. {result['mean_us']:9.1f} µs  "
+              f"medyan {result['median_us']:9.1f} µs  x{speedup:.1f}")
+
+
+if __name__ == "__main__":
+    main()
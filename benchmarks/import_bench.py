@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Arayüz ve komut satırı araçları için soğuk başlangıç (içe aktarma) raporu
+
+Her hedef ayrı, yeni bir Python sürecinde ölçülür: modülün içe aktarılması ve
+ardından tüm modellerin ilk kullanımda yüklenmesi. Süreç `-X importtime` ile
+çalıştırıldığından en pahalı modüller de raporlanır.
+
+Kullanım (depo kök dizininden):
+    python -m benchmarks.import_bench [--output sonuc.json] [--repeat 5]
+    python -m benchmarks.import_bench --compare taban.json [--threshold 0.2]
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import subprocess
+import sys
+
+from benchmarks.model_bench import compare, summarize
+
+# Hedef adı -> içe aktarılan modül
+TARGETS = {
+    "gui": "ui.main_window",
+    "predict": "predict",
+    "server": "server",
+    "backtest": "core.backtest",
+    "engine": "core.engine"
+}
+
+# Raporda hedef başına gösterilen en pahalı modül sayısı
+TOP_MODULES = 8
+
+# Alt modülleri de ayrı raporlanan depo paketleri
+PROJECT_PACKAGES = ("core.", "models.", "ui.")
+
+# Ölçülen süreçte çalışan kod: süreleri ve Qt'nin yüklenip yüklenmediğini yazar
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+imported = time.perf_counter()
+from core.engine import AnalysisEngine
+AnalysisEngine(cache_size=0).analysis_models.load_all()
+loaded = time.perf_counter()
+print(json.dumps({{"import_us": (imported - start) * 1e6, "models_us": (loaded - imported) * 1e6,
+                  "qt": "PyQt5" in sys.modules}}))
+"""
+
+
+def parse_importtime(output):
+    """
+    `-X importtime` çıktısını modül başına süreye çevirir
+
+    Returns:
+        dict: Modül adı -> (kendi süresi, toplam süre) mikro saniye
+    """
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Başlık satırı
+        modules[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return modules
+
+
+def measure(module):
+    """
+    Bir modülün soğuk başlangıcını yeni bir süreçte bir kez ölçer
+
+    Returns:
+        tuple: (ölçüm sözlüğü, modül başına süreler)
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    environment["PYTHONPATH"] = os.pathsep.join(filter(None, [root, environment.get("PYTHONPATH")]))
+
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module)],
+                               cwd=root, env=environment, capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.splitlines()[-1]), parse_importtime(completed.stderr)
+
+
+def run(repeat=5, targets=None):
+    """
+    Hedeflerin soğuk başlangıcını ölçer ve JSON'a yazılabilir sonuç sözlüğünü döndürür
+
+    PyQt5 kurulu değilse arayüz hedefi atlanır.
+    """
+    results = {}
+    report = {}
+
+    for name in targets or TARGETS:
+        module = TARGETS[name]
+        if name == "gui" and importlib.util.find_spec("PyQt5") is None:
+            continue
+
+        runs = [measure(module) for _ in range(repeat)]
+        results[f"import/{name}"] = summarize([probe["import_us"] for probe, _ in runs])
+        results[f"models/{name}"] = summarize([probe["models_us"] for probe, _ in runs])
+
+        # En pahalı üst düzey ve depo modülleri son ölçümden (toplam süreye göre)
+        probe, modules = runs[-1]
+        top = sorted(((module_name, times) for module_name, times in modules.items()
+                      if module_name != module
+                      and ("." not in module_name or module_name.startswith(PROJECT_PACKAGES))),
+                     key=lambda item: item[1][1], reverse=True)[:TOP_MODULES]
+        report[name] = {
+            "module": module,
+            "qt": probe["qt"],
+            "top": [{"module": module_name, "self_us": own, "cumulative_us": cumulative}
+                    for module_name, (own, cumulative) in top]
+        }
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': repeat
+        },
+        'results': results,
+        'report': report
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Soğuk başlangıç (içe aktarma) süresi raporu")
+    parser.add_argument("--repeat", type=int, default=5, help="Hedef başına süreç sayısı")
+    parser.add_argument("--target", action="append", choices=list(TARGETS),
+                        help="Yalnızca bu hedefi ölç (birden çok verilebilir)")
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", help="Karşılaştırılacak taban çizgisi JSON dosyası")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Gerileme eşiği (p50 göreli artışı, varsayılan 0.2)")
+    args = parser.parse_args()
+
+    current = run(args.repeat, args.target)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(current, output, ensure_ascii=False, indent=2)
+
+    if not args.compare:
+        for name, report in current['report'].items():
+            import_p50 = current['results'][f"import/{name}"]['p50_us'] / 1000
+            models_p50 = current['results'][f"models/{name}"]['p50_us'] / 1000
+            qt = "  (PyQt5 yüklü)" if report['qt'] else ""
+            print(f"{name} ({report['module']}): içe aktarma {import_p50:.1f} ms, "
+                  f"modeller {models_p50:.1f} ms{qt}")
+            for row in report['top']:
+                print(f"  {row['module']:<32} {row['cumulative_us'] / 1000:8.1f} ms")
+        return
+
+    with open(args.compare, encoding="utf-8") as stream:
+        baseline = json.load(stream)
+
+    rows = compare(current, baseline, args.threshold)
+    regressions = [row for row in rows if row[4]]
+
+    print(f"  {'Ölçüm':<24} {'taban p50':>11} {'güncel p50':>11} {'oran':>7}")
+    for key, reference, value, ratio, regressed in rows:
+        flag = "  GERİLEME" if regressed else ""
+        print(f"  {key:<24} {reference / 1000:9.1f}ms {value / 1000:9.1f}ms {ratio:6.2f}x{flag}")
+
+    print(f"{len(regressions)} gerileme (eşik %{args.threshold * 100:.0f})")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Tüm modeller ve arayüz tıklama yolu için gecikme ölçümü
+
+Kullanım (depo kök dizininden):
+    python -m benchmarks.model_bench [--output sonuc.json] [--boards 200] [--seed 7]
+    python -m benchmarks.model_bench --compare taban.json [--threshold 0.2]
+"""
+
+import argparse
+import copy
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+import numpy as np
+
+from core.engine import AnalysisEngine, HIBRIT_MODEL
+
+# Ölçülen doluluk seviyeleri (matristeki dolu hücre sayısı)
+FILL_LEVELS = (5, 12, 20, 25)
+
+# Raporlanan yüzdelikler
+PERCENTILES = (50, 90, 99)
+
+
+def build_corpus(fill, boards, seed):
+    """
+    Belirli doluluktaki matrislerden sabit tohumlu bir derlem üretir
+
+    Her matris boş motora `fill` adet rastgele sonuç eklenerek oluşturulur; geçmiş
+    ve model istatistikleri arayüzdeki gibi gerçek sırayla birikir.
+
+    Returns:
+        list: (matris, geçmiş, model istatistikleri) üçlüleri
+    """
+    rng = random.Random(seed * 1000 + fill)
+    corpus = []
+
+    for _ in range(boards):
+        engine = AnalysisEngine(cache_size=0)
+        for _ in range(fill):
+            engine.step(rng.choice([1, 2]))
+        corpus.append((engine.matrix_data.copy(), list(engine.history),
+                       copy.deepcopy(engine.model_stats)))
+
+    return corpus
+
+
+def summarize(timings):
+    """Mikro saniye cinsinden süre listesini yüzdelik özetine çevirir"""
+    values = np.asarray(timings)
+    summary = {'calls': len(values), 'mean_us': float(values.mean()) if len(values) else 0.0}
+    for percentile in PERCENTILES:
+        summary[f'p{percentile}_us'] = float(np.percentile(values, percentile)) if len(values) else 0.0
+    return summary
+
+
+def _time_calls(corpus, call, repeat):
+    """Her derlem öğesi için çağrıyı `repeat` kez ölçer (mikro saniye)"""
+    timings = []
+    for _ in range(repeat):
+        for item in corpus:
+            start = time.perf_counter()
+            call(*item)
+            timings.append((time.perf_counter() - start) * 1e6)
+    return timings
+
+
+def run_models(boards=200, seed=7, repeat=3):
+    """
+    Her modelin analyze çağrısını her doluluk seviyesinde ölçer
+
+    Modeller tek başına (paylaşılan özellikler ve hazır tahminler olmadan)
+    çağrılır; Karma ve Hibrit kendi alt modellerini de çalıştırır.
+
+    Returns:
+        dict: "models/<model>/<doluluk>" -> yüzdelik özeti
+    """
+    models = AnalysisEngine(cache_size=0).analysis_models
+    results = {}
+
+    for fill in FILL_LEVELS:
+        corpus = build_corpus(fill, boards, seed)
+
+        for name, model in models.items():
+            if name == HIBRIT_MODEL:
+                def call(matrix, history, model_stats, model=model):
+                    model.analyze(matrix, history, model_stats)
+            else:
+                def call(matrix, history, model_stats, model=model):
+                    model.analyze(matrix, history)
+
+            results[f"models/{name}/{fill}"] = summarize(_time_calls(corpus, call, repeat))
+
+    return results
+
+
+def run_gui(steps=300, seed=7):
+    """
+    Arayüzün tıklama yolunu çekirdeksiz (offscreen) Qt platformunda ölçer
+
+    "gui/click" bir değerin eklenmesinden (arka plandaki analiz bitip) tahminin
+    gösterilmesine kadar geçen süredir; "gui/perform_analysis" aynı durumlarda önbellek boşaltılarak
+    yalnızca _perform_analysis çağrısını ölçer.
+
+    Returns:
+        dict: "gui/click" ve "gui/perform_analysis" -> yüzdelik özeti
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    from ui.main_window import WLPatternAnalyzer
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    window = WLPatternAnalyzer()
+    window.show()
+    app.processEvents()
+
+    rng = random.Random(seed)
+    click_timings = []
+    analysis_timings = []
+
+    for _ in range(steps):
+        value = rng.choice([1, 2])
+
+        start = time.perf_counter()
+        window._add_selection(value)
+        window.analysis_scheduler.wait()
+        app.processEvents()
+        click_timings.append((time.perf_counter() - start) * 1e6)
+
+        if window.engine.cache is not None:
+            window.engine.cache.clear()
+        start = time.perf_counter()
+        window._perform_analysis()
+        window.analysis_scheduler.wait()
+        app.processEvents()
+        analysis_timings.append((time.perf_counter() - start) * 1e6)
+
+    window.close()
+    return {"gui/click": summarize(click_timings),
+            "gui/perform_analysis": summarize(analysis_timings)}
+
+
+def run(boards=200, seed=7, repeat=3, gui=True):
+    """Tüm ölçümleri çalıştırır ve JSON'a yazılabilir sonuç sözlüğünü döndürür"""
+    results = run_models(boards, seed, repeat)
+    if gui:
+        results.update(run_gui(seed=seed))
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'boards': boards,
+            'seed': seed,
+            'repeat': repeat
+        },
+        'results': results
+    }
+
+
+def compare(current, baseline, threshold=0.2, metric='p50_us'):
+    """
+    Güncel sonuçları kayıtlı taban çizgisiyle karşılaştırır
+
+    Args:
+        current (dict): run() çıktısı
+        baseline (dict): Daha önce kaydedilmiş run() çıktısı
+        threshold (float, optional): Gerileme sayılacak göreli artış (0.2 = %20)
+        metric (str, optional): Karşılaştırılan özet alanı
+
+    Returns:
+        list: (anahtar, taban, güncel, oran, gerileme_mi) satırları
+    """
+    rows = []
+    for key, result in current['results'].items():
+        reference = baseline.get('results', {}).get(key)
+        if reference is None or reference.get(metric, 0) <= 0:
+            continue
+
+        ratio = result[metric] / reference[metric]
+        rows.append((key, reference[metric], result[metric], ratio, ratio > 1 + threshold))
+
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Model ve arayüz gecikme ölçümü")
+    parser.add_argument("--boards", type=int, default=200, help="Doluluk seviyesi başına matris sayısı")
+    parser.add_argument("--seed", type=int, default=7, help="Rastgele tohum")
+    parser.add_argument("--repeat", type=int, default=3, help="Her matris için tekrar sayısı")
+    parser.add_argument("--no-gui", action="store_true", help="Arayüz ölçümünü atla")
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", help="Karşılaştırılacak taban çizgisi JSON dosyası")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Gerileme eşiği (p50 göreli artışı, varsayılan 0.2)")
+    args = parser.parse_args()
+
+    current = run(args.boards, args.seed, args.repeat, gui=not args.no_gui)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(current, output, ensure_ascii=False, indent=2)
+
+    if not args.compare:
+        print(f"  {'Ölçüm':<36} {'p50':>10} {'p90':>10} {'p99':>10}")
+        for key, result in current['results'].items():
+            print(f"  {key:<36} {result['p50_us']:8.1f}µs {result['p90_us']:8.1f}µs "
+                  f"{result['p99_us']:8.1f}µs")
+        return
+
+    with open(args.compare, encoding="utf-8") as stream:
+        baseline = json.load(stream)
+
+    rows = compare(current, baseline, args.threshold)
+    regressions = [row for row in rows if row[4]]
+
+    print(f"  {'Ölçüm':<36} {'taban p50':>11} {'güncel p50':>11} {'oran':>7}")
+    for key, reference, value, ratio, regressed in rows:
+        flag = "  GERİLEME" if regressed else ""
+        print(f"  {key:<36} {reference:9.1f}µs {value:9.1f}µs {ratio:6.2f}x{flag}")
+
+    print(f"{len(regressions)} gerileme (eşik %{args.threshold * 100:.0f})")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Uzun W/L dizileri için çevrimdışı geriye dönük test (backtest)
+
+Kullanım (depo kök dizininden):
+    python -m core.backtest sonuclar.txt [--chunk-size 16384] [--json]
+    python -m core.backtest oturum1.txt oturum2.txt ... [--workers 8]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from core.engine import AnalysisEngine
+from core.outcome_file import OutcomeFile, is_outcome_file
+
+# Bir seferde okunan ve işlenen sonuç sayısı
+DEFAULT_CHUNK_SIZE = 16384
+
+# Bayt -> sonuç kodu: 1=W, 2=L, 0=yok sayılır (boşluk, ayraç), 255=geçersiz
+_OUTCOME_CODES = np.full(256, 255, dtype=np.uint8)
+for _char in b"Ww1":
+    _OUTCOME_CODES[_char] = 1
+for _char in b"Ll2":
+    _OUTCOME_CODES[_char] = 2
+for _char in b" \t\r\n,;":
+    _OUTCOME_CODES[_char] = 0
+
+
+def parse_outcomes(data, offset=0):
+    """
+    W/L metnini sonuç dizisine çevirir
+
+    Args:
+        data (bytes): 'W'/'L' (veya '1'/'2') karakterleri; boşluk, ',' ve ';' yok sayılır
+        offset (int, optional): Hata mesajları için verinin kaynaktaki başlangıç konumu
+
+    Returns:
+        numpy.ndarray: int8 sonuç dizisi (1=W, 2=L)
+    """
+    codes = _OUTCOME_CODES[np.frombuffer(data, dtype=np.uint8)]
+
+    invalid = np.flatnonzero(codes == 255)
+    if len(invalid) > 0:
+        position = int(invalid[0])
+        raise ValueError(f"Geçersiz sonuç karakteri {data[position:position + 1]!r} "
+                         f"(konum {offset + position})")
+
+    return codes[codes != 0].astype(np.int8)
+
+
+def iter_outcome_chunks(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Sonuç dosyasını parça parça okur; bellek kullanımı parça boyutuyla sınırlıdır
+
+    Paketli sonuç dosyaları (core.outcome_file) imzalarından tanınır ve memmap
+    üzerinden okunur; bu durumda parça boyutu sonuç sayısıdır.
+
+    Args:
+        source (str | os.PathLike | file): Dosya yolu veya açık (metin ya da ikili) dosya
+        chunk_size (int, optional): Bir seferde okunan bayt sayısı
+
+    Yields:
+        numpy.ndarray: int8 sonuç parçaları (1=W, 2=L)
+    """
+    if chunk_size <= 0:
+        raise ValueError("Parça boyutu pozitif olmalıdır")
+
+    if isinstance(source, (str, os.PathLike)):
+        if is_outcome_file(source):
+            for outcomes, _ in OutcomeFile(source).iter_chunks(chunk_size):
+                yield outcomes
+            return
+
+        with open(source, "rb") as stream:
+            yield from iter_outcome_chunks(stream, chunk_size)
+        return
+
+    offset = 0
+    while True:
+        data = source.read(chunk_size)
+        if not data:
+            break
+        if isinstance(data, str):
+            data = data.encode("ascii", errors="replace")
+
+        outcomes = parse_outcomes(data, offset)
+        offset += len(data)
+        if len(outcomes) > 0:
+            yield outcomes
+
+
+class Backtester:
+    """Sonuç dizisini arayüzle aynı doldurma/kaydırma kurallarıyla yeniden oynatır
+
+    Her parça AnalysisEngine.step_batch() ile oynatılır: temel modeller
+    analyze_batch ile tüm parça üzerinde bir kerede çalışır; Karma ve Hibrit,
+    model istatistiklerinin sırayla güncellenmesi gerektiğinden adım adım
+    hesaplanır. Her tahmin bir sonraki sonuçla puanlanır.
+    """
+
+    def __init__(self, cache_size=0):
+        """
+        Args:
+            cache_size (int, optional): Motorun tahmin önbelleği kapasitesi
+        """
+        self.engine = AnalysisEngine(cache_size=cache_size)
+        self.counters = {name: self._empty_counter() for name in self.engine.analysis_models}
+
+        # Model süreleri motorun gecikme ölçeriyle ölçülür (toplu çağrılar adım başına sayılır)
+        self.engine.set_latency_tracking(True)
+
+        self.outcomes = 0
+        self.elapsed = 0.0
+
+    def _empty_counter(self):
+        """Bir model için sıfırlanmış sayaçları döndürür"""
+        return {"opportunities": 0, "predictions": 0, "correct": 0, "calls": 0, "seconds": 0.0}
+
+    def run(self, source, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Kaynaktaki tüm sonuçları oynatır
+
+        Args:
+            source (str | os.PathLike | file): Sonuç dosyası
+            chunk_size (int, optional): Bir seferde okunan bayt sayısı
+
+        Returns:
+            dict: report() çıktısı
+        """
+        for outcomes in iter_outcome_chunks(source, chunk_size):
+            self.feed(outcomes)
+        return self.report()
+
+    def feed(self, outcomes):
+        """Bir sonuç parçasını oynatır; önceki parçaların durumu korunur"""
+        start = time.perf_counter()
+        outcomes = [int(value) for value in outcomes]
+
+        pending = self.engine.predictions
+        for value, (_, _, predictions, _) in zip(outcomes, self.engine.step_batch(outcomes)):
+            self._score(pending, value)
+            pending = predictions
+
+        for name, latency in self.engine.latency.models.items():
+            self.counters[name]["calls"] = latency.calls
+            self.counters[name]["seconds"] = latency.seconds
+
+        self.outcomes += len(outcomes)
+        self.elapsed += time.perf_counter() - start
+
+    def _score(self, predictions, actual):
+        """Bekleyen tahminleri gelen sonuçla sayaçlara işler"""
+        for name, prediction in predictions.items():
+            counter = self.counters[name]
+            counter["opportunities"] += 1
+            if prediction != 0:
+                counter["predictions"] += 1
+                if prediction == actual:
+                    counter["correct"] += 1
+
+    def report(self):
+        """
+        Model başına doğruluk, kapsama ve gecikme özetini döndürür
+
+        Returns:
+            dict: outcomes, elapsed_seconds, outcomes_per_second ve models
+                (model adı -> accuracy, coverage, mean_latency_us ve ham sayaçlar)
+        """
+        return build_report(self.counters, self.outcomes, self.elapsed)
+
+
+def build_report(counters, outcomes, elapsed):
+    """Model sayaçlarından doğruluk, kapsama ve gecikme özetini oluşturur"""
+    models = {}
+    for name, counter in counters.items():
+        models[name] = {
+            **counter,
+            "accuracy": counter["correct"] / counter["predictions"] if counter["predictions"] > 0 else 0,
+            "coverage": counter["predictions"] / counter["opportunities"] if counter["opportunities"] > 0 else 0,
+            "mean_latency_us": counter["seconds"] / counter["calls"] * 1e6 if counter["calls"] > 0 else 0
+        }
+
+    return {
+        "outcomes": outcomes,
+        "elapsed_seconds": elapsed,
+        "outcomes_per_second": outcomes / elapsed if elapsed > 0 else 0,
+        "models": models
+    }
+
+
+def load_session(source):
+    """Bir oturum dosyasını tamamen okuyup int8 sonuç dizisi olarak döndürür"""
+    chunks = list(iter_outcome_chunks(source))
+    return np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int8)
+
+
+def session_array(session):
+    """
+    Bir oturumu işçi süreçlere gönderilecek sıkışık int8 diziye çevirir
+
+    Args:
+        session (bytes | str | OutcomeFile | array-like): W/L metni, paketli sonuç
+            dosyası veya 1/2 değerlerinden oluşan dizi
+
+    Returns:
+        numpy.ndarray: int8 sonuç dizisi (1=W, 2=L)
+    """
+    if isinstance(session, str):
+        session = session.encode("ascii", errors="replace")
+    if isinstance(session, bytes):
+        return parse_outcomes(session)
+
+    array = np.asarray(session, dtype=np.int8).ravel()
+    if not np.isin(array, (1, 2)).all():
+        raise ValueError("Oturum yalnızca 1 (W) ve 2 (L) değerleri içermelidir")
+    return array
+
+
+def _run_shard(shard, chunk_size):
+    """Bir grup oturumu (işçi süreçte) baştan oynatıp oturum başına sayaçları döndürür"""
+    results = []
+    for index, outcomes in shard:
+        backtester = Backtester()
+        for start in range(0, len(outcomes), chunk_size):
+            backtester.feed(outcomes[start:start + chunk_size])
+        results.append((index, backtester.counters, backtester.outcomes))
+    return results
+
+
+def _make_shards(sessions, shard_count):
+    """Oturumları toplam uzunlukları dengeli olacak şekilde gruplara böler"""
+    shards = [[] for _ in range(min(shard_count, len(sessions)))]
+    loads = [0] * len(shards)
+
+    # En uzun oturumdan başlayarak her oturumu en az yüklü gruba ver
+    for index in sorted(range(len(sessions)), key=lambda i: -len(sessions[i])):
+        target = loads.index(min(loads))
+        shards[target].append((index, sessions[index]))
+        loads[target] += len(sessions[index])
+
+    return [shard for shard in shards if shard]
+
+
+def run_sessions(sessions, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, progress=None, cancel=None):
+    """
+    Birçok oturumu süreç havuzunda paralel olarak oynatır
+
+    Her oturum boş bir matristen başlar. Sayaçlar oturum sırasıyla birleştirilir,
+    bu yüzden sonuçlar işçi sayısından bağımsızdır (gecikme süreleri hariç).
+
+    Args:
+        sessions (list): Oturumlar (session_array() ile dönüştürülebilen değerler)
+        workers (int, optional): İşçi süreç sayısı; varsayılan CPU sayısı, 1 ise
+            oturumlar bu süreçte oynatılır
+        chunk_size (int, optional): Oturumların işlendiği parça boyutu (sonuç sayısı)
+        progress (callable, optional): progress(tamamlanan_oturum, toplam_oturum)
+        cancel (threading.Event, optional): Ayarlandığında bekleyen oturumlar iptal edilir
+
+    Returns:
+        dict: build_report() çıktısı ile sessions, completed_sessions, workers ve cancelled
+    """
+    start = time.perf_counter()
+    sessions = [session_array(session) for session in sessions]
+    workers = workers or os.cpu_count() or 1
+
+    # Küçük gruplar yükü dengeler ve iptalin çabuk etkili olmasını sağlar
+    shards = _make_shards(sessions, workers * 4)
+    results = [None] * len(sessions)
+    completed = 0
+    cancelled = False
+
+    def collect(shard_results):
+        nonlocal completed
+        for index, counters, outcomes in shard_results:
+            results[index] = (counters, outcomes)
+        completed += len(shard_results)
+        if progress is not None:
+            progress(completed, len(sessions))
+
+    if workers == 1:
+        for shard in shards:
+            if cancel is not None and cancel.is_set():
+                cancelled = True
+                break
+            collect(_run_shard(shard, chunk_size))
+    else:
+        # Süreç havuzu (multiprocessing) yalnızca gerektiğinde içe aktarılır
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            pending = {executor.submit(_run_shard, shard, chunk_size) for shard in shards}
+            while pending:
+                if cancel is not None and cancel.is_set():
+                    cancelled = True
+                    break
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future.result())
+        finally:
+            executor.shutdown(wait=not cancelled, cancel_futures=True)
+
+    # Oturum sırasıyla birleştir (belirlenimci toplam)
+    counters = {}
+    outcomes = 0
+    for result in results:
+        if result is None:
+            continue
+        session_counters, session_outcomes = result
+        outcomes += session_outcomes
+        for name, counter in session_counters.items():
+            merged = counters.setdefault(name, dict.fromkeys(counter, 0))
+            for key, value in counter.items():
+                merged[key] += value
+
+    report = build_report(counters, outcomes, time.perf_counter() - start)
+    report.update({
+        "sessions": len(sessions),
+        "completed_sessions": completed,
+        "workers": workers,
+        "cancelled": cancelled
+    })
+    return report
+
+
+def format_report(report):
+    """Rapor sözlüğünü okunabilir bir tablo metnine çevirir"""
+    lines = [f"{report['outcomes']} sonuç, {report['elapsed_seconds']:.1f} sn "
+             f"({report['outcomes_per_second']:.0f} sonuç/sn)",
+             f"  {'Model':<20} {'Doğruluk':>9} {'Kapsama':>9} {'Tahmin':>10} {'Gecikme':>12}"]
+    for name, stats in report["models"].items():
+        lines.append(f"  {name:<20} {stats['accuracy'] * 100:8.1f}% {stats['coverage'] * 100:8.1f}% "
+                     f"{stats['predictions']:>10} {stats['mean_latency_us']:9.1f} µs")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="W/L dizisi üzerinde tüm modellerin geriye dönük testi")
+    parser.add_argument("sources", nargs="+",
+                        help="Sonuç dosyası ('-' ise standart girdi); birden fazla dosya ayrı oturumlardır")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Bir seferde okunan bayt sayısı")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Oturumlar için işçi süreç sayısı (varsayılan CPU sayısı)")
+    parser.add_argument("--json", action="store_true", help="Raporu JSON olarak yaz")
+    args = parser.parse_args()
+
+    if len(args.sources) == 1:
+        source = sys.stdin.buffer if args.sources[0] == "-" else args.sources[0]
+        report = Backtester().run(source, args.chunk_size)
+    else:
+        def show_progress(completed, total):
+            print(f"\r{completed}/{total} oturum", end="", file=sys.stderr, flush=True)
+
+        sessions = [load_session(path) for path in args.sources]
+        report = run_sessions(sessions, args.workers, args.chunk_size, progress=show_progress)
+        print(file=sys.stderr)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print(format_report(report))
+
+
+if __name__ == "__main__":
+    main()
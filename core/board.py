@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Satır kaydırması sabit zamanlı olan halka tamponlu matris
+"""
+
+from collections import deque
+from collections.abc import Sequence
+
+import numpy as np
+
+# Pencere boyutu (satır ve sütun)
+SIZE = 5
+
+
+class HistoryView(Sequence):
+    """Matristeki hamlelerin pencere koordinatlarıyla salt okunur görünümü
+
+    Hamleler mutlak satırlarla saklanır; (row, col, value) üçlüleri yalnızca
+    okunduklarında pencerenin o anki ilk satırına göre çevrilir.
+    """
+
+    __slots__ = ('_board',)
+
+    def __init__(self, board):
+        self._board = board
+
+    def __len__(self):
+        return len(self._board.moves)
+
+    def __getitem__(self, index):
+        moves = self._board.moves
+        top = self._board.top
+        if isinstance(index, slice):
+            return [(row - top, col, value) for row, col, value in list(moves)[index]]
+        row, col, value = moves[index]
+        return (row - top, col, value)
+
+    def __iter__(self):
+        top = self._board.top
+        return ((row - top, col, value) for row, col, value in self._board.moves)
+
+    def __eq__(self, other):
+        if isinstance(other, (HistoryView, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class RingBoard:
+    """5x5 matris penceresi; satırlar halka tamponda, kaydırma bir ofset artışıdır
+
+    Her mutlak satır tamponda iki kez (r % 5 ve r % 5 + 5) tutulur; böylece
+    pencere her zaman tamponun ardışık beş satırıdır ve `view` kopyasız bir
+    5x5 görünümdür. Kaydırma yalnızca en eski satırı temizler ve `top`'u artırır;
+    geçmişteki satır indeksleri yeniden yazılmaz.
+    """
+
+    def __init__(self):
+        self._rows = np.zeros((2 * SIZE, SIZE), dtype=int)
+        self.top = 0  # Pencerenin ilk satırının mutlak sırası
+        self.filled = 0
+        self.moves = deque()  # Matristeki hamleler (mutlak satır, col, value), ekleme sırasıyla
+        self.history = HistoryView(self)
+        self._update_view()
+
+    def _update_view(self):
+        """Pencerenin salt okunur görünümünü yeniler (yalnızca `top` değiştiğinde)"""
+        start = self.top % SIZE
+        view = self._rows[start:start + SIZE]
+        view.flags.writeable = False
+        self.view = view
+
+    def _write(self, row, col, value):
+        """Pencere koordinatlarındaki hücreyi tamponun iki kopyasına da yazar"""
+        slot = (self.top + row) % SIZE
+        self._rows[slot, col] = value
+        self._rows[slot + SIZE, col] = value
+
+    def value(self, row, col):
+        """Pencere koordinatlarındaki hücrenin değerini döndürür"""
+        return int(self._rows[(self.top + row) % SIZE, col])
+
+    def place(self, row, col, value):
+        """Hücreye değer yazar ve hamleyi geçmişe ekler"""
+        if not self._rows[(self.top + row) % SIZE, col]:
+            self.filled += 1
+        self._write(row, col, value)
+        self.moves.append((self.top + row, col, value))
+
+    def pop(self):
+        """
+        Son hamleyi geri alır
+
+        Returns:
+            tuple: Silinen hamle (row, col, value), pencere koordinatlarıyla
+        """
+        row, col, value = self.moves.pop()
+        row -= self.top
+        self._write(row, col, 0)
+        self.filled -= 1
+        return row, col, value
+
+    def shift_up(self):
+        """En üst satırı siler; diğer satırlar bir yukarı, alt satır boş olur"""
+        slot = self.top % SIZE
+        removed = int(np.count_nonzero(self._rows[slot]))
+        self._rows[slot] = 0
+        self._rows[slot + SIZE] = 0
+
+        # Varsayılan doldurmada silinen satırın hamleleri geçmişin başındadır
+        popped = 0
+        while self.moves and self.moves[0][0] == self.top:
+            self.moves.popleft()
+            popped += 1
+        if popped < removed:
+            self.moves = deque(move for move in self.moves if move[0] != self.top)
+
+        self.filled -= removed
+        self.top += 1
+        self._update_view()
+
+    def reset(self, matrix=None, history=()):
+        """
+        Matrisi boşaltır veya verilen matris ve geçmişle doldurur
+
+        Args:
+            matrix (numpy.ndarray, optional): 5x5 matris, 0=boş, 1=W, 2=L
+            history (iterable, optional): Matristeki hamleler (row, col, value)
+        """
+        self._rows[:] = 0
+        self.top = 0
+        self.filled = 0
+        if matrix is not None:
+            self._rows[:SIZE] = matrix
+            self._rows[SIZE:] = matrix
+            self.filled = int(np.count_nonzero(matrix))
+        self.moves = deque((int(row), int(col), int(value)) for row, col, value in history)
+        self._update_view()
+
+    def first_empty(self):
+        """Satır sırasıyla ilk boş hücreyi döndürür (yoksa None)"""
+        if self.filled == SIZE * SIZE:
+            return None
+        cell = int(np.argmin(self.view.ravel() != 0))
+        return cell // SIZE, cell % SIZE
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Matris durumunun taban-3 tamsayı anahtarı
+"""
+
+# Her hücrenin basamak değeri: hücre (row, col) -> 3 ** (row * 5 + col)
+POWERS = tuple(3 ** i for i in range(25))
+
+# Bir satırlık kaydırma 5 basamaklık kaydırmaya karşılık gelir
+ROW_SPAN = 3 ** 5
+
+
+class BoardKey:
+    """5x5 {0,1,2} matrisini 3^25'ten küçük tek bir tamsayıda tutar
+
+    Anahtar hücre değiştikçe artımlı olarak güncellenir; tüm matrisin yeniden
+    taranmasına gerek kalmaz. İlk satır en düşük basamaklardadır, bu sayede
+    yukarı kaydırma tek bir tamsayı bölmesidir.
+    """
+
+    __slots__ = ('value',)
+
+    def __init__(self, value=0):
+        self.value = value
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """Matristen anahtarı baştan hesaplar"""
+        value = 0
+        for index, cell in enumerate(matrix.flat):
+            if cell:
+                value += int(cell) * POWERS[index]
+        return cls(value)
+
+    def set_cell(self, row, col, old_value, new_value):
+        """Bir hücrenin değeri değiştiğinde anahtarı günceller"""
+        self.value += (int(new_value) - int(old_value)) * POWERS[row * 5 + col]
+
+    def shift_up(self):
+        """En üst satırı atar, diğer satırları bir yukarı taşır"""
+        self.value //= ROW_SPAN
+
+    def cell(self, row, col):
+        """Anahtardan tek bir hücrenin değerini okur"""
+        return (self.value // POWERS[row * 5 + col]) % 3
+
+    def reset(self):
+        """Boş matrise döner"""
+        self.value = 0
+
+    def __int__(self):
+        return self.value
+
+    def __index__(self):
+        return self.value
+
+    def __eq__(self, other):
+        if isinstance(other, BoardKey):
+            return self.value == other.value
+        return self.value == other
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return f"BoardKey({self.value})"
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Sınırlı boyutlu (LRU) tahmin önbelleği
+"""
+
+from collections import OrderedDict
+
+# Varsayılan önbellek kapasitesi (kayıt sayısı)
+DEFAULT_CACHE_SIZE = 20000
+
+
+class PredictionCache:
+    """(model adı, matris anahtarı, son hamle) -> tahmin eşlemesini tutan LRU önbellek
+
+    Kapasite dolduğunda en uzun süredir kullanılmayan kayıt atılır. İsabet, ıska
+    ve atma sayaçları önbellek boyutunu ayarlamak için dışarı açılır.
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        if maxsize <= 0:
+            raise ValueError("Önbellek kapasitesi pozitif olmalıdır")
+
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        """Kaydı döndürür ve en son kullanılan olarak işaretler"""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Kaydı ekler, kapasite aşılırsa en eski kaydı atar"""
+        entries = self._entries
+        entries[key] = value
+        entries.move_to_end(key)
+
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Tüm kayıtları ve sayaçları sıfırlar"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def stats(self):
+        """Önbellek sayaçlarını sözlük olarak döndürür"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hit_rate': self.hits / lookups if lookups > 0 else 0
+        }
@@ -0,0 +1,767 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Arayüzden bağımsız analiz motoru
+"""
+
+import threading
+import time
+from collections import deque, namedtuple
+
+import numpy as np
+
+from core.board import RingBoard
+from core.board_key import BoardKey
+from core.cache import DEFAULT_CACHE_SIZE, PredictionCache
+from core.features import MatrixFeatures
+from core.latency import DEFAULT_LATENCY_WINDOW, LatencyTracker
+from core.model_stats import MIN_RATED_PREDICTIONS, ModelStats
+from core.ngram_index import NgramIndex
+from models.registry import COMBINED_MODEL, HIBRIT_MODEL, MARKOV_MODEL, ModelRegistry
+
+# Saklanan gerçek sonuç sayısı sınırı (uzun oturumlarda bellek sabit kalır)
+RESULT_HISTORY_LIMIT = 1000
+
+# Yeniden oynatmada ertelenen durumların kaç hamlede bir puanlanacağı (bellek sınırı)
+REPLAY_FLUSH_INTERVAL = 4096
+
+# Toplu Hibrit oylamasının kullanıldığı en kısa yığın; daha kısa yığınlarda toplu
+# yolun sabit maliyeti adım başına analizi geçer
+BATCH_VOTE_MIN_STEPS = 8
+
+# Analiz için gereken matris durumu (arka planda analizde motordan bağımsız kopya); Markov
+# modeli sonuç akışına bağlı olduğundan sonucu durum alınırken hesaplanır
+AnalysisSnapshot = namedtuple('AnalysisSnapshot', ['matrix', 'history', 'model_stats', 'key', 'markov'],
+                              defaults=(None,))
+
+# Sonuçlar sırayla eklendiğinde oluşacak matrisler (step_batch öncesi izdüşüm)
+BatchProjection = namedtuple('BatchProjection', ['boards', 'last_moves', 'shifts', 'ready'])
+
+
+class AnalysisEngine:
+    """Matris, geçmiş ve model istatistiklerini yöneten Qt bağımsız analiz motoru
+
+    Her adımda temel modellerin her biri yalnızca bir kez çalıştırılır; elde edilen
+    tahminler Karma ve Hibrit modellere hazır olarak verilir.
+    """
+
+    def __init__(self, cache_size=DEFAULT_CACHE_SIZE, latency_window=DEFAULT_LATENCY_WINDOW,
+                 models=None):
+        """
+        Args:
+            cache_size (int, optional): Tahmin önbelleği kapasitesi, 0 ise önbellek kapalı
+            latency_window (int, optional): Gecikme yüzdelikleri için saklanan son ölçüm sayısı
+            models (Mapping, optional): Paylaşılacak model nesneleri (ör. başka bir motorun
+                analysis_models kayıt defteri); modeller durumsuzdur, ancak aynı anda tek iş
+                parçacığından kullanılmalıdır
+        """
+        # Uygulama verisi
+        self.board = RingBoard()  # Matris penceresi ve hamleleri (0: Boş, 1: W, 2: L)
+        self.board_key = BoardKey()  # Matrisin artımlı taban-3 anahtarı
+        self.actual_results = deque(maxlen=RESULT_HISTORY_LIMIT)  # Tahmin sonrası gelen gerçek sonuçlar
+        self.outcome_index = NgramIndex()  # Tüm sonuç akışının artımlı n-gram indeksi
+
+        # Kullanılabilir analiz modelleri (her model ilk kullanımda içe aktarılır)
+        self.analysis_models = models if models is not None else ModelRegistry()
+
+        # Model istatistikleri (model başına satır tutan diziler)
+        self.model_stats = ModelStats(self.analysis_models.keys())
+
+        # Son analizin tahminleri (bir sonraki sonuçla puanlanır)
+        self.predictions = {}
+        self.hibrit_confidence = 0.5
+
+        # Analizi ertelenmiş durumlar: [durum, sonraki sonuç] (sonuç gelene kadar None)
+        self.deferred = []
+
+        # Modeller ve önbellek paylaşıldığından aynı anda tek analiz çalışır
+        self._analysis_lock = threading.RLock()
+
+        # (model adı, matris anahtarı, son hamle) ile tahmin önbelleği
+        self.cache = PredictionCache(cache_size) if cache_size > 0 else None
+
+        # Model başına analiz gecikmesi (varsayılan olarak kapalı)
+        self.latency = LatencyTracker(latency_window)
+
+    @property
+    def matrix_data(self):
+        """Mevcut 5x5 matris (kopyalanmayan salt okunur görünüm; 0: Boş, 1: W, 2: L)"""
+        return self.board.view
+
+    @property
+    def history(self):
+        """Matristeki hamleler (row, col, value), ekleme sırasıyla (salt okunur görünüm)"""
+        return self.board.history
+
+    def is_full(self):
+        """Matriste boş hücre kalmadıysa True döner"""
+        return self.board.filled == 25
+
+    def next_empty_cell(self):
+        """Satır sırasıyla ilk boş hücreyi döndürür (yoksa None)"""
+        return self.board.first_empty()
+
+    def shift_matrix_up(self):
+        """
+        Matrisi yukarı kaydırır, en üst satırı siler ve en alt satırı boşaltır
+
+        Satırlar kopyalanmaz ve geçmiş yeniden yazılmaz; yalnızca pencerenin
+        ofseti ilerler.
+        """
+        self.board.shift_up()
+        self.board_key.shift_up()
+
+    def add_selection(self, value):
+        """
+        W (1) veya L (2) değerini ilk boş hücreye ekler
+
+        Matris doluysa önce yukarı kaydırılır.
+
+        Returns:
+            tuple: Değerin eklendiği (row, col) konumu
+        """
+        if self.is_full():
+            self.shift_matrix_up()
+
+        row, col = self.next_empty_cell()
+        self.add_at_position(row, col, value)
+        return row, col
+
+    def add_at_position(self, row, col, value):
+        """Belirli pozisyona W veya L ekler ve bekleyen tahminleri puanlar"""
+        if self.history:
+            self.actual_results.append(value)
+
+        # Analizi ertelenen son durum bu sonuçla sonradan puanlanır
+        if self.deferred and self.deferred[-1][1] is None:
+            self.deferred[-1][1] = value
+
+        # Önceki adımın tahminlerini gelen gerçek sonuçla karşılaştır
+        self._score_predictions(value)
+
+        self.board_key.set_cell(row, col, self.board.value(row, col), value)
+        self.board.place(row, col, value)
+        self.outcome_index.append(value)
+
+    def _score_predictions(self, actual):
+        """Bekleyen tahminlerin başarısını model istatistiklerine işler"""
+        # Sadece sonuç varsa ve model tahmin yapabiliyorsa hesaplanır
+        if self.predictions:
+            self.model_stats.record_dict(self.predictions, actual)
+
+        # Tahminler tüketildi
+        self.predictions = {}
+
+    def undo(self):
+        """
+        Son eklenen değeri geri alır
+
+        Returns:
+            tuple: Silinen (row, col) konumu, geçmiş boşsa None
+        """
+        if not self.history:
+            return None
+
+        # Sonucu gelmiş ertelenen durumlar bağımsız kopyalar olduğundan sonraki puanlamaya
+        # kadar korunur; geri alınan durumun kendi tahmini artık puanlanmayacağından atılır
+        self.deferred = [entry for entry in self.deferred if entry[1] is not None]
+
+        row, col, value = self.board.pop()
+        self.board_key.set_cell(row, col, value, 0)
+        self.outcome_index.pop()
+
+        # Silinen hamle bir gerçek sonuç olarak kaydedildiyse onu da kaldır
+        if self.actual_results and len(self.actual_results) >= len(self.history):
+            self.actual_results.pop()
+
+        self.predictions = {}
+        return row, col
+
+    def clear(self):
+        """Matrisi, geçmişi ve model istatistiklerini sıfırlar"""
+        self.board.reset()
+        self.board_key.reset()
+        self.outcome_index.reset()
+        self.actual_results = deque(maxlen=RESULT_HISTORY_LIMIT)
+        # Yeni nesne: arka planda puanlanmakta olan eski durumlar eski istatistiklere yazılır
+        self.model_stats = ModelStats(self.analysis_models.keys())
+        self.predictions = {}
+        self.hibrit_confidence = 0.5
+        self.deferred = []
+
+    def analyze(self, base_predictions=None):
+        """
+        Mevcut matris için tüm modellerin tahminlerini hesaplar
+
+        Args:
+            base_predictions (dict, optional): Temel modellerin (ve isteğe bağlı Karma
+                modelin) bu adım için önceden hesaplanmış tahminleri (ör. analyze_batch
+                ile); verilen modeller çalıştırılmaz, Hibrit her zaman hesaplanır
+
+        Returns:
+            dict: Model adı -> tahmin (0=belirsiz, 1=W, 2=L); yetersiz veride boş sözlük
+        """
+        self.flush_deferred()
+        state = AnalysisSnapshot(self.matrix_data, self.history, self.model_stats,
+                                 self.board_key.value, self._markov_result())
+        predictions, confidence = self.analyze_snapshot(state, base_predictions)
+        return self.apply_predictions(predictions, confidence)
+
+    def snapshot(self, model_stats=True):
+        """
+        Arka planda analiz için mevcut durumun bağımsız bir kopyasını döndürür
+
+        Args:
+            model_stats (bool, optional): False ise istatistikler kopyalanmaz (None); çağıran
+                analizden önce kendi kopyasını koyar
+        """
+        return AnalysisSnapshot(self.matrix_data.copy(), list(self.history),
+                                self.model_stats.copy() if model_stats else None,
+                                self.board_key.value, self._markov_result())
+
+    def _markov_result(self):
+        """Markov modelinin mevcut sonuç akışındaki tahmini (model kayıtlı değilse None)"""
+        if MARKOV_MODEL not in self.analysis_models:
+            return None
+
+        start = time.perf_counter() if self.latency.enabled else 0.0
+        result = self.analysis_models[MARKOV_MODEL].predict(self.outcome_index)
+        if self.latency.enabled:
+            self.latency.record(MARKOV_MODEL, time.perf_counter() - start)
+        return result
+
+    def analyze_snapshot(self, state, base_predictions=None):
+        """
+        Verilen durum için tahminleri motoru değiştirmeden hesaplar
+
+        Başka bir iş parçacığından snapshot() kopyasıyla çağrılabilir; modeller ve
+        önbellek paylaşıldığından analizler bir kilitle sıraya konur.
+
+        Args:
+            state (AnalysisSnapshot): Matris, geçmiş, model istatistikleri ve matris anahtarı
+            base_predictions (dict, optional): Temel modellerin hazır tahminleri
+
+        Returns:
+            tuple: (model adı -> tahmin sözlüğü, Hibrit güveni); yetersiz veride ({}, 0.5)
+        """
+        # Eğer yeterli veri yoksa çalıştırma
+        if len(state.history) < 5:
+            return {}, 0.5
+
+        with self._analysis_lock:
+            return self._analyze_state(state, base_predictions)
+
+    def _analyze_state(self, state, base_predictions):
+        """analyze_snapshot() gövdesi; kilit altında çağrılır"""
+        # Matris özellikleri bu adım için bir kez çıkarılır ve tüm modellerle paylaşılır
+        features = MatrixFeatures(state.matrix, state.history)
+        timer = self.latency if self.latency.enabled else None
+
+        # Temel modeller - her biri tek kez çalışır (önbellekte yoksa)
+        predictions = {}
+        for model_name, model in self.analysis_models.items():
+            if model_name == MARKOV_MODEL:
+                if state.markov is not None:
+                    predictions[model_name] = state.markov['prediction']
+            elif model_name != COMBINED_MODEL and model_name != HIBRIT_MODEL:
+                if base_predictions is not None:
+                    predictions[model_name] = int(base_predictions[model_name])
+                else:
+                    predictions[model_name] = self._timed_analyze(
+                        timer, state, model_name, model, features)
+
+        # Topluluk modelleri hazır tahminleri kullanır
+        if base_predictions is not None and COMBINED_MODEL in base_predictions:
+            predictions[COMBINED_MODEL] = int(base_predictions[COMBINED_MODEL])
+        else:
+            combined_model = self.analysis_models[COMBINED_MODEL]
+            predictions[COMBINED_MODEL] = self._timed_analyze(
+                timer, state, COMBINED_MODEL, combined_model, features, predictions=predictions)
+
+        # Hibrit model istatistiklere ve geçmiş sırasına bağlı olduğundan önbelleğe alınmaz
+        hibrit_model = self.analysis_models[HIBRIT_MODEL]
+        start = time.perf_counter() if timer is not None else 0.0
+        hibrit_result = hibrit_model.analyze(
+            state.matrix, state.history, state.model_stats, predictions=predictions,
+            features=features)
+        if timer is not None:
+            timer.record(HIBRIT_MODEL, time.perf_counter() - start)
+        predictions[HIBRIT_MODEL] = hibrit_result.get('prediction', 0)
+
+        return predictions, hibrit_result.get('confidence', 0.6)  # Varsayılan güven 60%
+
+    def apply_predictions(self, predictions, confidence=0.5):
+        """Mevcut durumun tahminlerini bir sonraki sonuçla puanlanmak üzere motora işler"""
+        # Mevcut durum artık ertelenmiş sayılmaz
+        if self.deferred and self.deferred[-1][1] is None:
+            self.deferred.pop()
+
+        self.predictions = predictions
+        self.hibrit_confidence = confidence
+        return predictions
+
+    def defer(self):
+        """
+        Mevcut durumun analizini erteler
+
+        Durum kaydedilir; bir sonraki sonuç geldiğinde onunla birlikte saklanır ve
+        flush_deferred() çağrıldığında tahminleri hesaplanıp sırayla puanlanır.
+        Böylece hızlı girilen hamleler tek analizde birleştirilse de model
+        istatistikleri her hamle analiz edilmiş gibi aynı kalır.
+        """
+        # Yetersiz veride tahmin yoktur; mevcut durum zaten ertelendiyse tekrar eklenmez
+        if len(self.history) < 5 or (self.deferred and self.deferred[-1][1] is None):
+            return
+
+        self.deferred.append([AnalysisSnapshot(self.matrix_data.copy(), list(self.history),
+                                               None, self.board_key.value, self._markov_result()),
+                              None])
+
+    def flush_deferred(self):
+        """
+        Ertelenen ve ardından sonucu gelmiş durumları sırayla puanlar
+
+        Temel modeller ve Karma model tüm durumlar için analyze_batch ile bir kerede
+        çalışır; Hibrit, model istatistikleri her adımda güncellendiğinden sırayla
+        hesaplanır. Sonucu henüz gelmemiş (mevcut) durum bekletilir.
+
+        Returns:
+            int: Puanlanan durum sayısı
+        """
+        return self.score_deferred(self.take_deferred())
+
+    def take_deferred(self):
+        """
+        Sonucu gelmiş ertelenen durumları puanlamadan sıradan çıkarır
+
+        Puanlama score_deferred() ile başka bir iş parçacığında yapılabilir; sıradan
+        çıkarmak yalnızca liste işlemidir.
+
+        Returns:
+            list: Eski -> yeni sırasıyla [durum, sonraki sonuç] çiftleri
+        """
+        ready = [entry for entry in self.deferred if entry[1] is not None]
+        if ready:
+            self.deferred = [entry for entry in self.deferred if entry[1] is None]
+        return ready
+
+    def score_deferred(self, ready, model_stats=None):
+        """
+        take_deferred() ile alınan durumların tahminlerini hesaplayıp sırayla puanlar
+
+        Başka bir iş parçacığından çağrılabilir; analizlerle aynı kilidi kullanır.
+
+        Args:
+            ready (list): [durum, sonraki sonuç] çiftleri, eski -> yeni
+            model_stats (ModelStats, optional): Puanların işleneceği istatistikler; verilmezse
+                motorun güncel istatistikleri. Durumlar alındığında geçerli olan nesne
+                verilirse arada clear() çağrılsa bile puanlar yeni istatistiklere karışmaz
+
+        Returns:
+            int: Puanlanan durum sayısı
+        """
+        if not ready:
+            return 0
+
+        with self._analysis_lock:
+            self._score_deferred(ready, model_stats if model_stats is not None else self.model_stats)
+        return len(ready)
+
+    def _score_deferred(self, ready, model_stats):
+        """Sonucu gelmiş ertelenen durumların tahminlerini hesaplayıp sırayla puanlar"""
+        boards = np.stack([state.matrix for state, _ in ready])
+        last_moves = np.array([state.history[-1] for state, _ in ready])
+        base_predictions = self._batch_base_predictions(boards, last_moves)
+
+        # Motorun mevcut tahminlerine dokunulmaz; her durumun tahminleri doğrudan puanlanır
+        for index, (state, actual) in enumerate(ready):
+            predictions, _ = self.analyze_snapshot(
+                state._replace(model_stats=model_stats),
+                {model_name: values[index] for model_name, values in base_predictions.items()})
+            if predictions:
+                model_stats.record_dict(predictions, actual)
+
+    def _timed_analyze(self, timer, state, model_name, model, features, **kwargs):
+        """_cached_analyze() çağrısını, ölçüm açıksa (timer verilmişse) süresiyle birlikte kaydeder"""
+        if timer is None:
+            return self._cached_analyze(state, model_name, model, features, **kwargs)
+
+        start = time.perf_counter()
+        prediction = self._cached_analyze(state, model_name, model, features, **kwargs)
+        timer.record(model_name, time.perf_counter() - start)
+        return prediction
+
+    def _cached_analyze(self, state, model_name, model, features, **kwargs):
+        """Tahmini önbellekten döndürür, yoksa hesaplayıp önbelleğe ekler
+
+        Temel ve Karma modellerin çıktısı yalnızca matrise ve son hamleye bağlıdır
+        (geçmiş her zaman matristeki dolu hücrelerdir), bu yüzden anahtar olarak
+        yeterlidir.
+        """
+        if self.cache is None:
+            return model.analyze(state.matrix, state.history, features=features, **kwargs)
+
+        key = (model_name, state.key, features.last_move)
+        prediction = self.cache.get(key)
+        if prediction is None:
+            prediction = model.analyze(state.matrix, state.history, features=features, **kwargs)
+            self.cache.put(key, prediction)
+        return prediction
+
+    def cache_stats(self):
+        """Tahmin önbelleği sayaçlarını döndürür (önbellek kapalıysa boş sözlük)"""
+        return self.cache.stats() if self.cache is not None else {}
+
+    def set_latency_tracking(self, enabled):
+        """Model başına gecikme ölçümünü çalışma anında açar veya kapatır"""
+        self.latency.enabled = bool(enabled)
+
+    def latency_stats(self):
+        """
+        Model başına gecikme ölçümlerini döndürür
+
+        Önbellekten dönen tahminler de çağrı olarak sayılır; süre motorun o model
+        için harcadığı gerçek süredir.
+
+        Returns:
+            dict: Model adı -> calls, total_ms, mean_us, p50_us, p95_us
+        """
+        return self.latency.stats()
+
+    def replay(self, outcomes, cells=None):
+        """
+        Kayıtlı sonuçları arayüzdeki gibi sırayla ekler
+
+        Ara durumlar ertelenip toplu puanlandığından model istatistikleri her hamle
+        analiz edilmiş gibi oluşur. Son durumun tahmini için analyze() çağrılmalıdır.
+
+        Args:
+            outcomes (array-like): 1 (W) ve 2 (L) değerleri
+            cells (array-like, optional): Her hamlenin hücresi (row * 5 + col); verilmezse
+                ilk boş hücreye eklenir
+
+        Returns:
+            numpy.ndarray: Hamlelerin eklendiği hücreler (row * 5 + col)
+        """
+        placed = np.zeros(len(outcomes), dtype=np.int8)
+        for index, value in enumerate(outcomes):
+            value = int(value)
+            if cells is None:
+                row, col = self.add_selection(value)
+            else:
+                # Arayüz dolu matrise eklemeden önce kaydırır
+                if self.is_full():
+                    self.shift_matrix_up()
+                row, col = divmod(int(cells[index]), 5)
+                self.add_at_position(row, col, value)
+            placed[index] = row * 5 + col
+            self.defer()
+
+            if len(self.deferred) >= REPLAY_FLUSH_INTERVAL:
+                self.flush_deferred()
+
+        self.flush_deferred()
+        return placed
+
+    def step(self, value):
+        """Bir sonucu ekler ve yeni tahminleri döndürür (betikler için kısayol)"""
+        self.add_selection(value)
+        return self.analyze()
+
+    def step_batch(self, outcomes):
+        """
+        Sonuçları sırayla ekler ve her adımın tahminlerini döndürür
+
+        Her sonuç için step() ile aynı sonucu verir; temel modeller ve Karma model
+        tüm adımların matrisleri için analyze_batch ile bir kerede çalışır. Hibrit de
+        adım başına istatistiklerle toplu çalışır (bkz. apply_projection()); Markov
+        sonuç akışına bağlı olduğundan sırayla hesaplanır.
+
+        Args:
+            outcomes (array-like): 1 (W) ve 2 (L) değerleri
+
+        Returns:
+            list: Her sonuç için (row, col, tahminler, Hibrit güveni)
+        """
+        projection = self.project(outcomes)
+        base_predictions = self._batch_base_predictions(
+            projection.boards, projection.last_moves, projection.ready)
+        return self.apply_projection(projection, base_predictions)
+
+    def apply_projection(self, projection, base_predictions):
+        """
+        project() ile çıkarılan adımları motora uygular
+
+        Her adım step() ile aynı sonucu verir. Hibrit'in oyladığı modellerin
+        istatistikleri yalnızca önceden bilinen tahminlere ve sonuçlara bağlıdır;
+        bu yüzden adım başına istatistikler birikimli toplamlarla çıkarılır, Hibrit
+        tüm adımlar için analyze_batch ile bir kez çalışır ve tahminler sonunda
+        record_many() ile puanlanır. Sırayla yapılanlar yalnızca matrise ekleme,
+        Markov tahmini ve Hibrit'in durum tipidir.
+
+        Args:
+            projection (BatchProjection): Motorun mevcut durumundan çıkarılan izdüşüm
+            base_predictions (dict): Model adı -> adım başına hazır tahminler (temel
+                modeller ve Karma)
+
+        Returns:
+            list: Her adım için (row, col, tahminler, Hibrit güveni)
+        """
+        last_moves = projection.last_moves.tolist()
+        results = []
+        first = 0
+
+        # Ertelenmiş durumlar ilk adımın analizinde bekleyen tahminlerden sonra
+        # puanlanır; bu sırayı korumak için ilk adım tek başına işlenir. Kısa
+        # yığınlar tümüyle adım adım işlenir
+        if len(last_moves) < BATCH_VOTE_MIN_STEPS:
+            first = len(last_moves)
+        elif self.deferred:
+            first = 1
+        for index in range(first):
+            row, col, value = last_moves[index]
+            if projection.shifts[index]:
+                self.shift_matrix_up()
+            self.add_at_position(row, col, value)
+            if projection.ready[index]:
+                predictions = self.analyze(base_predictions={
+                    model_name: values[index] for model_name, values in base_predictions.items()})
+            else:
+                predictions = self.analyze()
+            results.append((row, col, predictions, self.hibrit_confidence))
+
+        if first == len(last_moves):
+            return results
+
+        hibrit_model = self.analysis_models[HIBRIT_MODEL]
+        names = self.model_stats.names
+
+        # Bekleyen tahminler ilk sonuçla puanlanır; eklemeler sırasında puanlama yapılmaz
+        pending = self.predictions
+        self.predictions = {}
+
+        pattern_states = []
+        markov = []
+        for index in range(first, len(last_moves)):
+            row, col, value = last_moves[index]
+            if projection.shifts[index]:
+                self.shift_matrix_up()
+            self.add_at_position(row, col, value)
+            if projection.ready[index]:
+                pattern_states.append(hibrit_model._detect_pattern_state(self.history, self.matrix_data))
+                markov.append(self._markov_result())
+
+        outcomes = projection.last_moves[first:, 2]
+        steps = np.flatnonzero(projection.ready[first:])
+        count = len(outcomes)
+
+        # Adım başına tahmin sütunları, analyze() ile aynı sırada (Karma ve Hibrit sonda)
+        order = [model_name for model_name in self.analysis_models
+                 if model_name != COMBINED_MODEL and model_name != HIBRIT_MODEL
+                 and (model_name != MARKOV_MODEL or (markov and markov[0] is not None))]
+        columns = {}
+        for model_name in order + [COMBINED_MODEL]:
+            if model_name == MARKOV_MODEL:
+                columns[model_name] = np.array([result['prediction'] for result in markov], dtype=np.int8)
+            else:
+                columns[model_name] = np.asarray(base_predictions[model_name][first:],
+                                                 dtype=np.int8).reshape(-1)[steps]
+        order.append(COMBINED_MODEL)
+
+        # Temel modellerin her adımdaki istatistikleri: adım i'de, bekleyen tahminler ve
+        # i-1. adıma kadarki tahminler kendi sonuçlarıyla puanlanmış olur
+        voting = [model_name for model_name in names
+                  if model_name in base_predictions and model_name != COMBINED_MODEL]
+        rows = [self.model_stats.index[model_name] for model_name in voting]
+        previous = np.zeros((count, len(voting)), dtype=np.int8)
+        previous[0] = [pending.get(model_name, 0) for model_name in voting]
+        ready_steps = steps[steps < count - 1]
+        for column, model_name in enumerate(voting):
+            previous[ready_steps + 1, column] = columns[model_name][:len(ready_steps)]
+        made = previous != 0
+        hits = made & (previous == outcomes.reshape(-1, 1))
+        made_count = np.cumsum(made, axis=0)
+        total = self.model_stats.total[rows] + made_count
+        correct = self.model_stats.correct[rows] + np.cumsum(hits, axis=0)
+        success_rate = np.where(
+            made_count > 0,
+            np.where(total >= MIN_RATED_PREDICTIONS,
+                     (correct / np.maximum(total, 1) * 100).astype(np.int64), 50),
+            self.model_stats.success_rate[rows])
+
+        timer = self.latency if self.latency.enabled else None
+        start = time.perf_counter() if timer is not None else 0.0
+        with self._analysis_lock:
+            hibrit_predictions, confidence = hibrit_model.analyze_batch(
+                projection.boards[first:][steps], projection.last_moves[first:][steps],
+                model_stats={model_name: (success_rate[steps, column], total[steps, column])
+                             for column, model_name in enumerate(voting)},
+                predictions={model_name: columns[model_name] for model_name in voting},
+                pattern_states=pattern_states)
+        if timer is not None and len(steps):
+            timer.record(HIBRIT_MODEL, time.perf_counter() - start, len(steps))
+        columns[HIBRIT_MODEL] = hibrit_predictions
+        order.append(HIBRIT_MODEL)
+
+        table = np.column_stack([columns[model_name] for model_name in order]).reshape(len(steps), len(order))
+        step_predictions = [dict(zip(order, row)) for row in table.tolist()]
+        step_confidence = confidence.tolist()
+
+        # Tüm modellerin tahminleri bir sonraki sonuçla toplu puanlanır
+        recorded = np.zeros((count, len(names)), dtype=np.int8)
+        recorded[0] = [pending.get(model_name, 0) for model_name in names]
+        stat_columns = [self.model_stats.index[model_name] for model_name in order]
+        recorded[np.ix_(ready_steps + 1, stat_columns)] = table[:len(ready_steps)]
+        self.model_stats.record_many(recorded, outcomes)
+
+        predictions = iter(step_predictions)
+        confidences = iter(step_confidence)
+        for index, ready in enumerate(projection.ready[first:].tolist(), first):
+            row, col, _ = last_moves[index]
+            if ready:
+                results.append((row, col, next(predictions), next(confidences)))
+            else:
+                results.append((row, col, {}, 0.5))
+
+        # Son adımın tahminleri bir sonraki sonuçla puanlanmak üzere bekler
+        self.predictions = results[-1][2]
+        self.hibrit_confidence = results[-1][3]
+        return results
+
+    def project(self, outcomes):
+        """
+        Sonuçlar sırayla eklendiğinde her adımdan sonraki matrisi ve son hamleyi çıkarır
+
+        Motor değişmez; doldurma ve kaydırma add_selection() ile aynıdır. Geçmiş her
+        zaman matristeki dolu hücreler olduğundan analiz edilebilirlik dolu hücre
+        sayısından anlaşılır.
+
+        Args:
+            outcomes (array-like): 1 (W) ve 2 (L) değerleri
+
+        Returns:
+            BatchProjection: Nx5x5 matrisler, Nx3 son hamleler, eklemeden önce
+                kaydırılan adımlar ve analiz edilebilir adımlar
+        """
+        outcomes = [int(value) for value in outcomes]
+        count = len(outcomes)
+        boards = np.zeros((count, 5, 5), dtype=np.int8)
+        last_moves = np.zeros((count, 3), dtype=np.int64)
+        shifts = np.zeros(count, dtype=bool)
+        ready = np.zeros(count, dtype=bool)
+
+        board = self.matrix_data.astype(np.int8).ravel()
+        filled = int(np.count_nonzero(board))
+        for index, value in enumerate(outcomes):
+            if filled == 25:
+                board[:20] = board[5:]
+                board[20:] = 0
+                filled = int(np.count_nonzero(board))
+                shifts[index] = True
+
+            cell = int(np.flatnonzero(board == 0)[0])
+            board[cell] = value
+            filled += 1
+
+            boards[index] = board.reshape(5, 5)
+            last_moves[index] = (cell // 5, cell % 5, value)
+            ready[index] = filled >= 5
+
+        return BatchProjection(boards, last_moves, shifts, ready)
+
+    def _batch_base_predictions(self, boards, last_moves, ready=None):
+        """
+        Temel modelleri ve Karma modeli verilen matrislerde analyze_batch ile bir kerede çalıştırır
+
+        Args:
+            boards (numpy.ndarray): Nx5x5 matrisler
+            last_moves (numpy.ndarray): Nx3 son hamleler
+            ready (numpy.ndarray, optional): Analiz edilecek adımlar (verilmezse hepsi)
+
+        Returns:
+            dict: Model adı -> N uzunluğunda tahmin listesi (analiz edilmeyen adımlarda 0;
+                Hibrit ve Markov hariç)
+        """
+        count = len(boards)
+        steps = np.flatnonzero(ready) if ready is not None else np.arange(count)
+        timer = self.latency if self.latency.enabled else None
+        boards = boards[steps]
+        last_moves = last_moves[steps]
+        batch = {}
+
+        for model_name, model in self.analysis_models.items():
+            if model_name == HIBRIT_MODEL or model_name == MARKOV_MODEL or len(steps) == 0:
+                continue
+
+            start = time.perf_counter() if timer is not None else 0.0
+            if model_name == COMBINED_MODEL:
+                batch[model_name] = model.analyze_batch(boards, last_moves, predictions=batch)
+            else:
+                batch[model_name] = model.analyze_batch(boards, last_moves)
+            if timer is not None:
+                timer.record(model_name, time.perf_counter() - start, len(steps))
+
+        predictions = {}
+        for model_name in self.analysis_models:
+            if model_name != HIBRIT_MODEL and model_name != MARKOV_MODEL:
+                values = np.zeros(count, dtype=np.int8)
+                if model_name in batch:
+                    values[steps] = batch[model_name]
+                predictions[model_name] = values.tolist()
+
+        return predictions
+
+    def confidence_for(self, model_name):
+        """Seçili modelin son tahmini için güven seviyesini döndürür (0-1)"""
+        if self.predictions.get(model_name, 0) == 0:
+            return 0.5  # Belirsiz durumlarda orta değer
+
+        if model_name == HIBRIT_MODEL:
+            # Hibrit için özel güven seviyesi hesaplaması
+            return self.hibrit_confidence
+
+        if model_name == MARKOV_MODEL:
+            # Markov kendi olasılığını verir; tahmin her zaman mevcut sonuç akışınındır
+            return self.analysis_models[MARKOV_MODEL].predict(self.outcome_index)['confidence']
+
+        # Yeterli veri yoksa orta güven seviyesi
+        stats = self.model_stats[model_name]
+        if stats["total"] < 5:
+            return 0.5
+        return stats["success_rate"] / 100.0
+
+
+def step_engines(requests):
+    """
+    Birden çok motoru sonuçlarıyla ilerletir; tüm motorların matrisleri tek seferde analiz edilir
+
+    Her motor için step_batch() ile aynı sonucu verir. Matrisler birleştirilip temel
+    modeller ve Karma model için analyze_batch bir kez çağrılır (ilk motorun
+    modelleriyle); Hibrit her motorda kendi istatistikleriyle sırayla hesaplanır.
+
+    Args:
+        requests (list): (motor, sonuçlar) çiftleri; bir motor en fazla bir kez yer alabilir
+
+    Returns:
+        list: Her çift için step_batch() sonucu
+    """
+    if not requests:
+        return []
+
+    projections = [engine.project(outcomes) for engine, outcomes in requests]
+    boards = np.concatenate([projection.boards for projection in projections])
+    last_moves = np.concatenate([projection.last_moves for projection in projections])
+    ready = np.concatenate([projection.ready for projection in projections])
+    base_predictions = requests[0][0]._batch_base_predictions(boards, last_moves, ready)
+
+    results = []
+    start = 0
+    for (engine, _), projection in zip(requests, projections):
+        end = start + len(projection.ready)
+        results.append(engine.apply_projection(projection, {
+            model_name: values[start:end] for model_name, values in base_predictions.items()}))
+        start = end
+
+    return results
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Adım başına paylaşılan matris özellikleri
+"""
+
+import functools
+
+import numpy as np
+
+# Sınır ve iç kısım maskeleri (5x5 matris için sabit)
+BORDER_MASK = np.zeros((5, 5), dtype=bool)
+BORDER_MASK[0, :] = True  # Üst kenar
+BORDER_MASK[4, :] = True  # Alt kenar
+BORDER_MASK[:, 0] = True  # Sol kenar
+BORDER_MASK[:, 4] = True  # Sağ kenar
+BORDER_MASK.setflags(write=False)
+
+INNER_MASK = ~BORDER_MASK
+INNER_MASK.setflags(write=False)
+
+
+def _build_spiral_cells():
+    """Dıştan içe spiral sırasındaki düz hücre indeksleri (25)"""
+    cells = []
+
+    n = 5  # 5x5 matris
+    row_start, col_start = 0, 0
+    row_end, col_end = n-1, n-1
+
+    while row_start <= row_end and col_start <= col_end:
+        # Üst satır
+        for i in range(col_start, col_end + 1):
+            cells.append(row_start * n + i)
+        row_start += 1
+
+        # Sağ sütun
+        for i in range(row_start, row_end + 1):
+            cells.append(i * n + col_end)
+        col_end -= 1
+
+        # Alt satır
+        if row_start <= row_end:
+            for i in range(col_end, col_start - 1, -1):
+                cells.append(row_end * n + i)
+            row_end -= 1
+
+        # Sol sütun
+        if col_start <= col_end:
+            for i in range(row_end, row_start - 1, -1):
+                cells.append(i * n + col_start)
+            col_start += 1
+
+    return np.array(cells)
+
+
+def _build_diagonal_cells():
+    """
+    Çaprazların düz hücre indeksleri (np.diag sırasıyla) ve tek dizide birleşik hali
+
+    Önce ana köşegen ve paralelleri (sol üst - sağ alt), sonra ters köşegen ve
+    paralelleri (sağ üst - sol alt); her grupta ofset -4..4.
+
+    Returns:
+        tuple: (18 indeks dizisi, birleşik indeksler, her çaprazın (başlangıç, bitiş) aralığı)
+    """
+    main = [[(i - min(k, 0)) * 5 + i + max(k, 0) for i in range(5 - abs(k))] for k in range(-4, 5)]
+    anti = [[(i - min(k, 0)) * 5 + 4 - (i + max(k, 0)) for i in range(5 - abs(k))] for k in range(-4, 5)]
+
+    bounds = []
+    start = 0
+    for cells in main + anti:
+        bounds.append((start, start + len(cells)))
+        start += len(cells)
+
+    return (tuple(np.array(cells) for cells in main + anti),
+            np.concatenate(main + anti), tuple(bounds))
+
+
+# Sabit gezinme sıraları: düzleştirilmiş matriste (row * 5 + col) tek seferde okunur
+SPIRAL_CELLS = _build_spiral_cells()
+SPIRAL_CELLS.setflags(write=False)
+DIAGONAL_CELLS, DIAGONAL_INDEX, DIAGONAL_BOUNDS = _build_diagonal_cells()
+DIAGONAL_INDEX.setflags(write=False)
+
+# Hücrelerin (row * 5 + col) 25 bitlik maskelerdeki bit değerleri
+CELL_BITS = 1 << np.arange(25, dtype=np.int64)
+CELL_BITS.setflags(write=False)
+
+try:
+    popcount = int.bit_count  # Python 3.10+
+except AttributeError:
+    def popcount(value):
+        """Tamsayıdaki 1 bitlerinin sayısı"""
+        return bin(value).count("1")
+
+
+def membership_bits(membership):
+    """Kx25 üyelik matrisinin satırlarını 25 bitlik hücre maskelerine çevirir"""
+    return tuple(int(bits) for bits in (np.asarray(membership) != 0) @ CELL_BITS)
+
+
+@functools.lru_cache(maxsize=None)
+def _window_corners(rows, cols, radius):
+    """
+    Pencerelerin özet alan tablosundaki köşe indeksleri (düz) ve matris içindeki hücre sayıları
+
+    Returns:
+        tuple: (4xRxC indeksler: alt-sağ, üst-sağ, alt-sol, üst-sol; RxC hücre sayıları)
+    """
+    top = np.clip(np.arange(rows) - radius, 0, rows)[:, None]
+    bottom = np.clip(np.arange(rows) + radius + 1, 0, rows)[:, None]
+    left = np.clip(np.arange(cols) - radius, 0, cols)
+    right = np.clip(np.arange(cols) + radius + 1, 0, cols)
+
+    width = cols + 1
+    corners = np.stack([bottom * width + right, top * width + right,
+                        bottom * width + left, top * width + left])
+    sizes = (bottom - top) * (right - left)
+    corners.setflags(write=False)
+    sizes.setflags(write=False)
+    return corners, sizes
+
+
+def window_sums(values, radius=1):
+    """
+    Her hücrenin çevresindeki (2r+1)x(2r+1) pencerenin matris içinde kalan kısmının toplamı
+
+    Toplamlar özet alan tablosundan (summed-area table) tek geçişte bulunur; matris
+    boyutu sabit değildir. Son iki eksen matristir, önceki eksenler (ör. W ve L
+    maskeleri veya bir matris yığını) ayrı ayrı işlenir.
+
+    Args:
+        values (numpy.ndarray): ...xRxC sayısal veya mantıksal dizi
+        radius (int, optional): Pencere yarıçapı
+
+    Returns:
+        tuple: (...xRxC pencere toplamları, RxC pencerelerin matris içindeki hücre sayıları)
+    """
+    values = np.asarray(values)
+    rows, cols = values.shape[-2:]
+    corners, sizes = _window_corners(rows, cols, radius)
+
+    table = np.zeros(values.shape[:-2] + (rows + 1, cols + 1), dtype=np.int64)
+    np.cumsum(values, axis=-2, out=table[..., 1:, 1:])
+    np.cumsum(table[..., 1:, 1:], axis=-1, out=table[..., 1:, 1:])
+
+    # Her pencere tablonun dört köşesinden: alt-sağ - üst-sağ - alt-sol + üst-sol
+    gathered = table.reshape(values.shape[:-2] + (-1,))[..., corners]
+    sums = gathered[..., 0, :, :] - gathered[..., 1, :, :] - gathered[..., 2, :, :] + gathered[..., 3, :, :]
+    return sums, sizes
+
+
+# 5x5 matriste 3x3 pencerelerin hücre sayıları (içte 9, kenarda 6, köşede 4)
+WINDOW_SIZES = window_sums(np.zeros((5, 5), dtype=np.int64))[1]
+
+
+def _readonly(array):
+    """Diziyi salt okunur yapıp döndürür"""
+    array.setflags(write=False)
+    return array
+
+
+def _memoized(method):
+    """Özelliği ilk erişimde hesaplayıp önbellekte tutan property"""
+    name = method.__name__
+
+    def getter(self):
+        cache = self._cache
+        if name not in cache:
+            cache[name] = method(self)
+        return cache[name]
+
+    getter.__doc__ = method.__doc__
+    return property(getter)
+
+
+class MatrixFeatures:
+    """Bir hamle için matristen bir kez çıkarılan, değiştirilemez özellikler
+
+    Tüm modeller aynı adımda aynı nesneyi paylaşır; her özellik ilk kullanıldığında
+    hesaplanır ve o adım boyunca yeniden hesaplanmaz.
+    """
+
+    __slots__ = ('matrix', 'last_move', '_cache')
+
+    def __init__(self, matrix, history=None):
+        """
+        Args:
+            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+        """
+        object.__setattr__(self, 'matrix', _readonly(np.array(matrix)))
+        object.__setattr__(self, 'last_move', tuple(history[-1]) if history else None)
+        object.__setattr__(self, '_cache', {})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("MatrixFeatures değiştirilemez")
+
+    @_memoized
+    def w_mask(self):
+        """W hücrelerinin maskesi"""
+        return _readonly(self.matrix == 1)
+
+    @_memoized
+    def l_mask(self):
+        """L hücrelerinin maskesi"""
+        return _readonly(self.matrix == 2)
+
+    @_memoized
+    def w_bits(self):
+        """W hücrelerinin 25 bitlik maskesi (bit row * 5 + col)"""
+        return int(self.w_mask.ravel() @ CELL_BITS)
+
+    @_memoized
+    def l_bits(self):
+        """L hücrelerinin 25 bitlik maskesi (bit row * 5 + col)"""
+        return int(self.l_mask.ravel() @ CELL_BITS)
+
+    @_memoized
+    def cells(self):
+        """Hücre değerleri satır sırasıyla (row * 5 + col), Python tamsayıları olarak"""
+        return tuple(self.matrix.ravel().tolist())
+
+    @_memoized
+    def window_counts(self):
+        """Her hücrenin 3x3 penceresindeki (matris içinde kalan) W ve L sayıları, (2, 5, 5)"""
+        return _readonly(window_sums(np.stack([self.w_mask, self.l_mask]))[0])
+
+    @_memoized
+    def densities(self):
+        """W ve L yoğunluk haritaları: 3x3 pencere sayıları / penceredeki hücre sayısı, (2, 5, 5)"""
+        return _readonly(self.window_counts / WINDOW_SIZES)
+
+    @_memoized
+    def non_empty(self):
+        """Dolu hücrelerin maskesi"""
+        return _readonly(self.matrix > 0)
+
+    @_memoized
+    def w_count(self):
+        """Matristeki W sayısı"""
+        return int(np.count_nonzero(self.w_mask))
+
+    @_memoized
+    def l_count(self):
+        """Matristeki L sayısı"""
+        return int(np.count_nonzero(self.l_mask))
+
+    @property
+    def total(self):
+        """Matristeki dolu hücre sayısı"""
+        return self.w_count + self.l_count
+
+    @_memoized
+    def diagonal_values(self):
+        """Tüm çaprazların hücre değerleri tek dizide (DIAGONAL_INDEX sırasıyla)"""
+        return _readonly(self.matrix.ravel()[DIAGONAL_INDEX])
+
+    @_memoized
+    def diagonals(self):
+        """Ana köşegen ve paralelleri (sol üst - sağ alt), ofset -4..4 sırasıyla"""
+        values = self.diagonal_values
+        return tuple(values[start:end] for start, end in DIAGONAL_BOUNDS[:9])
+
+    @_memoized
+    def anti_diagonals(self):
+        """Ters köşegen ve paralelleri (sağ üst - sol alt), ofset -4..4 sırasıyla"""
+        values = self.diagonal_values
+        return tuple(values[start:end] for start, end in DIAGONAL_BOUNDS[9:])
+
+    @_memoized
+    def spiral(self):
+        """Dıştan içe spiral sırasındaki hücre değerleri (boşlar dahil)"""
+        return _readonly(self.matrix.ravel()[SPIRAL_CELLS])
+
+    @_memoized
+    def border_counts(self):
+        """Sınır ve iç kısımdaki W/L sayıları: (border_w, border_l, inner_w, inner_l)"""
+        return (int(np.count_nonzero(self.w_mask & BORDER_MASK)),
+                int(np.count_nonzero(self.l_mask & BORDER_MASK)),
+                int(np.count_nonzero(self.w_mask & INNER_MASK)),
+                int(np.count_nonzero(self.l_mask & INNER_MASK)))
+
+
+def ensure_features(matrix, history=None, features=None):
+    """Verilen özellik nesnesini döndürür, yoksa matristen yeni bir tane oluşturur"""
+    if features is not None:
+        return features
+    return MatrixFeatures(matrix, history)
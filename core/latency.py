@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Model başına analiz gecikmesi ölçümü
+"""
+
+import numpy as np
+
+# Yüzdelikler için saklanan son ölçüm sayısı
+DEFAULT_LATENCY_WINDOW = 256
+
+
+class ModelLatency:
+    """Tek bir modelin çağrı sayısı, toplam süresi ve son ölçümleri
+
+    Son `window` ölçüm sabit boyutlu bir halka tamponda tutulur; yüzdelikler
+    yalnızca istendiğinde bu tampon üzerinden hesaplanır.
+    """
+
+    __slots__ = ('calls', 'seconds', '_samples', '_recorded')
+
+    def __init__(self, window=DEFAULT_LATENCY_WINDOW):
+        self.calls = 0
+        self.seconds = 0.0
+        self._samples = np.zeros(window)
+        self._recorded = 0  # Halka tampona yazılan ölçüm sayısı
+
+    def record(self, seconds, calls=1):
+        """Bir çağrının (toplu çağrıda `calls` adımın) süresini saniye cinsinden ekler
+
+        Toplu çağrılarda yüzdeliklere adım başına ortalama süre tek ölçüm olarak girer.
+        """
+        self._samples[self._recorded % len(self._samples)] = seconds / calls
+        self._recorded += 1
+        self.calls += calls
+        self.seconds += seconds
+
+    def percentile(self, q):
+        """Son ölçümlerin q. yüzdeliğini saniye cinsinden döndürür"""
+        count = min(self._recorded, len(self._samples))
+        if count == 0:
+            return 0.0
+        return float(np.percentile(self._samples[:count], q))
+
+    def as_dict(self):
+        """Ölçümleri mikro saniye cinsinden sözlük olarak döndürür"""
+        return {
+            'calls': self.calls,
+            'total_ms': self.seconds * 1e3,
+            'mean_us': self.seconds / self.calls * 1e6 if self.calls > 0 else 0.0,
+            'p50_us': self.percentile(50) * 1e6,
+            'p95_us': self.percentile(95) * 1e6
+        }
+
+
+class LatencyTracker:
+    """Model adı -> ModelLatency eşlemesini tutan, çalışma anında açılıp kapanan ölçer
+
+    Kapalıyken motor süre ölçmez; açık/kapalı kontrolü adım başına bir kez yapılır.
+    """
+
+    def __init__(self, window=DEFAULT_LATENCY_WINDOW, enabled=False):
+        """
+        Args:
+            window (int, optional): Yüzdelikler için saklanan son ölçüm sayısı
+            enabled (bool, optional): Ölçüm başlangıçta açık mı
+        """
+        if window <= 0:
+            raise ValueError("Ölçüm penceresi pozitif olmalıdır")
+
+        self.window = window
+        self.enabled = enabled
+        self.models = {}
+
+    def record(self, model_name, seconds, calls=1):
+        """Modelin bir çağrısının (toplu çağrıda `calls` adımın) süresini ekler"""
+        latency = self.models.get(model_name)
+        if latency is None:
+            latency = self.models[model_name] = ModelLatency(self.window)
+        latency.record(seconds, calls)
+
+    def reset(self):
+        """Tüm ölçümleri siler (açık/kapalı durumu korunur)"""
+        self.models = {}
+
+    def stats(self):
+        """Model adı -> ölçüm sözlüğü döndürür"""
+        return {model_name: latency.as_dict() for model_name, latency in self.models.items()}
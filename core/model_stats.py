@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Dizi tabanlı artımlı model istatistikleri
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+
+# Yakın dönem başarısı için saklanan son tahmin sayısı
+RECENT_WINDOW = 20
+
+# Azalan başarı oranının her tahminde eski değere verdiği ağırlık
+DEFAULT_DECAY = 0.95
+
+# Başarı oranının gösterilmesi için gereken en az tahmin sayısı
+MIN_RATED_PREDICTIONS = 3
+
+
+class ModelStats(Mapping):
+    """Her model için bir satır tutan dizi tabanlı başarı istatistikleri
+
+    Toplam ve doğru sayıları, son `window` tahminin isabetlerini tutan halka
+    tampon ve üstel azalan başarı oranı her sonuçta tüm modeller için tek
+    vektörel adımda güncellenir.
+
+    Sözlük gibi okunur: model_stats[model adı] success_rate, correct, total,
+    recent_rate, recent_count ve decayed_rate alanlarını içeren bir sözlük döndürür.
+    """
+
+    def __init__(self, model_names, window=RECENT_WINDOW, decay=DEFAULT_DECAY):
+        """
+        Args:
+            model_names (list): Model adları (satır sırası)
+            window (int, optional): Yakın dönem başarısı için son tahmin sayısı
+            decay (float, optional): Azalan oranın eski değere verdiği ağırlık (0-1)
+        """
+        if window <= 0:
+            raise ValueError("Pencere boyutu pozitif olmalıdır")
+        if not 0 < decay < 1:
+            raise ValueError("Azalma katsayısı 0 ile 1 arasında olmalıdır")
+
+        self.names = list(model_names)
+        self.index = {name: row for row, name in enumerate(self.names)}
+        self.window = window
+        self.decay = decay
+        self.reset()
+
+    def reset(self):
+        """Tüm istatistikleri sıfırlar"""
+        count = len(self.names)
+        self.correct = np.zeros(count, dtype=np.int64)
+        self.total = np.zeros(count, dtype=np.int64)
+        self.success_rate = np.full(count, 50, dtype=np.int64)
+
+        # Son tahminlerin isabetleri (1=doğru) ve her modelin halka tampondaki sırası
+        self.recent = np.zeros((count, self.window), dtype=np.int8)
+        self.recent_hits = np.zeros(count, dtype=np.int64)
+
+        self.decayed_rate = np.full(count, 0.5)
+
+    def record(self, predictions, actual):
+        """
+        Bir sonucu tahmin yapan tüm modellere işler
+
+        Args:
+            predictions (numpy.ndarray): Model sırasıyla tahminler (0=belirsiz, 1=W, 2=L)
+            actual (int): Gerçekleşen sonuç (1=W, 2=L)
+        """
+        if actual == 0:
+            return
+
+        rows = np.flatnonzero(predictions)
+        if len(rows) == 0:
+            return
+
+        hits = (predictions[rows] == actual).astype(np.int8)
+        previous = self.total[rows]
+        slots = previous % self.window
+
+        total = previous + 1
+        correct = self.correct[rows] + hits
+        self.total[rows] = total
+        self.correct[rows] = correct
+
+        # Halka tamponda en eski isabetin yerini yenisi alır
+        self.recent_hits[rows] += hits - self.recent[rows, slots]
+        self.recent[rows, slots] = hits
+
+        self.decayed_rate[rows] = self.decay * self.decayed_rate[rows] + (1 - self.decay) * hits
+
+        # Başarı oranı en az 3 tahmin yapılmışsa hesaplanır, yoksa varsayılan 50
+        self.success_rate[rows] = np.where(
+            total >= MIN_RATED_PREDICTIONS, (correct / total * 100).astype(np.int64), 50)
+
+    def record_many(self, predictions, actuals):
+        """
+        Sonuçları sırayla işler; her satır için record() çağırmakla aynı sonucu verir
+
+        Toplam, doğru ve başarı oranı tek adımda güncellenir; halka tampona yalnızca
+        her modelin son `window` isabeti yazılır. Azalan oran her modelin kendi
+        tahmin sırasıyla hesaplanır.
+
+        Args:
+            predictions (numpy.ndarray): KxM tahminler (satır başına model sırasıyla)
+            actuals (array-like): Her satırın gerçekleşen sonucu (1=W, 2=L)
+        """
+        predictions = np.asarray(predictions)
+        actuals = np.asarray(actuals).reshape(-1, 1)
+        made = (predictions != 0) & (actuals != 0)
+        hits = (made & (predictions == actuals)).astype(np.int8)
+        rows = np.flatnonzero(made.any(axis=0))
+        if len(rows) == 0:
+            return
+
+        previous = self.total.copy()
+        self.total += made.sum(axis=0)
+        self.correct += hits.sum(axis=0)
+
+        # Her modelin tahminleri halka tampona ve azalan orana kendi sırasıyla işlenir
+        previous_hits = self.recent[rows].sum(axis=1, dtype=np.int64)
+        gain = 1 - self.decay
+        for row in rows.tolist():
+            row_hits = hits[made[:, row], row]
+            tail = row_hits[-self.window:]
+            start = int(previous[row]) + len(row_hits) - len(tail)
+            self.recent[row, np.arange(start, start + len(tail)) % self.window] = tail
+
+            rate = float(self.decayed_rate[row])
+            for hit in row_hits.tolist():
+                rate = self.decay * rate + gain * hit
+            self.decayed_rate[row] = rate
+
+        self.recent_hits[rows] += self.recent[rows].sum(axis=1, dtype=np.int64) - previous_hits
+
+        total = self.total[rows]
+        self.success_rate[rows] = np.where(
+            total >= MIN_RATED_PREDICTIONS, (self.correct[rows] / total * 100).astype(np.int64), 50)
+
+    def recompute(self):
+        """Yakın dönem isabet sayılarını ve başarı oranlarını sayaçlardan yeniden hesaplar
+
+        Sayaçlar ve halka tampon dışarıdan (ör. SessionState ile) yüklendiğinde çağrılır.
+        """
+        self.recent_hits = self.recent.sum(axis=1, dtype=np.int64)
+        self.success_rate = np.where(
+            self.total >= MIN_RATED_PREDICTIONS,
+            (self.correct / np.maximum(self.total, 1) * 100).astype(np.int64), 50)
+
+    def record_dict(self, predictions, actual):
+        """Model adı -> tahmin sözlüğündeki tahminleri işler (eksik modeller tahminsiz sayılır)"""
+        self.record(np.array([predictions.get(name, 0) for name in self.names], dtype=np.int8), actual)
+
+    def recent_rate(self):
+        """Modellerin son `window` tahmindeki başarı oranları (tahmin yoksa 0.5)"""
+        count = np.minimum(self.total, self.window)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(count > 0, self.recent_hits / count, 0.5)
+
+    def copy(self):
+        """İstatistiklerin bağımsız bir kopyasını döndürür"""
+        clone = ModelStats.__new__(ModelStats)
+        clone.names = self.names
+        clone.index = self.index
+        clone.window = self.window
+        clone.decay = self.decay
+        for field in ('correct', 'total', 'success_rate', 'recent', 'recent_hits', 'decayed_rate'):
+            setattr(clone, field, getattr(self, field).copy())
+        return clone
+
+    def __getitem__(self, model_name):
+        row = self.index[model_name]
+        count = min(int(self.total[row]), self.window)
+        return {
+            'success_rate': int(self.success_rate[row]),
+            'correct': int(self.correct[row]),
+            'total': int(self.total[row]),
+            'recent_rate': int(self.recent_hits[row]) / count if count > 0 else 0.5,
+            'recent_count': count,
+            'decayed_rate': float(self.decayed_rate[row])
+        }
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Sonuç dizisi için artımlı n-gram (geçiş sayısı) indeksi
+"""
+
+from collections import deque
+
+import numpy as np
+
+# Varsayılan en uzun bağlam (son k sonuç) uzunluğu
+DEFAULT_MAX_ORDER = 6
+
+# Geri alınabilecek en fazla sonuç sayısı (motorda geri alma matristeki hamlelerle sınırlıdır)
+DEFAULT_ROLLBACK_LIMIT = 25
+
+
+class NgramIndex:
+    """Son k sonuçtan (k = 0..max_order) sonra gelen W ve L sayıları
+
+    Her sonuç eklendiğinde yalnızca max_order + 1 sayaç artar, geri almada aynı
+    sayaçlar azalır; dizinin uzunluğundan bağımsız olarak O(K) çalışır. Son k
+    sonuçtan sonraki olasılıklar tek bir tablo satırından okunur.
+
+    Bağlam kodu son k sonucun bitleridir (W=0, L=1, en yeni sonuç en düşük bitte).
+    k uzunluğundaki bağlamlar sayaç tablosunda 2**k - 1 numaralı satırdan başlar;
+    bu sayı aynı zamanda k bitlik maskedir. Sayaçlar düz bir listede (satır * 2 +
+    bit) tutulur; tek tek artırmada NumPy dizinlemesinden birkaç kat hızlıdır.
+    """
+
+    def __init__(self, max_order=DEFAULT_MAX_ORDER, rollback_limit=DEFAULT_ROLLBACK_LIMIT):
+        """
+        Args:
+            max_order (int, optional): En uzun bağlam uzunluğu K
+            rollback_limit (int, optional): Art arda geri alınabilecek en fazla sonuç sayısı
+        """
+        if max_order < 0:
+            raise ValueError("Bağlam uzunluğu negatif olamaz")
+
+        self.max_order = max_order
+        self.rollback_limit = rollback_limit
+        self._masks = [(1 << order) - 1 for order in range(max_order + 1)]
+        self.reset()
+
+    def reset(self):
+        """Tüm sayaçları sıfırlar"""
+        self._counts = [0] * (((2 << self.max_order) - 1) * 2)
+        self.length = 0  # Eklenen toplam sonuç sayısı
+        self.context = 0  # Son max_order sonucun bit kodu
+        self.recent = deque(maxlen=self.max_order + self.rollback_limit)  # Geri alma için son sonuçlar
+        self.head = []  # Akışın ilk max_order sonucu (bitler); alt dereceler bunlardan türetilir
+
+    @classmethod
+    def from_sequence(cls, sequence, max_order=DEFAULT_MAX_ORDER):
+        """Bir sonuç dizisinin indeksini oluşturur"""
+        index = cls(max_order)
+        for value in sequence:
+            index.append(value)
+        return index
+
+    @property
+    def counts(self):
+        """Sayaç tablosu: (2**(K+1) - 1, 2) int64 dizi, satır başına W ve L sayısı (kopya)"""
+        return np.array(self._counts, dtype=np.int64).reshape(-1, 2)
+
+    def compact(self):
+        """
+        İndeksi en küçük biçimde dışa aktarır
+
+        Yalnızca en uzun bağlamın sayaçları saklanır: k < K için sayaçlar, K
+        bağlamlarının son k sonucuna göre toplanması ve akışın ilk K sonucundan
+        türetilir (bkz. load_compact()).
+
+        Returns:
+            tuple: ((2**K, 2) sayaçlar, ilk K sonuç, son sonuçlar, toplam sonuç sayısı);
+                sonuçlar 1=W, 2=L
+        """
+        start = self._masks[-1] * 2
+        top = np.array(self._counts[start:], dtype=np.int64).reshape(-1, 2)
+        return (top, [bit + 1 for bit in self.head], [bit + 1 for bit in self.recent], self.length)
+
+    def load_compact(self, top, head, recent, length):
+        """
+        compact() çıktısını yükler; tüm alt derecelerin sayaçları yeniden oluşturulur
+
+        Args:
+            top (array-like): (2**K, 2) en uzun bağlamın sayaçları
+            head (iterable): Akışın ilk min(length, K) sonucu
+            recent (iterable): Son sonuçlar (geri alma için), eski -> yeni
+            length (int): Eklenmiş toplam sonuç sayısı
+        """
+        head = [int(value) - 1 for value in head]
+        bits = [int(value) - 1 for value in recent]
+        if len(head) != min(length, self.max_order) or len(bits) < min(length, self.max_order):
+            raise ValueError("İndeks için yeterli sonuç yok")
+
+        top = np.asarray(top, dtype=np.int64).reshape(-1, 2)
+        if len(top) != 1 << self.max_order:
+            raise ValueError("Sayaç tablosunun boyutu bağlam uzunluğuyla uyuşmuyor")
+
+        # k uzunluğundaki bağlam, K bağlamının en düşük k bitidir; akışın ilk K
+        # konumu K bağlamında sayılmadığından bu konumlar ilk sonuçlardan eklenir
+        counts = []
+        for order in range(self.max_order + 1):
+            table = top.reshape(-1, 1 << order, 2).sum(axis=0)
+            for position in range(order, len(head)):
+                context = 0
+                for bit in head[position - order:position]:
+                    context = (context << 1) | bit
+                table[context, head[position]] += 1
+            counts.extend(table.ravel().tolist())
+
+        self._counts = counts
+        self.head = head
+        self.recent = deque(bits, maxlen=self.recent.maxlen)
+        self.length = length
+        self.context = 0
+        for bit in bits[len(bits) - min(length, self.max_order):]:
+            self.context = (self.context << 1) | bit
+
+    def append(self, value):
+        """
+        Bir sonucu ekler ve son k sonuçtan sonra gelen sayaçları artırır
+
+        Args:
+            value (int): 1 (W) veya 2 (L)
+        """
+        if value != 1 and value != 2:
+            raise ValueError("Sonuç 1 (W) veya 2 (L) olmalıdır")
+
+        bit = value - 1
+        counts = self._counts
+        context = self.context
+        for mask in self._masks[:min(self.length, self.max_order) + 1]:
+            counts[(mask + (context & mask)) * 2 + bit] += 1
+
+        self.context = ((context << 1) | bit) & self._masks[-1]
+        if self.length < self.max_order:
+            self.head.append(bit)
+        self.length += 1
+        self.recent.append(bit)
+
+    def pop(self):
+        """
+        Son sonucu geri alır
+
+        Returns:
+            int: Geri alınan sonuç (1=W, 2=L)
+        """
+        if self.length == 0:
+            raise IndexError("Geri alınacak sonuç yok")
+        if not self.recent or (self.length > self.max_order and len(self.recent) <= self.max_order):
+            raise IndexError("Geri alma sınırı aşıldı")
+
+        bit = self.recent.pop()
+        self.length -= 1
+        if self.length < self.max_order:
+            self.head.pop()
+
+        # Bağlamdan çıkan en eski sonuç halka tampondan geri gelir
+        self.context >>= 1
+        if self.length >= self.max_order:
+            self.context |= self.recent[-self.max_order] << (self.max_order - 1)
+
+        counts = self._counts
+        context = self.context
+        for mask in self._masks[:min(self.length, self.max_order) + 1]:
+            counts[(mask + (context & mask)) * 2 + bit] -= 1
+        return bit + 1
+
+    def last(self, order):
+        """Son `order` sonucu eski -> yeni sırasıyla döndürür"""
+        if order > min(self.length, self.max_order):
+            raise ValueError("Bağlam uzunluğu eklenen sonuç sayısından büyük")
+        return tuple(((self.context >> shift) & 1) + 1 for shift in range(order - 1, -1, -1))
+
+    def next_counts(self, pattern=None, order=None):
+        """
+        Bir bağlamdan sonra gelen W ve L sayılarını döndürür
+
+        Args:
+            pattern (sequence, optional): Bağlam (eski -> yeni, 1=W, 2=L); verilmezse son
+                `order` sonuç
+            order (int, optional): pattern verilmediğinde bağlam uzunluğu (varsayılan en uzun)
+
+        Returns:
+            tuple: (W sayısı, L sayısı)
+        """
+        if pattern is None:
+            if order is None:
+                order = min(self.length, self.max_order)
+            context = self.context & self._masks[order]
+        else:
+            order = len(pattern)
+            if order > self.max_order:
+                raise ValueError(f"Bağlam uzunluğu en fazla {self.max_order} olabilir")
+            context = 0
+            for value in pattern:
+                context = (context << 1) | (int(value) - 1)
+
+        row = (self._masks[order] + context) * 2
+        return self._counts[row], self._counts[row + 1]
+
+    def next_probabilities(self, pattern=None, order=None):
+        """
+        Bir bağlamdan sonraki W ve L olasılıklarını sabit zamanda döndürür
+
+        Args:
+            pattern (sequence, optional): Bağlam (eski -> yeni); verilmezse son `order` sonuç
+            order (int, optional): pattern verilmediğinde bağlam uzunluğu
+
+        Returns:
+            dict: w_probability, l_probability ve count (bağlam hiç görülmediyse olasılıklar 0)
+        """
+        w_count, l_count = self.next_counts(pattern, order)
+        total = w_count + l_count
+        return {
+            'w_probability': w_count / total if total > 0 else 0,
+            'l_probability': l_count / total if total > 0 else 0,
+            'count': total
+        }
+
+    def pattern_probabilities(self, order):
+        """
+        k uzunluğundaki tüm görülmüş bağlamların sonraki değer olasılıkları
+
+        Süre dizinin uzunluğuna değil yalnızca 2**k'ye bağlıdır.
+
+        Returns:
+            dict: Bağlam (eski -> yeni) -> w_probability, l_probability, count
+        """
+        if order > self.max_order:
+            raise ValueError(f"Bağlam uzunluğu en fazla {self.max_order} olabilir")
+
+        start = self._masks[order] * 2
+        counts = self._counts[start:start + (2 << order)]
+        probabilities = {}
+        for context in range(1 << order):
+            w_count, l_count = counts[2 * context], counts[2 * context + 1]
+            total = w_count + l_count
+            if total == 0:
+                continue
+            pattern = tuple(((context >> shift) & 1) + 1 for shift in range(order - 1, -1, -1))
+            probabilities[pattern] = {
+                'w_probability': w_count / total,
+                'l_probability': l_count / total,
+                'count': total
+            }
+        return probabilities
+
+    def copy(self):
+        """İndeksin bağımsız bir kopyasını döndürür"""
+        clone = NgramIndex.__new__(NgramIndex)
+        clone.max_order = self.max_order
+        clone.rollback_limit = self.rollback_limit
+        clone._masks = self._masks
+        clone._counts = list(self._counts)
+        clone.length = self.length
+        clone.context = self.context
+        clone.recent = self.recent.copy()
+        clone.head = list(self.head)
+        return clone
+
+    def __len__(self):
+        return self.length
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Sonuç başına 2 bit kullanan, bellek eşlemeli (memmap) ikili sonuç dosyası
+
+Dosya düzeni (küçük uçlu):
+    0   4 bayt   "WLPK" imzası
+    4   uint16   sürüm (1)
+    6   uint16   bayraklar (bit 0: hücre konumları var)
+    8   uint64   sonuç sayısı (n)
+    16  ceil(n/4) bayt   sonuçlar; her bayt 4 sonuç, ilk sonuç en düşük 2 bitte (1=W, 2=L)
+    ..  n bayt           (isteğe bağlı) her hamlenin hücresi, row * 5 + col
+
+Kullanım (depo kök dizininden):
+    python -m core.outcome_file sonuclar.txt sonuclar.wlp
+"""
+
+import argparse
+import os
+import struct
+
+import numpy as np
+
+MAGIC = b"WLPK"
+VERSION = 1
+FLAG_CELLS = 1
+
+_HEADER = struct.Struct("<4sHHQ")
+HEADER_SIZE = _HEADER.size
+
+# Paketli bayt -> 4 sonuç (en düşük bitlerden başlayarak)
+_DECODE = ((np.arange(256)[:, None] >> (2 * np.arange(4))) & 3).astype(np.int8)
+
+
+def pack_outcomes(outcomes):
+    """
+    Sonuçları bayt başına 4 sonuç olacak şekilde paketler
+
+    Args:
+        outcomes (array-like): 1 (W) ve 2 (L) değerleri
+
+    Returns:
+        numpy.ndarray: uint8 paketli dizi (ceil(n/4) bayt)
+    """
+    outcomes = np.asarray(outcomes, dtype=np.uint8).ravel()
+    if not np.isin(outcomes, (1, 2)).all():
+        raise ValueError("Sonuçlar yalnızca 1 (W) ve 2 (L) değerleri içermelidir")
+
+    padded = np.zeros((len(outcomes) + 3) // 4 * 4, dtype=np.uint8)
+    padded[:len(outcomes)] = outcomes
+    groups = padded.reshape(-1, 4)
+    return groups[:, 0] | (groups[:, 1] << 2) | (groups[:, 2] << 4) | (groups[:, 3] << 6)
+
+
+def unpack_outcomes(packed, count):
+    """
+    pack_outcomes() ile paketlenmiş sonuçları açar
+
+    Args:
+        packed (bytes | numpy.ndarray): Paketli baytlar
+        count (int): Açılacak sonuç sayısı
+
+    Returns:
+        numpy.ndarray: int8 sonuç dizisi (1=W, 2=L)
+    """
+    return _DECODE[np.frombuffer(packed, dtype=np.uint8)].ravel()[:count]
+
+
+def default_cells(count):
+    """
+    Hamleler hep ilk boş hücreye yapıldığında oluşan hücre sırasını döndürür
+
+    İlk 25 hamle matrisi satır sırasıyla doldurur; sonrasında her hamleden önce
+    matris kaydırıldığı için hamleler son satırda sırayla ilerler.
+    """
+    moves = np.arange(count)
+    return np.where(moves < 25, moves, 20 + (moves - 25) % 5).astype(np.uint8)
+
+
+def write_outcomes(path, outcomes, cells=None):
+    """
+    Sonuçları (ve gerekiyorsa hücre konumlarını) paketli dosyaya yazar
+
+    Args:
+        path (str | os.PathLike): Hedef dosya
+        outcomes (array-like): 1 (W) ve 2 (L) değerleri
+        cells (array-like, optional): Her hamlenin hücresi (row * 5 + col); varsayılan
+            doldurma sırasıyla aynıysa dosyaya yazılmaz
+    """
+    packed = pack_outcomes(outcomes)
+    count = len(np.asarray(outcomes).ravel())
+
+    flags = 0
+    if cells is not None:
+        cells = np.asarray(cells, dtype=np.uint8).ravel()
+        if len(cells) != count:
+            raise ValueError("Hücre sayısı sonuç sayısıyla aynı olmalıdır")
+        if (cells >= 25).any():
+            raise ValueError("Hücre indeksleri 0-24 aralığında olmalıdır")
+        if (cells == default_cells(count)).all():
+            cells = None
+        else:
+            flags |= FLAG_CELLS
+
+    with open(path, "wb") as stream:
+        stream.write(_HEADER.pack(MAGIC, VERSION, flags, count))
+        stream.write(packed.tobytes())
+        if cells is not None:
+            stream.write(cells.tobytes())
+
+
+def is_outcome_file(path):
+    """Dosyanın paketli sonuç dosyası olup olmadığını imzasından anlar"""
+    try:
+        with open(path, "rb") as stream:
+            return stream.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+class OutcomeFile:
+    """Paketli sonuç dosyasına memmap üzerinden kopyasız erişim
+
+    Dizin ve dilimler yalnızca ilgili baytları açar; `cells` dosyada hücre
+    konumları varsa uint8 memmap, yoksa None'dır.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str | os.PathLike): Paketli sonuç dosyası
+        """
+        self.path = os.fspath(path)
+
+        with open(self.path, "rb") as stream:
+            header = stream.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise ValueError("Sonuç dosyası başlığı eksik")
+
+        magic, version, flags, count = _HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError("Paketli sonuç dosyası değil")
+        if version != VERSION:
+            raise ValueError(f"Desteklenmeyen sonuç dosyası sürümü: {version}")
+
+        self.count = count
+        packed_size = (count + 3) // 4
+        expected = HEADER_SIZE + packed_size + (count if flags & FLAG_CELLS else 0)
+        if os.path.getsize(self.path) < expected:
+            raise ValueError("Sonuç dosyası kesik")
+
+        # Boş diziler memmap ile eşlenemez
+        if count == 0:
+            self.packed = np.zeros(0, dtype=np.uint8)
+            self.cells = np.zeros(0, dtype=np.uint8) if flags & FLAG_CELLS else None
+            return
+
+        self.packed = np.memmap(self.path, dtype=np.uint8, mode="r",
+                                offset=HEADER_SIZE, shape=(packed_size,))
+        self.cells = None
+        if flags & FLAG_CELLS:
+            self.cells = np.memmap(self.path, dtype=np.uint8, mode="r",
+                                   offset=HEADER_SIZE + packed_size, shape=(count,))
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        """Tek sonucu (int) veya bir dilimi (int8 dizi) döndürür"""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.count)
+            if step != 1:
+                return np.asarray(self)[index]
+            return self._decode(start, stop)
+
+        index = int(index)
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("Sonuç indeksi aralık dışında")
+        return int((self.packed[index // 4] >> (2 * (index % 4))) & 3)
+
+    def _decode(self, start, stop):
+        """[start, stop) aralığındaki sonuçları açar"""
+        if start >= stop:
+            return np.zeros(0, dtype=np.int8)
+
+        first = start // 4
+        last = (stop + 3) // 4
+        outcomes = _DECODE[self.packed[first:last]].ravel()
+        return outcomes[start - first * 4:stop - first * 4]
+
+    def __array__(self, dtype=None, copy=None):
+        outcomes = self._decode(0, self.count)
+        return outcomes if dtype is None else outcomes.astype(dtype)
+
+    def iter_chunks(self, chunk_size):
+        """
+        Sonuçları parça parça açar
+
+        Yields:
+            tuple: (int8 sonuç parçası, hücre parçası veya None)
+        """
+        for start in range(0, self.count, chunk_size):
+            stop = min(start + chunk_size, self.count)
+            cells = self.cells[start:stop] if self.cells is not None else None
+            yield self._decode(start, stop), cells
+
+
+def main():
+    from core.backtest import load_session
+
+    parser = argparse.ArgumentParser(description="W/L metin dosyasını paketli sonuç dosyasına çevirir")
+    parser.add_argument("source", help="W/L (veya 1/2) metin dosyası")
+    parser.add_argument("target", help="Yazılacak paketli dosya")
+    args = parser.parse_args()
+
+    outcomes = load_session(args.source)
+    write_outcomes(args.target, outcomes)
+    print(f"{len(outcomes)} sonuç, {os.path.getsize(args.target)} bayt")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Bellekte çok sayıda oturum tutmak için sıkıştırılmış oturum durumu
+"""
+
+from collections import deque
+
+import numpy as np
+
+from core.board_key import BoardKey
+from core.engine import RESULT_HISTORY_LIMIT
+from core.outcome_file import pack_outcomes, unpack_outcomes
+
+# Geçmiş halka tamponunun kapasitesi (geçmiş her zaman matristeki dolu hücrelerdir)
+HISTORY_CAPACITY = 25
+
+
+class SessionState:
+    """Bir oturumun motor dışında saklanan küçük, değiştirilebilir durumu
+
+    Matris iki 25 bitlik maske (W ve L), geçmiş hücre indekslerini tutan önceden
+    ayrılmış bir halka tampon, gerçek sonuçlar 2 bitlik paketli baytlar, model
+    istatistikleri ve n-gram sayaçları da küçük tamsayı dizileri olarak tutulur.
+    Hiç tahmin puanlanmamış oturumda istatistik dizileri hiç oluşturulmaz.
+
+    snapshot() bir motorun durumunu alır, restore() aynı durumu (aynı model
+    sırasına sahip) bir motora geri yükler; geri yüklenen motor kaldığı yerden
+    aynı tahminlerle devam eder. Böylece çok sayıda oturum birkaç paylaşılan
+    motorla çalıştırılabilir.
+    """
+
+    __slots__ = ('w_mask', 'l_mask', 'ring', 'head', 'length', 'results', 'result_count',
+                 'counts', 'recent', 'decayed', 'predictions', 'confidence', 'deferred',
+                 'index_counts', 'index_recent', 'index_length')
+
+    def __init__(self):
+        self.w_mask = 0
+        self.l_mask = 0
+
+        # Hamlelerin hücreleri (row * 5 + col) ekleme sırasıyla
+        self.ring = bytearray(HISTORY_CAPACITY)
+        self.head = 0
+        self.length = 0
+
+        # Son RESULT_HISTORY_LIMIT gerçek sonuç (pack_outcomes biçiminde)
+        self.results = b""
+        self.result_count = 0
+
+        # Model istatistikleri: (2, M) int32 doğru/toplam, (M, ceil(pencere/8)) bitler
+        # halinde son isabetler ve float64 azalan oran; tahmin yokken None
+        self.counts = None
+        self.recent = None
+        self.decayed = None
+
+        # Puanlanmayı bekleyen tahminler (model sırasıyla bayt başına bir tahmin) ve Hibrit güveni
+        self.predictions = None
+        self.confidence = 0.5
+
+        # Mevcut durumun analizi ertelenmiş mi (engine.defer())
+        self.deferred = False
+
+        # Sonuç akışının n-gram indeksi: en uzun bağlamın sayaçları (en küçük yeterli
+        # işaretsiz tamsayı türünde ham baytlar), akışın ilk K sonucu ile geri alma için
+        # son sonuçlar (pack_outcomes biçiminde) ve toplam sonuç sayısı
+        self.index_counts = None
+        self.index_recent = b""
+        self.index_length = 0
+
+    # Matris ve geçmiş
+
+    def push(self, row, col):
+        """Geçmişe bir hamlenin hücresini ekler"""
+        if self.length == HISTORY_CAPACITY:
+            raise ValueError("Geçmiş halka tamponu dolu")
+        self.ring[(self.head + self.length) % HISTORY_CAPACITY] = row * 5 + col
+        self.length += 1
+
+    def cells(self):
+        """Geçmişteki hücreleri ekleme sırasıyla döndürür"""
+        return [self.ring[(self.head + i) % HISTORY_CAPACITY] for i in range(self.length)]
+
+    def value(self, cell):
+        """Bir hücrenin değerini maskelerden okur (0=boş, 1=W, 2=L)"""
+        bit = 1 << cell
+        return 1 if self.w_mask & bit else 2 if self.l_mask & bit else 0
+
+    def history(self):
+        """Geçmişi motorun biçiminde döndürür: (row, col, value) listesi"""
+        return [(cell // 5, cell % 5, self.value(cell)) for cell in self.cells()]
+
+    def board(self):
+        """5x5 int8 matrisi döndürür"""
+        bits = 1 << np.arange(25, dtype=np.int64)
+        w_cells = (self.w_mask & bits) != 0
+        l_cells = (self.l_mask & bits) != 0
+        return (w_cells + 2 * l_cells).astype(np.int8).reshape(5, 5)
+
+    # Motorla aktarım
+
+    @classmethod
+    def snapshot(cls, engine):
+        """
+        Motorun durumunu alır
+
+        Sonucu gelmiş ertelenen durumlar önce puanlanır (flush_deferred).
+
+        Args:
+            engine (AnalysisEngine): Kaynak motor
+
+        Returns:
+            SessionState: Motordan bağımsız durum
+        """
+        engine.flush_deferred()
+        state = cls()
+
+        for row, col, value in engine.history:
+            if value == 1:
+                state.w_mask |= 1 << (row * 5 + col)
+            else:
+                state.l_mask |= 1 << (row * 5 + col)
+            state.push(row, col)
+
+        if engine.actual_results:
+            state.result_count = len(engine.actual_results)
+            state.results = pack_outcomes(np.fromiter(
+                engine.actual_results, dtype=np.uint8, count=state.result_count)).tobytes()
+
+        stats = engine.model_stats
+        if stats.total.any():
+            state.counts = np.array([stats.correct, stats.total], dtype=np.int32)
+            state.recent = np.packbits(stats.recent != 0, axis=1)
+            state.decayed = stats.decayed_rate.copy()
+
+        if engine.predictions:
+            state.predictions = bytes(int(engine.predictions.get(name, 0)) for name in stats.names)
+        state.confidence = engine.hibrit_confidence
+
+        # Puanlandıktan sonra yalnızca mevcut durumun (sonucu gelmemiş) kaydı kalabilir
+        state.deferred = bool(engine.deferred)
+
+        index = engine.outcome_index
+        if index.length:
+            top, head, recent, length = index.compact()
+            state.index_counts = top.astype(np.min_scalar_type(int(top.max()))).tobytes()
+            state.index_recent = pack_outcomes(np.array(head + recent, dtype=np.uint8)).tobytes()
+            state.index_length = length
+        return state
+
+    def restore(self, engine):
+        """
+        Durumu motora yükler; motorun önceki durumu tamamen değişir
+
+        Args:
+            engine (AnalysisEngine): Hedef motor (aynı model sırasıyla)
+        """
+        stats = engine.model_stats
+        if self.predictions is not None and len(self.predictions) != len(stats.names):
+            raise ValueError("Oturum durumu motorun modelleriyle uyuşmuyor")
+
+        board = self.board()
+        engine.board.reset(board, self.history())
+        engine.board_key = BoardKey.from_matrix(board)
+        engine.actual_results = deque(unpack_outcomes(self.results, self.result_count).tolist(),
+                                      maxlen=RESULT_HISTORY_LIMIT)
+
+        stats.reset()
+        if self.counts is not None:
+            stats.correct = self.counts[0].astype(np.int64)
+            stats.total = self.counts[1].astype(np.int64)
+            stats.recent = np.unpackbits(self.recent, axis=1, count=stats.window).astype(np.int8)
+            stats.decayed_rate = self.decayed.copy()
+            stats.recompute()
+
+        engine.predictions = ({} if self.predictions is None
+                              else dict(zip(stats.names, self.predictions)))
+        engine.hibrit_confidence = self.confidence
+
+        if self.index_counts is None:
+            engine.outcome_index.reset()
+        else:
+            # Sayaç türü bayt sayısından çıkar; paketlemedeki dolgu sıfırları sonuç değildir
+            index = engine.outcome_index
+            width = len(self.index_counts) // (2 << index.max_order)
+            top = np.frombuffer(self.index_counts, dtype=np.dtype(f"u{width}"))
+            outcomes = unpack_outcomes(self.index_recent, len(self.index_recent) * 4)
+            outcomes = outcomes[outcomes != 0].tolist()
+            split = min(self.index_length, index.max_order)
+            index.load_compact(top, outcomes[:split], outcomes[split:], self.index_length)
+
+        engine.deferred = []
+        if self.deferred:
+            engine.defer()
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+SQLite (WAL) tabanlı kalıcı oturum kaydı
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+
+from core.engine import AnalysisEngine, HIBRIT_MODEL
+
+# Bir yazma işleminde (transaction) en fazla kaç kayıt birleştirilir
+DEFAULT_BATCH_SIZE = 512
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    started REAL NOT NULL,
+    name TEXT
+);
+CREATE INDEX IF NOT EXISTS sessions_started ON sessions (started);
+
+CREATE TABLE IF NOT EXISTS events (
+    session_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    kind TEXT NOT NULL,
+    row INTEGER,
+    col INTEGER,
+    value INTEGER,
+    PRIMARY KEY (session_id, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS events_session_ts ON events (session_id, ts);
+CREATE INDEX IF NOT EXISTS events_ts ON events (ts);
+
+CREATE TABLE IF NOT EXISTS predictions (
+    session_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    model TEXT NOT NULL,
+    prediction INTEGER NOT NULL,
+    confidence REAL,
+    PRIMARY KEY (session_id, seq, model)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS predictions_session_ts ON predictions (session_id, ts);
+"""
+
+# Olay türleri
+EVENT_ADD = "add"
+EVENT_UNDO = "undo"
+EVENT_CLEAR = "clear"
+
+_INSERT_SESSION = "INSERT OR IGNORE INTO sessions (id, started, name) VALUES (?, ?, ?)"
+_INSERT_EVENT = "INSERT INTO events (session_id, seq, ts, kind, row, col, value) VALUES (?, ?, ?, ?, ?, ?, ?)"
+_INSERT_PREDICTION = ("INSERT OR REPLACE INTO predictions (session_id, seq, ts, model, prediction, confidence) "
+                      "VALUES (?, ?, ?, ?, ?, ?)")
+
+# Yazıcı iş parçacığını durduran kuyruk işareti
+_STOP = object()
+
+
+class SessionStore:
+    """Hamleleri, tahminleri ve sonuçları SQLite'a yazan oturum deposu
+
+    Yazma çağrıları yalnızca kuyruğa ekler; arka plandaki yazıcı iş parçacığı
+    biriken kayıtları tek bir işlemde (transaction) yazar. Okumalar her çağrıda
+    ayrı bir bağlantı açar; WAL kipi sayesinde yazıcıyı beklemez.
+    """
+
+    def __init__(self, path, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Args:
+            path (str | os.PathLike): Veritabanı dosyası
+            batch_size (int, optional): Bir işlemde yazılan en fazla kayıt sayısı
+        """
+        self.path = str(path)
+        self.batch_size = batch_size
+        self.error = None
+
+        connection = self._connect()
+        try:
+            connection.executescript(SCHEMA)
+        finally:
+            connection.close()
+
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="SessionStoreWriter",
+                                        daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        """WAL kipinde yeni bir bağlantı açar"""
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _write_loop(self):
+        """Kuyruktaki kayıtları toplu işlemlerle yazar (yazıcı iş parçacığı)"""
+        connection = self._connect()
+        stopping = False
+
+        while not stopping:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if batch[-1] is _STOP:
+                stopping = True
+                batch.pop()
+
+            try:
+                with connection:
+                    # Aynı sorgunun art arda gelen kayıtları tek executemany ile yazılır
+                    start = 0
+                    while start < len(batch):
+                        sql = batch[start][0]
+                        end = start
+                        while end < len(batch) and batch[end][0] == sql:
+                            end += 1
+                        connection.executemany(sql, [params for _, params in batch[start:end]])
+                        start = end
+            except sqlite3.Error as error:
+                self.error = error
+
+            for _ in range(len(batch) + stopping):
+                self._queue.task_done()
+
+        connection.close()
+
+    def _put(self, sql, params):
+        """Bir kaydı yazılmak üzere kuyruğa ekler"""
+        if not self._writer.is_alive():
+            raise RuntimeError("Oturum deposu kapatıldı")
+        self._queue.put((sql, params))
+
+    def flush(self):
+        """Kuyruktaki tüm kayıtlar yazılana kadar bekler"""
+        self._queue.join()
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def close(self):
+        """Bekleyen kayıtları yazar ve yazıcı iş parçacığını durdurur"""
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # Yazma
+
+    def start_session(self, name=None):
+        """Yeni bir oturum açar ve kimliğini döndürür"""
+        session_id = uuid.uuid4().hex
+        self._put(_INSERT_SESSION, (session_id, time.time(), name))
+        return session_id
+
+    def record_event(self, session_id, seq, kind, row=None, col=None, value=None):
+        """Bir olayı (ekleme, geri alma, temizleme) kaydeder"""
+        self._put(_INSERT_EVENT, (session_id, seq, time.time(), kind, row, col, value))
+
+    def record_predictions(self, session_id, seq, predictions, confidence=None):
+        """
+        Bir durumun model tahminlerini kaydeder
+
+        Args:
+            session_id (str): Oturum kimliği
+            seq (int): Tahminin yapıldığı durumu oluşturan son olayın sırası
+            predictions (dict): Model adı -> tahmin
+            confidence (float, optional): Hibrit güveni
+        """
+        timestamp = time.time()
+        for model_name, prediction in predictions.items():
+            self._put(_INSERT_PREDICTION, (
+                session_id, seq, timestamp, model_name, int(prediction),
+                confidence if model_name == HIBRIT_MODEL else None))
+
+    # Okuma
+
+    def _query(self, sql, params=()):
+        """Ayrı bir bağlantıda sorgu çalıştırır"""
+        connection = self._connect()
+        try:
+            return connection.execute(sql, params).fetchall()
+        finally:
+            connection.close()
+
+    def _where(self, session_id, since, until, column="ts"):
+        """Oturum ve zaman aralığı koşullarını oluşturur"""
+        clauses = []
+        params = []
+        if session_id is not None:
+            clauses.append("session_id = ?")
+            params.append(session_id)
+        if since is not None:
+            clauses.append(f"{column} >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append(f"{column} < ?")
+            params.append(until)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def sessions(self, since=None, until=None):
+        """
+        Başlangıç zamanı [since, until) aralığındaki oturumları döndürür
+
+        Returns:
+            list: (id, başlangıç, ad) satırları, başlangıca göre sıralı
+        """
+        where, params = self._where(None, since, until, column="started")
+        return self._query(f"SELECT id, started, name FROM sessions{where} ORDER BY started", params)
+
+    def has_session(self, session_id):
+        """Oturum kimliği sessions tablosunda kayıtlıysa True döner (kuyruktaki yazmalar dahil)"""
+        self.flush()
+        return bool(self._query("SELECT 1 FROM sessions WHERE id = ?", (session_id,)))
+
+    def latest_session(self):
+        """En son başlatılan oturumun kimliğini döndürür (yoksa None)"""
+        rows = self._query("SELECT id FROM sessions ORDER BY started DESC LIMIT 1")
+        return rows[0][0] if rows else None
+
+    def events(self, session_id=None, since=None, until=None):
+        """
+        Olayları oturum ve zaman aralığına göre döndürür
+
+        Returns:
+            list: (session_id, seq, ts, kind, row, col, value) satırları
+        """
+        where, params = self._where(session_id, since, until)
+        return self._query("SELECT session_id, seq, ts, kind, row, col, value FROM events"
+                           f"{where} ORDER BY session_id, seq", params)
+
+    def predictions(self, session_id=None, since=None, until=None, model=None):
+        """
+        Tahminleri oturum, zaman aralığı ve isteğe bağlı model adına göre döndürür
+
+        Returns:
+            list: (session_id, seq, ts, model, prediction, confidence) satırları
+        """
+        where, params = self._where(session_id, since, until)
+        if model is not None:
+            where += (" AND " if where else " WHERE ") + "model = ?"
+            params.append(model)
+        return self._query("SELECT session_id, seq, ts, model, prediction, confidence FROM predictions"
+                           f"{where} ORDER BY session_id, seq", params)
+
+    def load_session(self, session_id, engine=None):
+        """
+        Oturumun olaylarını motora yeniden oynatır
+
+        Matris, geçmiş, gerçek sonuçlar ve model istatistikleri arayüzdeki gibi
+        oluşur. Ara durumlar defer()/flush_deferred() ile toplu puanlandığından her
+        hamle için tam analiz çalışmaz; mevcut durumun tahmini için çağıran
+        analyze() çağırmalıdır.
+
+        Args:
+            session_id (str): Oturum kimliği
+            engine (AnalysisEngine, optional): Yüklenecek motor, verilmezse yenisi oluşturulur
+
+        Returns:
+            tuple: (motor, bir sonraki olay sırası)
+
+        Raises:
+            ValueError: Oturum kimliği depoda kayıtlı değilse
+        """
+        if not self.has_session(session_id):
+            raise ValueError(f"Oturum bulunamadı: {session_id}")
+
+        if engine is None:
+            engine = AnalysisEngine()
+        else:
+            engine.clear()
+
+        rows = self._query("SELECT seq, kind, row, col, value FROM events WHERE session_id = ? "
+                           "ORDER BY seq", (session_id,))
+
+        for _, kind, row, col, value in rows:
+            if kind == EVENT_ADD:
+                # Arayüz dolu matrise eklemeden önce kaydırır
+                if engine.is_full():
+                    engine.shift_matrix_up()
+                engine.add_at_position(row, col, value)
+                engine.defer()
+            elif kind == EVENT_UNDO:
+                engine.undo()
+                engine.defer()
+            elif kind == EVENT_CLEAR:
+                engine.clear()
+
+        engine.flush_deferred()
+        next_seq = rows[-1][0] + 1 if rows else 0
+        return engine, next_seq
+
+
+class SessionRecorder:
+    """Tek bir oturumun olaylarını sırayla depoya yazan yardımcı"""
+
+    def __init__(self, store, session_id=None, seq=0, name=None):
+        """
+        Args:
+            store (SessionStore): Oturum deposu
+            session_id (str, optional): Devam edilecek oturum, verilmezse yeni oturum açılır
+            seq (int, optional): Bir sonraki olayın sırası (devam ederken)
+            name (str, optional): Yeni oturumun adı
+
+        Raises:
+            ValueError: Devam edilecek oturum depoda kayıtlı değilse
+        """
+        if session_id is not None and not store.has_session(session_id):
+            raise ValueError(f"Oturum bulunamadı: {session_id}")
+
+        self.store = store
+        self.session_id = session_id if session_id is not None else store.start_session(name)
+        self.seq = seq
+
+    def _next(self):
+        seq = self.seq
+        self.seq += 1
+        return seq
+
+    def add(self, row, col, value):
+        """Bir hamleyi (gerçek sonucu) kaydeder"""
+        self.store.record_event(self.session_id, self._next(), EVENT_ADD, row, col, value)
+
+    def undo(self):
+        """Geri almayı kaydeder"""
+        self.store.record_event(self.session_id, self._next(), EVENT_UNDO)
+
+    def clear(self):
+        """Temizlemeyi kaydeder"""
+        self.store.record_event(self.session_id, self._next(), EVENT_CLEAR)
+
+    def predictions(self, predictions, confidence=None):
+        """Son olaydan sonraki durumun tahminlerini kaydeder"""
+        self.store.record_predictions(self.session_id, self.seq - 1, predictions, confidence)
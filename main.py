@@ -1,28 +1,60 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-W ve L Pattern Analiz Uygulaması - Modern UI
-Ana uygulama başlatıcısı
-"""
-
-import sys
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
-from ui.main_window import WLPatternAnalyzer
-
-if __name__ == "__main__":
-    # High DPI display support
-    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
-    
-    app = QApplication(sys.argv)
-    
-    # Fusion stil ile modern görünüm
-    app.setStyle("Fusion")
-    
-    # Ana pencereyi oluştur ve göster
-    main_window = WLPatternAnalyzer()
-    main_window.show()
-    
-    sys.exit(app.exec_())
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması - Modern UI
+Ana uygulama başlatıcısı
+"""
+
+import argparse
+import sys
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt
+from ui.main_window import WLPatternAnalyzer
+
+if __name__ == "__main__":
+    # Oturum kaydı seçenekleri; kalan argümanlar Qt'ye bırakılır
+    parser = argparse.ArgumentParser(description="WL Pattern Analyzer")
+    parser.add_argument("--session-db", help="Hamlelerin ve tahminlerin kaydedileceği SQLite dosyası")
+    parser.add_argument("--resume", nargs="?", const="latest", metavar="OTURUM",
+                        help="Kayıtlı oturuma devam et (kimlik verilmezse en sonuncusu)")
+    parser.add_argument("--load", metavar="DOSYA",
+                        help="Başlangıçta yüklenecek sonuç dosyası (W/L metni veya paketli .wlp)")
+    args, qt_args = parser.parse_known_args()
+    if args.resume is not None and not args.session_db:
+        parser.error("--resume için --session-db gereklidir")
+    
+    session_store = None
+    resume_session = None
+    if args.session_db:
+        from core.session_store import SessionStore
+        
+        session_store = SessionStore(args.session_db)
+        if args.resume == "latest":
+            resume_session = session_store.latest_session()
+            if resume_session is None:
+                parser.error(f"{args.session_db} içinde devam edilecek oturum yok")
+        elif args.resume is not None:
+            resume_session = args.resume
+            if not session_store.has_session(resume_session):
+                parser.error(f"Oturum bulunamadı: {resume_session}")
+    
+    # High DPI display support
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    
+    app = QApplication(sys.argv[:1] + qt_args)
+    
+    # Fusion stil ile modern görünüm
+    app.setStyle("Fusion")
+    
+    # Ana pencereyi oluştur ve göster
+    main_window = WLPatternAnalyzer(session_store, resume_session)
+    if args.load:
+        main_window.load_outcomes(args.load)
+    main_window.show()
+    
+    exit_code = app.exec_()
+    if session_store is not None:
+        session_store.close()
+    sys.exit(exit_code)
\ No newline at end of file
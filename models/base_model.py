@@ -1,121 +1,277 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-W ve L Pattern Analiz Uygulaması
-Temel analiz model sınıfı
-"""
-
-import numpy as np
-from abc import ABC, abstractmethod
-
-class BaseAnalysisModel(ABC):
-    """Tüm analiz modelleri için temel sınıf"""
-    
-    def __init__(self):
-        self.name = "Temel Model"
-        self.description = "Temel analiz modelidir. Bu model doğrudan kullanılmamalıdır."
-        self.min_data_points = 5
-    
-    @abstractmethod
-    def analyze(self, matrix, history=None):
-        """
-        Verilen matris ve geçmişi analiz eder
-        
-        Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
-            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
-            
-        Returns:
-            int: Tahmin (0=belirsiz, 1=W, 2=L)
-        """
-        pass
-    
-    def _calculate_basic_stats(self, matrix):
-        """Temel istatistikleri hesaplar"""
-        # W ve L sayıları
-        w_count = np.sum(matrix == 1)
-        l_count = np.sum(matrix == 2)
-        total = w_count + l_count
-        
-        # Boş hücre yoksa veya yeterli veri yoksa analiz yapma
-        if total < self.min_data_points:
-            return {
-                'prediction': 0,
-                'confidence': 0,
-                'w_probability': 0,
-                'l_probability': 0
-            }
-        
-        # W ve L oranları
-        w_ratio = w_count / total if total > 0 else 0
-        l_ratio = l_count / total if total > 0 else 0
-        
-        # Basit olasılık tahmini
-        if w_ratio > l_ratio:
-            prediction = 1  # W
-            confidence = w_ratio
-        else:
-            prediction = 2  # L
-            confidence = l_ratio
-        
-        return {
-            'prediction': prediction,
-            'confidence': confidence,
-            'w_probability': w_ratio,
-            'l_probability': l_ratio,
-            'w_count': w_count,
-            'l_count': l_count,
-            'total': total
-        }
-    
-    def _convert_history_to_sequence(self, history):
-        """Geçmiş hamleleri sıralı bir diziye dönüştürür"""
-        if not history:
-            return []
-        
-        sequence = []
-        for _, _, value in history:
-            sequence.append(value)
-        
-        return sequence
-    
-    def _find_patterns(self, sequence, pattern_length=3):
-        """Belirli bir uzunluktaki tüm patternleri bulur"""
-        if len(sequence) < pattern_length:
-            return {}
-        
-        patterns = {}
-        for i in range(len(sequence) - pattern_length):
-            pattern = tuple(sequence[i:i+pattern_length])
-            if pattern not in patterns:
-                patterns[pattern] = []
-            
-            # Pattern sonrası gelen değeri ekle (varsa)
-            if i + pattern_length < len(sequence):
-                patterns[pattern].append(sequence[i+pattern_length])
-        
-        return patterns
-    
-    def _calculate_pattern_probabilities(self, patterns):
-        """Her pattern için bir sonraki değerin olasılıklarını hesaplar"""
-        probabilities = {}
-        
-        for pattern, next_values in patterns.items():
-            if not next_values:
-                continue
-                
-            w_count = next_values.count(1)
-            l_count = next_values.count(2)
-            total = len(next_values)
-            
-            w_prob = w_count / total if total > 0 else 0
-            l_prob = l_count / total if total > 0 else 0
-            
-            probabilities[pattern] = {
-                'w_probability': w_prob,
-                'l_probability': l_prob,
-                'count': total
-            }
-        
-        return probabilities
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Temel analiz model sınıfı
+"""
+
+import numpy as np
+from abc import ABC, abstractmethod
+from core.features import popcount
+
+class BaseAnalysisModel(ABC):
+    """Tüm analiz modelleri için temel sınıf"""
+    
+    def __init__(self):
+        self.name = "Temel Model"
+        self.description = "Temel analiz modelidir. Bu model doğrudan kullanılmamalıdır."
+        self.min_data_points = 5
+    
+    @abstractmethod
+    def analyze(self, matrix, history=None, features=None):
+        """
+        Verilen matris ve geçmişi analiz eder
+        
+        Args:
+            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (MatrixFeatures, optional): Bu adım için paylaşılan matris özellikleri
+            
+        Returns:
+            int: Tahmin (0=belirsiz, 1=W, 2=L)
+        """
+        pass
+    
+    def analyze_batch(self, boards, last_moves=None):
+        """
+        Bir matris yığınını analiz eder
+        
+        Varsayılan uygulama her matris için analyze() çağırır; vektörel
+        uygulaması olan modeller bu metodu ezer ve aynı tahminleri döndürür.
+        
+        Args:
+            boards (numpy.ndarray): Nx5x5 matris yığını, 0=boş, 1=W, 2=L
+            last_moves (numpy.ndarray, optional): Nx3 son hamleler (row, col, value);
+                value=0 ise o matris için son hamle yoktur
+        
+        Returns:
+            numpy.ndarray: N uzunluğunda tahminler (0=belirsiz, 1=W, 2=L)
+        """
+        boards, last_moves = self._prepare_batch(boards, last_moves)
+        
+        results = np.zeros(len(boards), dtype=np.int8)
+        for i in range(len(boards)):
+            history = self._batch_history(boards[i], last_moves[i])
+            results[i] = self.analyze(boards[i], history)
+        
+        return results
+    
+    def _prepare_batch(self, boards, last_moves):
+        """Yığın girdilerini doğrular ve tamsayı dizilere dönüştürür"""
+        boards = np.asarray(boards)
+        if boards.ndim != 3 or boards.shape[1:] != (5, 5):
+            raise ValueError("boards Nx5x5 boyutunda olmalıdır")
+        
+        if last_moves is None:
+            last_moves = np.zeros((len(boards), 3), dtype=np.int64)
+        else:
+            last_moves = np.asarray(last_moves, dtype=np.int64)
+            if last_moves.shape != (len(boards), 3):
+                raise ValueError("last_moves Nx3 boyutunda olmalıdır")
+        
+        return boards.astype(np.int8, copy=False), last_moves
+    
+    def _batch_history(self, board, last_move):
+        """Yığındaki bir matris için skaler analize uygun geçmiş listesi oluşturur
+        
+        Geçmiş her zaman matristeki dolu hücrelerden oluşur; son hamle listenin
+        sonuna konur. Son hamle yoksa geçmiş verilmez.
+        """
+        row, col, value = (int(v) for v in last_move)
+        if value == 0:
+            return None
+        
+        history = [(r, c, int(board[r, c])) for r, c in zip(*np.nonzero(board))
+                   if (r, c) != (row, col)]
+        history.append((row, col, value))
+        return history
+    
+    def _batch_basic_stats(self, boards):
+        """Yığın için temel istatistikleri hesaplar
+        
+        Returns:
+            dict: w_mask, l_mask, w_count, l_count, total ve prediction dizileri;
+                prediction yetersiz veride 0'dır
+        """
+        w_mask = boards == 1
+        l_mask = boards == 2
+        
+        # Değer toplamı s = W + 2L ve dolu hücre sayısı n'den: W = 2n - s, L = s - n
+        flat = boards.reshape(len(boards), 25)
+        ones = np.ones(25, dtype=np.float32)
+        value_sum = (flat.astype(np.float32) @ ones).astype(np.int64)
+        total = ((flat != 0).astype(np.float32) @ ones).astype(np.int64)
+        w_count = 2 * total - value_sum
+        l_count = value_sum - total
+        
+        # W oranı L oranından büyükse W, değilse L; yetersiz veride belirsiz
+        prediction = np.where(w_count > l_count, 1, 2).astype(np.int8)
+        prediction[total < self.min_data_points] = 0
+        
+        return {
+            'w_mask': w_mask,
+            'l_mask': l_mask,
+            'w_count': w_count,
+            'l_count': l_count,
+            'total': total,
+            'prediction': prediction
+        }
+    
+    def _shape_vote(self, features, shape_bits, min_cells=4):
+        """Şekil ortalamalarına göre tahmin (L ve T şekli modelleri)
+        
+        Her şeklin W ve dolu hücre sayıları 25 bitlik maskelerin bit sayımıyla
+        bulunur; oranlar şekil sırasıyla toplanır (_batch_shape_vote ile aynı).
+        
+        Args:
+            features (MatrixFeatures): Bu adımın matris özellikleri
+            shape_bits (tuple): Şekillerin 25 bitlik hücre maskeleri
+            min_cells (int, optional): Bir şeklin sayılması için gereken dolu hücre sayısı
+        
+        Returns:
+            int: Tahmin (0=belirgin pattern yok, 1=W, 2=L)
+        """
+        w_bits = features.w_bits
+        filled_bits = w_bits | features.l_bits
+        
+        w_prob = 0
+        l_prob = 0
+        total_shapes = 0
+        for bits in shape_bits:
+            total = popcount(filled_bits & bits)
+            if total >= min_cells:
+                w_count = popcount(w_bits & bits)
+                w_prob += w_count / total
+                l_prob += (total - w_count) / total
+                total_shapes += 1
+        
+        if total_shapes > 0:
+            w_prob /= total_shapes
+            l_prob /= total_shapes
+            
+            if w_prob > l_prob:
+                return 1  # W tahmini
+            elif l_prob > w_prob:
+                return 2  # L tahmini
+        return 0
+    
+    def _batch_shape_vote(self, boards, stats, membership, min_cells=4):
+        """Şekil ortalamalarına göre yığın tahmini (L ve T şekli modelleri)
+        
+        En az `min_cells` dolu hücresi olan şekillerin W/L oranlarının ortalaması
+        karşılaştırılır. Oranlar skaler yoldaki şekil sırasıyla toplanır; katkısı
+        olmayan şekiller 0.0 ekler ve toplamı değiştirmez.
+        
+        Args:
+            boards (numpy.ndarray): Nx5x5 matris yığını
+            stats (dict): _batch_basic_stats() sonucu
+            membership (numpy.ndarray): Kx25 float32 şekil üyelik matrisi
+            min_cells (int, optional): Bir şeklin sayılması için gereken dolu hücre sayısı
+        
+        Returns:
+            numpy.ndarray: N uzunluğunda tahminler (0=belirsiz, 1=W, 2=L)
+        """
+        flat = boards.reshape(len(boards), 25)
+        w_counts = (membership @ (flat == 1).T.astype(np.float32)).astype(np.int64)
+        filled = (membership @ (flat != 0).T.astype(np.float32)).astype(np.int64)
+        
+        counted = filled >= min_cells
+        with np.errstate(divide='ignore', invalid='ignore'):
+            w_terms = np.where(counted, w_counts / filled, 0.0)
+            l_terms = np.where(counted, (filled - w_counts) / filled, 0.0)
+            
+            # Şekiller sırayla eklenir; cumsum her zaman sırayla toplar (sum() tek
+            # matrislik yığında ikili toplama yapıp farklı yuvarlayabilir)
+            shapes = counted.sum(axis=0)
+            w_prob = np.cumsum(w_terms, axis=0)[-1] / shapes
+            l_prob = np.cumsum(l_terms, axis=0)[-1] / shapes
+        
+        result = stats['prediction'].copy()
+        result[(shapes > 0) & (w_prob > l_prob)] = 1
+        result[(shapes > 0) & (l_prob > w_prob)] = 2
+        result[stats['total'] < self.min_data_points] = 0
+        return result
+    
+    def _batch_sequence_vote(self, sequences):
+        """Dizilerin son ikilisinden sonra gelen değerlere göre yığın oyu
+        
+        Her dizinin boş hücreleri atılır; son üç değerin ilk ikisi pattern olur ve
+        bu ikiliyi izleyen W/L değerleri sayılır (Spiral ve Zig-Zag modelleri).
+        
+        Args:
+            sequences (numpy.ndarray): NxL hücre değerleri, gezinme sırasıyla (0=boş)
+        
+        Returns:
+            tuple: (N tahmin; 3'ten az değerde 0, N güven; 3'ten az değerde 0.0)
+        """
+        count, length = sequences.shape
+        
+        # Dolu hücreleri sıralarını koruyarak başa topla
+        order = np.argsort(sequences == 0, axis=1, kind='stable')
+        packed = np.take_along_axis(sequences, order, axis=1)
+        filled = np.count_nonzero(sequences, axis=1)
+        
+        rows = np.arange(count)
+        first = packed[rows, np.maximum(filled - 3, 0)][:, None]
+        second = packed[rows, np.maximum(filled - 2, 0)][:, None]
+        
+        matches = ((packed[:, :-2] == first) & (packed[:, 1:-1] == second)
+                   & (np.arange(length - 2) < (filled - 2)[:, None]))
+        following = packed[:, 2:]
+        w_count = np.count_nonzero(matches & (following == 1), axis=1)
+        l_count = np.count_nonzero(matches & (following == 2), axis=1)
+        
+        valid = (filled >= 3) & (w_count + l_count > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            w_prob = w_count / (w_count + l_count)
+            l_prob = l_count / (w_count + l_count)
+        
+        prediction = np.where(valid, np.where(w_prob > l_prob, 1, 2), 0).astype(np.int8)
+        confidence = np.where(valid, np.maximum(w_prob, l_prob), 0.0)
+        return prediction, confidence
+    
+    def _calculate_basic_stats(self, matrix, features=None):
+        """Temel istatistikleri hesaplar (varsa paylaşılan özelliklerden)"""
+        # W ve L sayıları
+        if features is not None:
+            w_count = features.w_count
+            l_count = features.l_count
+        else:
+            w_count = np.sum(matrix == 1)
+            l_count = np.sum(matrix == 2)
+        total = w_count + l_count
+        
+        # Boş hücre yoksa veya yeterli veri yoksa analiz yapma
+        if total < self.min_data_points:
+            return {
+                'prediction': 0,
+                'confidence': 0,
+                'w_probability': 0,
+                'l_probability': 0,
+                'w_count': w_count,
+                'l_count': l_count,
+                'total': total
+            }
+        
+        # W ve L oranları
+        w_ratio = w_count / total if total > 0 else 0
+        l_ratio = l_count / total if total > 0 else 0
+        
+        # Basit olasılık tahmini
+        if w_ratio > l_ratio:
+            prediction = 1  # W
+            confidence = w_ratio
+        else:
+            prediction = 2  # L
+            confidence = l_ratio
+        
+        return {
+            'prediction': prediction,
+            'confidence': confidence,
+            'w_probability': w_ratio,
+            'l_probability': l_ratio,
+            'w_count': w_count,
+            'l_count': l_count,
+            'total': total
+        }
\ No newline at end of file
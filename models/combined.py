@@ -1,94 +1,111 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-W ve L Pattern Analiz Uygulaması
-Karma Analiz Modeli
-"""
-
-import numpy as np
-from models.base_model import BaseAnalysisModel
-from models.diagonal import DiagonalAnalysis
-from models.rectangle import RectangleAnalysis
-from models.lshape import LShapeAnalysis
-from models.tshape import TShapeAnalysis
-from models.spiral import SpiralAnalysis
-from models.neighborhood import NeighborhoodAnalysis
-from models.zigzag import ZigzagAnalysis
-from models.scatter import ScatterAnalysis
-from models.quadrant import QuadrantAnalysis
-from models.symmetry import SymmetryAnalysis
-from models.border import BorderAnalysis
-from models.heatmap import HeatmapAnalysis
-
-class CombinedAnalysis(BaseAnalysisModel):
-    """Tüm modelleri birleştiren karma model"""
-    
-    def __init__(self):
-        super().__init__()
-        self.name = "Karma Analiz"
-        self.description = "Tüm analiz modellerini birleştirerek en güvenilir tahmini yapar."
-        self.min_data_points = 5
-        
-        # Tüm alt modelleri oluştur
-        self.models = [
-            DiagonalAnalysis(),
-            RectangleAnalysis(),
-            LShapeAnalysis(),
-            TShapeAnalysis(),
-            SpiralAnalysis(),
-            NeighborhoodAnalysis(),
-            ZigzagAnalysis(),
-            ScatterAnalysis(),
-            QuadrantAnalysis(),
-            SymmetryAnalysis(),
-            BorderAnalysis(),
-            HeatmapAnalysis()
-        ]
-    
-    def analyze(self, matrix, history=None):
-        """
-        Tüm modelleri kullanarak karma analiz yapar
-        
-        Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
-            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
-            
-        Returns:
-            int: Tahmin (0=belirsiz, 1=W, 2=L)
-        """
-        # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
-        
-        if stats['total'] < self.min_data_points:
-            return 0  # Yetersiz veri
-        
-        # Her modelden tahmin al
-        results = {}
-        for model in self.models:
-            prediction = model.analyze(matrix, history)
-            
-            if prediction not in results:
-                results[prediction] = 0
-            
-            results[prediction] += 1
-        
-        # Tahmin çoğunluğuna göre karar ver
-        if 0 in results:
-            del results[0]  # Belirsiz tahminleri çıkar
-        
-        if not results:
-            return stats['prediction']  # Hiçbir model tahmin yapamadıysa genel istatistik
-        
-        # En çok oy alan tahmini bul
-        max_votes = max(results.values())
-        top_predictions = [pred for pred, votes in results.items() if votes == max_votes]
-        
-        if len(top_predictions) == 1:
-            return top_predictions[0]  # Tekil en iyi tahmin
-        else:
-            # Eşit oy varsa genel istatistiklere göre karar ver
-            if stats['w_probability'] > stats['l_probability']:
-                return 1  # W
-            else:
-                return 2  # L
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Karma Analiz Modeli
+"""
+
+import numpy as np
+from core.features import ensure_features
+from models.base_model import BaseAnalysisModel
+from models.registry import ModelRegistry, base_model_names
+
+class CombinedAnalysis(BaseAnalysisModel):
+    """Tüm modelleri birleştiren karma model"""
+    
+    def __init__(self):
+        super().__init__()
+        self.name = "Karma Analiz"
+        self.description = "Tüm analiz modellerini birleştirerek en güvenilir tahmini yapar."
+        self.min_data_points = 5
+        
+        # Tüm alt modeller (arayüzdeki görünen adlarıyla); yalnızca hazır tahmini
+        # verilmeyen modeller ilk kullanımda oluşturulur
+        self.models = ModelRegistry(base_model_names())
+    
+    def analyze(self, matrix, history=None, predictions=None, features=None):
+        """
+        Tüm modelleri kullanarak karma analiz yapar
+        
+        Args:
+            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            predictions (dict, optional): Bu adım için önceden hesaplanmış model tahminleri
+            features (MatrixFeatures, optional): Bu adım için paylaşılan matris özellikleri
+            
+        Returns:
+            int: Tahmin (0=belirsiz, 1=W, 2=L)
+        """
+        # Temel istatistikler
+        features = ensure_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
+        
+        if stats['total'] < self.min_data_points:
+            return 0  # Yetersiz veri
+        
+        # Her modelden tahmin al
+        results = {}
+        for model_name in self.models:
+            # Hazır tahmin varsa modeli yeniden çalıştırma
+            if predictions is not None and model_name in predictions:
+                prediction = predictions[model_name]
+            else:
+                prediction = self.models[model_name].analyze(matrix, history, features=features)
+            
+            if prediction not in results:
+                results[prediction] = 0
+            
+            results[prediction] += 1
+        
+        # Tahmin çoğunluğuna göre karar ver
+        if 0 in results:
+            del results[0]  # Belirsiz tahminleri çıkar
+        
+        if not results:
+            return stats['prediction']  # Hiçbir model tahmin yapamadıysa genel istatistik
+        
+        # En çok oy alan tahmini bul
+        max_votes = max(results.values())
+        top_predictions = [pred for pred, votes in results.items() if votes == max_votes]
+        
+        if len(top_predictions) == 1:
+            return top_predictions[0]  # Tekil en iyi tahmin
+        else:
+            # Eşit oy varsa genel istatistiklere göre karar ver
+            if stats['w_probability'] > stats['l_probability']:
+                return 1  # W
+            else:
+                return 2  # L
+    
+    def analyze_batch(self, boards, last_moves=None, predictions=None):
+        """
+        Karma analizi bir matris yığını için vektörel olarak yapar
+        
+        Args:
+            boards (numpy.ndarray): Nx5x5 matris yığını, 0=boş, 1=W, 2=L
+            last_moves (numpy.ndarray, optional): Nx3 son hamleler (row, col, value)
+            predictions (dict, optional): Model adı -> N uzunluğunda hazır tahminler;
+                eksik modeller analyze_batch ile çalıştırılır
+        
+        Returns:
+            numpy.ndarray: N uzunluğunda tahminler (0=belirsiz, 1=W, 2=L)
+        """
+        boards, last_moves = self._prepare_batch(boards, last_moves)
+        stats = self._batch_basic_stats(boards)
+        
+        votes = np.array([
+            predictions[model_name] if predictions is not None and model_name in predictions
+            else self.models[model_name].analyze_batch(boards, last_moves)
+            for model_name in self.models
+        ]).reshape(len(self.models), len(boards))
+        w_votes = np.count_nonzero(votes == 1, axis=0)
+        l_votes = np.count_nonzero(votes == 2, axis=0)
+        
+        # Eşit oyda (veya hiç oy yoksa) genel istatistik; W ve L oranları aynı
+        # toplama bölündüğünden karşılaştırma sayımlarla aynıdır
+        result = stats['prediction'].copy()
+        result[w_votes > l_votes] = 1
+        result[l_votes > w_votes] = 2
+        result[stats['total'] < self.min_data_points] = 0
+        return result
@@ -1,97 +1,172 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-W ve L Pattern Analiz Uygulaması
-Çapraz (Diagonal) Pattern Analiz Modeli
-"""
-
-import numpy as np
-from models.base_model import BaseAnalysisModel
-
-class DiagonalAnalysis(BaseAnalysisModel):
-    """Çapraz patternleri analiz eden model"""
-    
-    def __init__(self):
-        super().__init__()
-        self.name = "Çapraz (Diagonal) Pattern Analizi"
-        self.description = "5x5 matriste sol üstten sağ alta ve sağ üstten sol alta çapraz olarak ilerleyen patternleri analiz eder."
-        self.min_data_points = 5
-    
-    def analyze(self, matrix, history=None):
-        """
-        Çapraz patternleri analiz eder
-        
-        Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
-            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
-            
-        Returns:
-            int: Tahmin (0=belirsiz, 1=W, 2=L)
-        """
-        # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
-        
-        if stats['total'] < self.min_data_points:
-            return 0  # Yetersiz veri
-        
-        # Çapraz patternleri topla
-        diagonals = []
-        
-        # Ana köşegen ve paralelleri (sol üst - sağ alt)
-        for offset in range(-4, 5):
-            diagonal = np.diag(matrix, offset)
-            diagonals.append(diagonal)
-        
-        # Ters köşegen ve paralelleri (sağ üst - sol alt)
-        flipped = np.fliplr(matrix)
-        for offset in range(-4, 5):
-            diagonal = np.diag(flipped, offset)
-            diagonals.append(diagonal)
-        
-        # Her çapraz için W/L oranını kontrol et
-        w_prob = 0
-        l_prob = 0
-        total_patterns = 0
-        
-        for diagonal in diagonals:
-            if len(diagonal) >= 3:  # En az 3 uzunluğunda patternler
-                values = [v for v in diagonal if v > 0]  # Boş olmayanlar
-                
-                if len(values) >= 3:
-                    w_count = values.count(1)
-                    l_count = values.count(2)
-                    
-                    # Son iki değere göre tahmin yap
-                    if len(values) >= 3 and values[-3] > 0 and values[-2] > 0:
-                        pattern = (values[-3], values[-2])
-                        
-                        # Bu pattern önceden kaç kez W/L ile devam etmiş
-                        w_pattern = 0
-                        l_pattern = 0
-                        
-                        for i in range(len(values) - 2):
-                            if values[i] == pattern[0] and values[i+1] == pattern[1]:
-                                if i+2 < len(values):
-                                    if values[i+2] == 1:
-                                        w_pattern += 1
-                                    elif values[i+2] == 2:
-                                        l_pattern += 1
-                        
-                        if w_pattern + l_pattern > 0:
-                            w_prob += w_pattern / (w_pattern + l_pattern)
-                            l_prob += l_pattern / (w_pattern + l_pattern)
-                            total_patterns += 1
-        
-        # Sonucu belirle
-        if total_patterns > 0:
-            w_prob /= total_patterns
-            l_prob /= total_patterns
-            
-            if w_prob > l_prob:
-                return 1  # W tahmini
-            elif l_prob > w_prob:
-                return 2  # L tahmini
-        
-        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Çapraz (Diagonal) Pattern Analiz Modeli
+"""
+
+import numpy as np
+from core.features import DIAGONAL_BOUNDS, DIAGONAL_CELLS, ensure_features
+from models.base_model import BaseAnalysisModel
+
+_POWERS_OF_3 = 3 ** np.arange(5)
+
+# Uzunluk -> (w_tablosu, l_tablosu, geçerlilik_tablosu)
+_DIAGONAL_TABLES = {}
+
+class DiagonalAnalysis(BaseAnalysisModel):
+    """Çapraz patternleri analiz eden model"""
+    
+    def __init__(self):
+        super().__init__()
+        self.name = "Çapraz (Diagonal) Pattern Analizi"
+        self.description = "5x5 matriste sol üstten sağ alta ve sağ üstten sol alta çapraz olarak ilerleyen patternleri analiz eder."
+        self.min_data_points = 5
+    
+    def analyze(self, matrix, history=None, features=None):
+        """
+        Çapraz patternleri analiz eder
+        
+        Args:
+            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (MatrixFeatures, optional): Bu adım için paylaşılan matris özellikleri
+            
+        Returns:
+            int: Tahmin (0=belirsiz, 1=W, 2=L)
+        """
+        # Temel istatistikler
+        features = ensure_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
+        
+        if stats['total'] < self.min_data_points:
+            return 0  # Yetersiz veri
+        
+        # Çapraz patternleri topla
+        # Ana köşegen ve paralelleri (sol üst - sağ alt) ile
+        # ters köşegen ve paralelleri (sağ üst - sol alt); tümü tek indeks dizisiyle okunur
+        values = features.diagonal_values.tolist()
+        diagonals = [values[start:end] for start, end in DIAGONAL_BOUNDS]
+        
+        # Her çapraz için W/L oranını kontrol et
+        w_prob = 0
+        l_prob = 0
+        total_patterns = 0
+        
+        for diagonal in diagonals:
+            scores = self._score_diagonal(diagonal)
+            if scores is not None:
+                w_prob += scores[0]
+                l_prob += scores[1]
+                total_patterns += 1
+        
+        # Sonucu belirle
+        if total_patterns > 0:
+            w_prob /= total_patterns
+            l_prob /= total_patterns
+            
+            if w_prob > l_prob:
+                return 1  # W tahmini
+            elif l_prob > w_prob:
+                return 2  # L tahmini
+        
+        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
+        return stats['prediction']
+    
+    def _score_diagonal(self, diagonal):
+        """
+        Tek bir çaprazdaki son iki değerden oluşan patternin devam olasılıkları
+        
+        Returns:
+            tuple: (w_olasılığı, l_olasılığı), pattern yoksa None
+        """
+        if len(diagonal) < 3:  # En az 3 uzunluğunda patternler
+            return None
+        
+        values = [v for v in diagonal if v > 0]  # Boş olmayanlar
+        if len(values) < 3:
+            return None
+        
+        # Son iki değere göre tahmin yap
+        pattern = (values[-3], values[-2])
+        
+        # Bu pattern önceden kaç kez W/L ile devam etmiş
+        w_pattern = 0
+        l_pattern = 0
+        
+        for i in range(len(values) - 2):
+            if values[i] == pattern[0] and values[i+1] == pattern[1]:
+                if values[i+2] == 1:
+                    w_pattern += 1
+                elif values[i+2] == 2:
+                    l_pattern += 1
+        
+        if w_pattern + l_pattern == 0:
+            return None
+        
+        return (w_pattern / (w_pattern + l_pattern), l_pattern / (w_pattern + l_pattern))
+    
+    def analyze_batch(self, boards, last_moves=None):
+        """
+        Çapraz patternleri bir matris yığını için vektörel olarak analiz eder
+        
+        Her çaprazın içeriği taban-3 koda çevrilir; olası tüm içerikler için
+        skorlar bir kez hesaplanıp tablodan okunur.
+        
+        Args:
+            boards (numpy.ndarray): Nx5x5 matris yığını, 0=boş, 1=W, 2=L
+            last_moves (numpy.ndarray, optional): Nx3 son hamleler (kullanılmaz)
+        
+        Returns:
+            numpy.ndarray: N uzunluğunda tahminler (0=belirsiz, 1=W, 2=L)
+        """
+        boards, last_moves = self._prepare_batch(boards, last_moves)
+        stats = self._batch_basic_stats(boards)
+        flat = boards.reshape(len(boards), 25)
+        
+        w_prob = np.zeros(len(boards))
+        l_prob = np.zeros(len(boards))
+        total_patterns = np.zeros(len(boards), dtype=np.int64)
+        
+        # Skaler yoldaki sırayla topla (aynı kayan nokta sonucu için)
+        for cells in DIAGONAL_CELLS:
+            if len(cells) < 3:
+                continue
+            
+            w_table, l_table, valid_table = self._diagonal_tables(len(cells))
+            codes = flat[:, cells] @ _POWERS_OF_3[:len(cells)]
+            w_prob += w_table[codes]
+            l_prob += l_table[codes]
+            total_patterns += valid_table[codes]
+        
+        # Sonucu belirle
+        has_patterns = total_patterns > 0
+        divisor = np.maximum(total_patterns, 1)
+        w_prob /= divisor
+        l_prob /= divisor
+        
+        result = stats['prediction'].copy()
+        result[has_patterns & (w_prob > l_prob)] = 1
+        result[has_patterns & (l_prob > w_prob)] = 2
+        result[stats['total'] < self.min_data_points] = 0
+        return result
+    
+    def _diagonal_tables(self, length):
+        """Verilen uzunluktaki tüm çapraz içerikleri için skor tablolarını döndürür"""
+        if length not in _DIAGONAL_TABLES:
+            size = 3 ** length
+            w_table = np.zeros(size)
+            l_table = np.zeros(size)
+            valid_table = np.zeros(size, dtype=np.int64)
+            
+            for code in range(size):
+                values = [(code // 3 ** k) % 3 for k in range(length)]
+                scores = self._score_diagonal(values)
+                if scores is not None:
+                    w_table[code], l_table[code] = scores
+                    valid_table[code] = 1
+            
+            _DIAGONAL_TABLES[length] = (w_table, l_table, valid_table)
+        
+        return _DIAGONAL_TABLES[length]
@@ -1,151 +1,215 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-W ve L Pattern Analiz Uygulaması
-Yoğunluk Haritası Analiz Modeli
-"""
-
-import numpy as np
-from models.base_model import BaseAnalysisModel
-
-class HeatmapAnalysis(BaseAnalysisModel):
-    """Yoğunluk haritası analizini yapan model"""
-    
-    def __init__(self):
-        super().__init__()
-        self.name = "Yoğunluk Haritası Analizi"
-        self.description = "W ve L sonuçlarının matris üzerindeki yoğunluğunu ısı haritası olarak görselleştirerek yoğun bölgelerdeki değişimleri analiz eder."
-        self.min_data_points = 5
-    
-    def analyze(self, matrix, history=None):
-        """
-        Yoğunluk haritası analizini yapar
-        
-        Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
-            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
-            
-        Returns:
-            int: Tahmin (0=belirsiz, 1=W, 2=L)
-        """
-        # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
-        
-        if stats['total'] < self.min_data_points:
-            return 0  # Yetersiz veri
-        
-        # W ve L yoğunluk haritaları oluştur
-        w_heatmap = np.zeros((5, 5))
-        l_heatmap = np.zeros((5, 5))
-        
-        # 3x3 pencerelerle yoğunluk hesapla
-        for row in range(3):
-            for col in range(3):
-                window = matrix[row:row+3, col:col+3]
-                
-                w_count = np.sum(window == 1)
-                l_count = np.sum(window == 2)
-                
-                # Merkez hücredeki yoğunluğu artır
-                w_heatmap[row+1, col+1] += w_count / 9  # Normalize
-                l_heatmap[row+1, col+1] += l_count / 9  # Normalize
-        
-        # Kenar hücreler için daha küçük pencereler kullan
-        # Üst kenar
-        for col in range(1, 4):
-            window = matrix[0:2, col-1:col+2]
-            w_count = np.sum(window == 1)
-            l_count = np.sum(window == 2)
-            w_heatmap[0, col] += w_count / 6  # Normalize
-            l_heatmap[0, col] += l_count / 6  # Normalize
-        
-        # Alt kenar
-        for col in range(1, 4):
-            window = matrix[3:5, col-1:col+2]
-            w_count = np.sum(window == 1)
-            l_count = np.sum(window == 2)
-            w_heatmap[4, col] += w_count / 6  # Normalize
-            l_heatmap[4, col] += l_count / 6  # Normalize
-        
-        # Sol kenar
-        for row in range(1, 4):
-            window = matrix[row-1:row+2, 0:2]
-            w_count = np.sum(window == 1)
-            l_count = np.sum(window == 2)
-            w_heatmap[row, 0] += w_count / 6  # Normalize
-            l_heatmap[row, 0] += l_count / 6  # Normalize
-        
-        # Sağ kenar
-        for row in range(1, 4):
-            window = matrix[row-1:row+2, 3:5]
-            w_count = np.sum(window == 1)
-            l_count = np.sum(window == 2)
-            w_heatmap[row, 4] += w_count / 6  # Normalize
-            l_heatmap[row, 4] += l_count / 6  # Normalize
-        
-        # Köşeler için 2x2 pencere
-        corners = [(0,0), (0,4), (4,0), (4,4)]
-        for row, col in corners:
-            r_start = max(0, row-1)
-            r_end = min(5, row+2)
-            c_start = max(0, col-1)
-            c_end = min(5, col+2)
-            
-            window = matrix[r_start:r_end, c_start:c_end]
-            w_count = np.sum(window == 1)
-            l_count = np.sum(window == 2)
-            
-            window_size = (r_end-r_start) * (c_end-c_start)
-            w_heatmap[row, col] += w_count / window_size  # Normalize
-            l_heatmap[row, col] += l_count / window_size  # Normalize
-        
-        # Yoğunluk haritalarına göre tahmin
-        if history and len(history) > 0:
-            last_row, last_col, last_val = history[-1]
-            
-            # Son hamlenin çevresindeki yoğunluğa bak
-            neighbors = []
-            for dr in [-1, 0, 1]:
-                for dc in [-1, 0, 1]:
-                    if dr == 0 and dc == 0:
-                        continue
-                    
-                    r, c = last_row + dr, last_col + dc
-                    if 0 <= r < 5 and 0 <= c < 5 and matrix[r, c] == 0:
-                        # Bu boş hücre için W ve L yoğunlukları
-                        w_density = w_heatmap[r, c]
-                        l_density = l_heatmap[r, c]
-                        
-                        if w_density > 0 or l_density > 0:
-                            neighbors.append((r, c, w_density, l_density))
-            
-            if neighbors:
-                # En yüksek yoğunluğa sahip komşuyu bul
-                max_density = max(neighbors, key=lambda x: max(x[2], x[3]))
-                r, c, w_dens, l_dens = max_density
-                
-                # Yoğunluk farkı belirgin mi?
-                if abs(w_dens - l_dens) > 0.2:
-                    if w_dens > l_dens:
-                        return 1  # W
-                    else:
-                        return 2  # L
-                
-                # Belirgin fark yoksa, W/L alternatif olarak gelir
-                if last_val == 1:
-                    return 2  # W sonrası L
-                else:
-                    return 1  # L sonrası W
-        
-        # Matrisin tamamındaki yoğunluk dağılımını analiz et
-        w_hotspots = np.sum(w_heatmap > 0.5)  # W yoğun bölgeler
-        l_hotspots = np.sum(l_heatmap > 0.5)  # L yoğun bölgeler
-        
-        if w_hotspots > l_hotspots and w_hotspots >= 2:
-            return 1  # W tahmini
-        elif l_hotspots > w_hotspots and l_hotspots >= 2:
-            return 2  # L tahmini
-        
-        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Yoğunluk Haritası Analiz Modeli
+"""
+
+import numpy as np
+from core.features import ensure_features
+from models.base_model import BaseAnalysisModel
+
+def _build_cell_codes():
+    """Hücre kodu hesaplama matrislerini ve kod -> yoğunluk tablolarını oluşturur
+    
+    Her hücrenin kodu dolu_mu*512 + pencere_W*16 + pencere_L olarak bulunur.
+    Hücre değeri v (0, 1, 2) ve doluluk n (0, 1) için W = 2n - v ve L = v - n
+    olduğundan kod, v ve n üzerinden iki matris çarpımıyla hesaplanır. Pencere
+    hücrenin çevresindeki 3x3 bölgenin matris içinde kalan kısmıdır (analyze()
+    içindeki iç, kenar ve köşe pencereleri). 26. hücre matris dışı komşular
+    içindir; kodu her zaman 0'dır.
+    
+    Tablolar hücre*1024 + kod ile indekslenir ve yoğunlukları analyze() ile aynı
+    bölme işlemiyle hesaplar.
+    """
+    windows = np.zeros((25, 26), dtype=np.float32)
+    sizes = np.ones(26, dtype=np.int64)
+    for row in range(5):
+        for col in range(5):
+            cell = row * 5 + col
+            window = np.zeros((5, 5), dtype=np.float32)
+            window[max(0, row-1):min(5, row+2), max(0, col-1):min(5, col+2)] = 1
+            windows[:, cell] = window.ravel()
+            sizes[cell] = int(window.sum())
+    
+    value_weights = -15 * windows
+    filled_weights = 31 * windows + 512 * np.eye(25, 26, dtype=np.float32)
+    
+    w_density = np.zeros(26 * 1024)
+    l_density = np.zeros(26 * 1024)
+    neighbor_key = np.full(26 * 1024, -1.0)
+    hotspots = np.zeros(26 * 1024, dtype=np.int16)
+    for cell in range(26):
+        for filled in (0, 1):
+            for w_count in range(sizes[cell] + 1):
+                for l_count in range(sizes[cell] + 1 - w_count):
+                    index = cell * 1024 + filled * 512 + w_count * 16 + l_count
+                    w_dens = w_count / sizes[cell]
+                    l_dens = l_count / sizes[cell]
+                    w_density[index] = w_dens
+                    l_density[index] = l_dens
+                    
+                    # Yoğun bölge sayacı: W için 1, L için 32
+                    hotspots[index] = (w_dens > 0.5) + 32 * (l_dens > 0.5)
+                    
+                    # Boş ve yoğunluğu olan komşular aday olur
+                    if not filled and (w_dens > 0 or l_dens > 0):
+                        neighbor_key[index] = max(w_dens, l_dens)
+    
+    return (value_weights, filled_weights, np.arange(26, dtype=np.int32) * 1024,
+            w_density, l_density, neighbor_key, hotspots)
+
+(VALUE_WEIGHTS, FILLED_WEIGHTS, CELL_OFFSETS,
+ W_DENSITY, L_DENSITY, NEIGHBOR_KEY, HOTSPOTS) = _build_cell_codes()
+
+def _build_neighbor_cells():
+    """Her hücre için 8 komşunun düz indekslerini analyze() tarama sırasıyla döndürür
+    
+    Matris dışına taşan komşular 25 numaralı boş (yoğunluğu 0) hücreye yönlenir.
+    """
+    neighbors = np.full((25, 8), 25, dtype=np.intp)
+    for row in range(5):
+        for col in range(5):
+            offsets = [(dr, dc) for dr in [-1, 0, 1] for dc in [-1, 0, 1] if (dr, dc) != (0, 0)]
+            for k, (dr, dc) in enumerate(offsets):
+                r, c = row + dr, col + dc
+                if 0 <= r < 5 and 0 <= c < 5:
+                    neighbors[row * 5 + col, k] = r * 5 + c
+    return neighbors
+
+NEIGHBOR_CELLS = _build_neighbor_cells()
+
+class HeatmapAnalysis(BaseAnalysisModel):
+    """Yoğunluk haritası analizini yapan model"""
+    
+    def __init__(self):
+        super().__init__()
+        self.name = "Yoğunluk Haritası Analizi"
+        self.description = "W ve L sonuçlarının matris üzerindeki yoğunluğunu ısı haritası olarak görselleştirerek yoğun bölgelerdeki değişimleri analiz eder."
+        self.min_data_points = 5
+    
+    def analyze(self, matrix, history=None, features=None):
+        """
+        Yoğunluk haritası analizini yapar
+        
+        Args:
+            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (MatrixFeatures, optional): Bu adım için paylaşılan matris özellikleri
+            
+        Returns:
+            int: Tahmin (0=belirsiz, 1=W, 2=L)
+        """
+        # Temel istatistikler
+        features = ensure_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
+        
+        if stats['total'] < self.min_data_points:
+            return 0  # Yetersiz veri
+        
+        # W ve L yoğunluk haritaları: her hücrenin 3x3 penceresindeki sayım, pencerenin
+        # matris içindeki hücre sayısına bölünür (içte 9, kenarda 6, köşede 4)
+        w_heatmap, l_heatmap = features.densities
+        
+        # Yoğunluk haritalarına göre tahmin
+        if history and len(history) > 0:
+            last_row, last_col, last_val = history[-1]
+            
+            # Son hamlenin çevresindeki yoğunluğa bak
+            neighbors = []
+            for dr in [-1, 0, 1]:
+                for dc in [-1, 0, 1]:
+                    if dr == 0 and dc == 0:
+                        continue
+                    
+                    r, c = last_row + dr, last_col + dc
+                    if 0 <= r < 5 and 0 <= c < 5 and matrix[r, c] == 0:
+                        # Bu boş hücre için W ve L yoğunlukları
+                        w_density = w_heatmap[r, c]
+                        l_density = l_heatmap[r, c]
+                        
+                        if w_density > 0 or l_density > 0:
+                            neighbors.append((r, c, w_density, l_density))
+            
+            if neighbors:
+                # En yüksek yoğunluğa sahip komşuyu bul
+                max_density = max(neighbors, key=lambda x: max(x[2], x[3]))
+                r, c, w_dens, l_dens = max_density
+                
+                # Yoğunluk farkı belirgin mi?
+                if abs(w_dens - l_dens) > 0.2:
+                    if w_dens > l_dens:
+                        return 1  # W
+                    else:
+                        return 2  # L
+                
+                # Belirgin fark yoksa, W/L alternatif olarak gelir
+                if last_val == 1:
+                    return 2  # W sonrası L
+                else:
+                    return 1  # L sonrası W
+        
+        # Matrisin tamamındaki yoğunluk dağılımını analiz et
+        w_hotspots = np.sum(w_heatmap > 0.5)  # W yoğun bölgeler
+        l_hotspots = np.sum(l_heatmap > 0.5)  # L yoğun bölgeler
+        
+        if w_hotspots > l_hotspots and w_hotspots >= 2:
+            return 1  # W tahmini
+        elif l_hotspots > w_hotspots and l_hotspots >= 2:
+            return 2  # L tahmini
+        
+        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
+        return stats['prediction']
+    
+    def analyze_batch(self, boards, last_moves=None):
+        """
+        Yoğunluk haritası analizini bir matris yığını için vektörel olarak yapar
+        
+        Tüm hücrelerin pencere sayımları matris çarpımlarıyla koda çevrilir,
+        yoğunluklar tablolardan okunur; komşu seçimi ve eşitlik durumları
+        analyze() ile aynıdır.
+        
+        Args:
+            boards (numpy.ndarray): Nx5x5 matris yığını, 0=boş, 1=W, 2=L
+            last_moves (numpy.ndarray, optional): Nx3 son hamleler (row, col, value)
+        
+        Returns:
+            numpy.ndarray: N uzunluğunda tahminler (0=belirsiz, 1=W, 2=L)
+        """
+        boards, last_moves = self._prepare_batch(boards, last_moves)
+        stats = self._batch_basic_stats(boards)
+        count = len(boards)
+        
+        # Her hücre için yoğunluk tablosu indeksi (Nx26)
+        values = boards.reshape(count, 25).astype(np.float32)
+        filled = (boards.reshape(count, 25) != 0).astype(np.float32)
+        codes = (values @ VALUE_WEIGHTS + filled @ FILLED_WEIGHTS).astype(np.int32) + CELL_OFFSETS
+        
+        # Matrisin tamamındaki yoğunluk dağılımı
+        hotspots = HOTSPOTS[codes].sum(axis=1)
+        w_hotspots = hotspots % 32
+        l_hotspots = hotspots // 32
+        
+        result = stats['prediction'].copy()
+        result[(w_hotspots > l_hotspots) & (w_hotspots >= 2)] = 1
+        result[(l_hotspots > w_hotspots) & (l_hotspots >= 2)] = 2
+        
+        # Son hamlenin çevresindeki boş ve yoğunluğu olan komşular
+        last_row, last_col, last_val = last_moves.T
+        neighbors = np.take_along_axis(codes, NEIGHBOR_CELLS[last_row * 5 + last_col], axis=1)
+        
+        # En yüksek yoğunluğa sahip ilk komşu (max() ile aynı eşitlik kuralı)
+        best = np.take_along_axis(neighbors, np.argmax(NEIGHBOR_KEY[neighbors], axis=1)[:, None],
+                                  axis=1)[:, 0]
+        w_dens = W_DENSITY[best]
+        l_dens = L_DENSITY[best]
+        
+        has_neighbors = (last_val != 0) & (NEIGHBOR_KEY[best] >= 0)
+        distinct = np.abs(w_dens - l_dens) > 0.2
+        neighbor_prediction = np.where(distinct, np.where(w_dens > l_dens, 1, 2),
+                                       np.where(last_val == 1, 2, 1))
+        result[has_neighbors] = neighbor_prediction[has_neighbors]
+        
+        result[stats['total'] < self.min_data_points] = 0
+        return result
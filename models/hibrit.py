@@ -1,192 +1,283 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-W ve L Pattern Analiz Uygulaması
-Geliştirilmiş Hibrit Analiz Modeli
-"""
-
-import numpy as np
-from models.base_model import BaseAnalysisModel
-
-class HibritAnalysis(BaseAnalysisModel):
-    """Geliştirilmiş hibrit model - Dinamik ağırlıklandırma, durum tespiti ve kalibrasyon"""
-    
-    def __init__(self):
-        super().__init__()
-        self.name = "Hibrit Analiz"
-        self.description = "Tüm modelleri akıllı birleştirme algoritması ile değerlendiren gelişmiş hibrit model."
-        self.min_data_points = 5
-        
-        # Minimum tahmin sayısı
-        self.min_predictions = 3
-        
-        # Durum tespiti için geçmiş durum ağırlıkları
-        self.pattern_state_weights = {
-            "consecutive_wins": {"T-Şekli": 1.2, "Serpme": 1.1, "Sınır": 1.3},
-            "consecutive_losses": {"L-Şekli": 1.2, "Komşuluk": 1.1, "Isı Haritası": 1.3},
-            "alternating": {"Çapraz (Diagonal)": 1.3, "Zig-Zag": 1.4, "Simetri": 1.2},
-            "win_dominant": {"Dikdörtgen": 1.2, "Spiral": 1.1, "Kuadran": 1.0},
-            "loss_dominant": {"Isı Haritası": 1.2, "Sınır": 1.1, "Serpme": 1.0},
-            "balanced": {"Karma Analiz": 1.1, "Kuadran": 1.0, "Komşuluk": 1.0}
-        }
-    
-    def analyze(self, matrix, history=None, model_stats=None):
-        """
-        Hibrit analiz yapar
-        
-        Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
-            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
-            model_stats (dict, optional): Mevcut model istatistikleri (UI tarafından sağlanır)
-            
-        Returns:
-            dict: Sonuç ve güven düzeyi içeren sözlük
-        """
-        # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
-        
-        if stats['total'] < self.min_data_points:
-            return {'prediction': 0, 'confidence': 0}  # Yetersiz veri
-        
-        # Model istatistikleri sağlanmadıysa, varsayılan tahmine dön
-        if not model_stats:
-            return {'prediction': stats['prediction'], 'confidence': 0.5}
-        
-        # Mevcut durum tespiti
-        current_state = self._detect_pattern_state(history, matrix)
-        
-        # Modelleri filtrele - Hibrit ve Karma modeli dahil etme
-        filtered_models = {k: v for k, v in model_stats.items() if k != "Hibrit Analiz" and k != "Karma Analiz"}
-        
-        # En az minimum tahmin sayısı kadar tahmin yapmış modelleri seç
-        qualified_models = {k: v for k, v in filtered_models.items() if v["total"] >= self.min_predictions}
-        
-        if not qualified_models:
-            # Yeterli tahmin yapan model yoksa, genel istatistiklere göre tahmin yap
-            return {'prediction': stats['prediction'], 'confidence': 0.5}
-        
-        # Model ağırlıklarını hesapla - başarı oranına, durum tipine ve tahmin sayısına göre
-        model_weights = self._calculate_weights(qualified_models, current_state)
-        
-        # W ve L için ağırlıklı oylar
-        w_vote = 0
-        l_vote = 0
-        
-        # Her modelden tahmin almak için tüm modelleri yeniden oluştur ve çalıştır
-        from models.diagonal import DiagonalAnalysis
-        from models.rectangle import RectangleAnalysis
-        from models.lshape import LShapeAnalysis
-        from models.tshape import TShapeAnalysis
-        from models.spiral import SpiralAnalysis
-        from models.neighborhood import NeighborhoodAnalysis
-        from models.zigzag import ZigzagAnalysis
-        from models.scatter import ScatterAnalysis
-        from models.quadrant import QuadrantAnalysis
-        from models.symmetry import SymmetryAnalysis
-        from models.border import BorderAnalysis
-        from models.heatmap import HeatmapAnalysis
-        from models.combined import CombinedAnalysis
-        
-        models = {
-            "Çapraz (Diagonal)": DiagonalAnalysis(),
-            "Dikdörtgen": RectangleAnalysis(),
-            "L-Şekli": LShapeAnalysis(),
-            "T-Şekli": TShapeAnalysis(),
-            "Spiral": SpiralAnalysis(),
-            "Komşuluk": NeighborhoodAnalysis(),
-            "Zig-Zag": ZigzagAnalysis(),
-            "Serpme": ScatterAnalysis(),
-            "Kuadran": QuadrantAnalysis(),
-            "Simetri": SymmetryAnalysis(),
-            "Sınır": BorderAnalysis(),
-            "Isı Haritası": HeatmapAnalysis(),
-            "Karma Analiz": CombinedAnalysis()
-        }
-        
-        # Her modelin tahminini al ve ağırlıklandır
-        for model_name, weight in model_weights.items():
-            model = models.get(model_name)
-            if model is None:
-                continue
-                
-            prediction = model.analyze(matrix, history)
-            
-            if prediction == 1:  # W tahmini
-                w_vote += weight
-            elif prediction == 2:  # L tahmini
-                l_vote += weight
-        
-        # Nihai tahmin ve güven değeri
-        if w_vote > l_vote:
-            total_vote = w_vote + l_vote
-            confidence = self._calibrate_confidence(w_vote / total_vote if total_vote > 0 else 0.6)
-            return {'prediction': 1, 'confidence': confidence}
-        elif l_vote > w_vote:
-            total_vote = w_vote + l_vote
-            confidence = self._calibrate_confidence(l_vote / total_vote if total_vote > 0 else 0.6)
-            return {'prediction': 2, 'confidence': confidence}
-        else:
-            # Eşitlik durumunda, genel istatistiklere göre karar ver
-            if stats['w_probability'] > stats['l_probability']:
-                return {'prediction': 1, 'confidence': 0.55}
-            else:
-                return {'prediction': 2, 'confidence': 0.55}
-    
-    def _detect_pattern_state(self, history, matrix):
-        """Mevcut durum tipini tespit eder"""
-        if not history or len(history) < 3:
-            return "balanced"
-            
-        # Son 3 sonuca bak
-        last_three = [h[2] for h in history[-3:]]
-        
-        if all(v == 1 for v in last_three):
-            return "consecutive_wins"
-        elif all(v == 2 for v in last_three):
-            return "consecutive_losses"
-        elif last_three == [1, 2, 1] or last_three == [2, 1, 2]:
-            return "alternating"
-        
-        # W/L oranına bak
-        w_count = sum(1 for _, _, v in history if v == 1)
-        l_count = sum(1 for _, _, v in history if v == 2)
-        
-        if w_count > l_count * 1.5:
-            return "win_dominant"
-        elif l_count > w_count * 1.5:
-            return "loss_dominant"
-            
-        return "balanced"
-    
-    def _calculate_weights(self, model_stats, current_state):
-        """Model ağırlıklarını hesaplar"""
-        weights = {}
-        
-        for model_name, stats in model_stats.items():
-            # Başarı oranı ağırlığı
-            success_weight = stats['success_rate'] / 100.0
-            
-            # Tecrübe ağırlığı - daha fazla tahmin yapmış modeller bonus alır
-            experience_factor = min(stats['total'] / 20.0, 1.0) * 0.2 + 0.8
-            
-            # Durum temelli ağırlık - belirli durumlarda daha iyi çalışan modeller bonus alır
-            state_factor = self.pattern_state_weights.get(current_state, {}).get(model_name, 1.0)
-            
-            # Toplam ağırlık
-            weights[model_name] = success_weight * experience_factor * state_factor
-        
-        return weights
-    
-    def _calibrate_confidence(self, raw_confidence):
-        """Güven değerini kalibre eder - aşırı güveni azaltır"""
-        # Orta değere doğru hafif çekme (regresyon)
-        calibrated = 0.5 + (raw_confidence - 0.5) * 0.8
-        
-        # Sınırlara yaklaşmayı zorlaştır
-        if calibrated > 0.8:
-            calibrated = 0.8 + (calibrated - 0.8) * 0.5
-        elif calibrated < 0.2:
-            calibrated = 0.2 - (0.2 - calibrated) * 0.5
-            
-        return calibrated
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Geliştirilmiş Hibrit Analiz Modeli
+"""
+
+import numpy as np
+from core.features import ensure_features
+from core.model_stats import ModelStats
+from models.base_model import BaseAnalysisModel
+from models.registry import ModelRegistry, base_model_names
+
+# Oylamaya katılmayan modeller: topluluk modelleri ve tek başına kullanımda matristen
+# hesaplanamayan (tüm sonuç akışını kullanan) Markov modeli
+EXCLUDED_MODELS = ("Hibrit Analiz", "Karma Analiz", "Markov (PPM)")
+
+class HibritAnalysis(BaseAnalysisModel):
+    """Geliştirilmiş hibrit model - Dinamik ağırlıklandırma, durum tespiti ve kalibrasyon"""
+    
+    def __init__(self):
+        super().__init__()
+        self.name = "Hibrit Analiz"
+        self.description = "Tüm modelleri akıllı birleştirme algoritması ile değerlendiren gelişmiş hibrit model."
+        self.min_data_points = 5
+        
+        # Minimum tahmin sayısı
+        self.min_predictions = 3
+        
+        # Durum tespiti için geçmiş durum ağırlıkları
+        self.pattern_state_weights = {
+            "consecutive_wins": {"T-Şekli": 1.2, "Serpme": 1.1, "Sınır": 1.3},
+            "consecutive_losses": {"L-Şekli": 1.2, "Komşuluk": 1.1, "Isı Haritası": 1.3},
+            "alternating": {"Çapraz (Diagonal)": 1.3, "Zig-Zag": 1.4, "Simetri": 1.2},
+            "win_dominant": {"Dikdörtgen": 1.2, "Spiral": 1.1, "Kuadran": 1.0},
+            "loss_dominant": {"Isı Haritası": 1.2, "Sınır": 1.1, "Serpme": 1.0},
+            "balanced": {"Karma Analiz": 1.1, "Kuadran": 1.0, "Komşuluk": 1.0}
+        }
+        
+        # Tek başına kullanım için temel modeller (ilk ihtiyaçta bir kez oluşturulur);
+        # Karma hiçbir zaman oylamaya katılmadığından kayıt defterinde yoktur
+        self._models = None
+    
+    def analyze(self, matrix, history=None, model_stats=None, predictions=None, features=None):
+        """
+        Hibrit analiz yapar
+        
+        Args:
+            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            model_stats (dict, optional): Mevcut model istatistikleri (UI tarafından sağlanır)
+            predictions (dict, optional): Bu adım için önceden hesaplanmış model tahminleri
+            features (MatrixFeatures, optional): Bu adım için paylaşılan matris özellikleri
+            
+        Returns:
+            dict: Sonuç ve güven düzeyi içeren sözlük
+        """
+        # Temel istatistikler
+        features = ensure_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
+        
+        if stats['total'] < self.min_data_points:
+            return {'prediction': 0, 'confidence': 0}  # Yetersiz veri
+        
+        # Model istatistikleri sağlanmadıysa, varsayılan tahmine dön
+        if not model_stats:
+            return {'prediction': stats['prediction'], 'confidence': 0.5}
+        
+        # Mevcut durum tespiti
+        current_state = self._detect_pattern_state(history, matrix)
+        
+        # Yeterli tahmin yapmış modelleri seç - Hibrit, Karma ve Markov modeli dahil etme
+        qualified_models = self._qualified_models(model_stats)
+        
+        if not qualified_models:
+            # Yeterli tahmin yapan model yoksa, genel istatistiklere göre tahmin yap
+            return {'prediction': stats['prediction'], 'confidence': 0.5}
+        
+        # Model ağırlıklarını hesapla - başarı oranına, durum tipine ve tahmin sayısına göre
+        model_weights = self._calculate_weights(qualified_models, current_state)
+        
+        # W ve L için ağırlıklı oylar
+        w_vote = 0
+        l_vote = 0
+        
+        # Her modelin tahminini al ve ağırlıklandır
+        for model_name, weight in model_weights.items():
+            # Hazır tahmin varsa modeli yeniden çalıştırma
+            if predictions is not None and model_name in predictions:
+                prediction = predictions[model_name]
+            else:
+                # Tek başına kullanımda kalıcı model kayıt defterinden çalıştır
+                model = self._get_models().get(model_name)
+                if model is None:
+                    continue
+                
+                prediction = model.analyze(matrix, history, features=features)
+            
+            if prediction == 1:  # W tahmini
+                w_vote += weight
+            elif prediction == 2:  # L tahmini
+                l_vote += weight
+        
+        # Nihai tahmin ve güven değeri
+        if w_vote > l_vote:
+            total_vote = w_vote + l_vote
+            confidence = self._calibrate_confidence(w_vote / total_vote if total_vote > 0 else 0.6)
+            return {'prediction': 1, 'confidence': confidence}
+        elif l_vote > w_vote:
+            total_vote = w_vote + l_vote
+            confidence = self._calibrate_confidence(l_vote / total_vote if total_vote > 0 else 0.6)
+            return {'prediction': 2, 'confidence': confidence}
+        else:
+            # Eşitlik durumunda, genel istatistiklere göre karar ver
+            if stats['w_probability'] > stats['l_probability']:
+                return {'prediction': 1, 'confidence': 0.55}
+            else:
+                return {'prediction': 2, 'confidence': 0.55}
+    
+    def analyze_batch(self, boards, last_moves=None, model_stats=None, predictions=None,
+                      pattern_states=None):
+        """
+        Hibrit analizi bir matris yığını için vektörel olarak yapar
+        
+        Her adım, o adımdaki istatistiklerle analyze() çağırmakla aynı tahmini ve
+        güveni verir; ağırlıklar ve oylar modeller üzerinde aynı sırayla toplanır.
+        
+        Args:
+            boards (numpy.ndarray): Nx5x5 matris yığını, 0=boş, 1=W, 2=L
+            last_moves (numpy.ndarray, optional): Nx3 son hamleler (row, col, value)
+            model_stats (dict, optional): Model adı -> (başarı oranları, tahmin sayıları);
+                her biri N uzunluğunda, adımdaki istatistikler (model sırasıyla)
+            predictions (dict, optional): Model adı -> N uzunluğunda hazır tahminler;
+                eksik modeller analyze_batch ile çalıştırılır
+            pattern_states (list, optional): Adım başına durum tipi (_detect_pattern_state);
+                verilmezse geçmişsiz analiz gibi "balanced"
+        
+        Returns:
+            tuple: (N uzunluğunda tahminler, N uzunluğunda güven değerleri)
+        """
+        boards, last_moves = self._prepare_batch(boards, last_moves)
+        stats = self._batch_basic_stats(boards)
+        count = len(boards)
+        
+        if pattern_states is None:
+            pattern_states = ["balanced"] * count
+        states, state_codes = np.unique(np.asarray(pattern_states, dtype=object).astype(str),
+                                        return_inverse=True)
+        
+        # W ve L için ağırlıklı oylar; yeterli tahmin yapmamış modeller 0 ekler
+        w_vote = np.zeros(count)
+        l_vote = np.zeros(count)
+        qualified_any = np.zeros(count, dtype=bool)
+        
+        for model_name, (success_rate, total) in (model_stats or {}).items():
+            if model_name in EXCLUDED_MODELS:
+                continue
+            
+            total = np.asarray(total)
+            qualified = total >= self.min_predictions
+            if not qualified.any():
+                continue
+            qualified_any |= qualified
+            
+            # _calculate_weights() ile aynı işlem sırası
+            experience_factor = np.minimum(total / 20.0, 1.0) * 0.2 + 0.8
+            state_factor = np.array([self.pattern_state_weights.get(state, {}).get(model_name, 1.0)
+                                     for state in states])[state_codes]
+            weights = np.asarray(success_rate) / 100.0 * experience_factor * state_factor
+            
+            if predictions is not None and model_name in predictions:
+                prediction = np.asarray(predictions[model_name])
+            else:
+                model = self._get_models().get(model_name)
+                if model is None:
+                    continue
+                prediction = model.analyze_batch(boards, last_moves)
+            
+            w_vote += np.where(qualified & (prediction == 1), weights, 0.0)
+            l_vote += np.where(qualified & (prediction == 2), weights, 0.0)
+        
+        # Nihai tahmin ve kalibre edilmiş güven (_calibrate_confidence ile aynı)
+        total_vote = w_vote + l_vote
+        with np.errstate(divide='ignore', invalid='ignore'):
+            raw = np.where(total_vote > 0, np.maximum(w_vote, l_vote) / total_vote, 0.6)
+        calibrated = 0.5 + (raw - 0.5) * 0.8
+        calibrated = np.where(calibrated > 0.8, 0.8 + (calibrated - 0.8) * 0.5,
+                              np.where(calibrated < 0.2, 0.2 - (0.2 - calibrated) * 0.5, calibrated))
+        
+        # Eşitlikte ve oy veren model yoksa genel istatistiklere göre karar verilir
+        result = stats['prediction'].copy()
+        result[qualified_any & (w_vote > l_vote)] = 1
+        result[qualified_any & (l_vote > w_vote)] = 2
+        confidence = np.where(w_vote != l_vote, calibrated, 0.55)
+        confidence[~qualified_any] = 0.5
+        
+        # Yetersiz veri
+        insufficient = stats['total'] < self.min_data_points
+        result[insufficient] = 0
+        confidence[insufficient] = 0
+        return result, confidence
+    
+    def _qualified_models(self, model_stats):
+        """En az minimum tahmin sayısı kadar tahmin yapmış alt modellerin istatistikleri"""
+        # Dizi tabanlı istatistiklerde yalnızca ağırlık için gereken alanlar okunur
+        if isinstance(model_stats, ModelStats):
+            return {name: {'success_rate': rate, 'total': total}
+                    for name, rate, total in zip(model_stats.names, model_stats.success_rate.tolist(),
+                                                 model_stats.total.tolist())
+                    if name not in EXCLUDED_MODELS and total >= self.min_predictions}
+        
+        # Modelleri filtrele - Hibrit, Karma ve Markov modeli dahil etme
+        filtered_models = {k: v for k, v in model_stats.items() if k not in EXCLUDED_MODELS}
+        
+        return {k: v for k, v in filtered_models.items() if v["total"] >= self.min_predictions}
+    
+    def _get_models(self):
+        """Alt modellerin kalıcı kayıt defterini döndürür, ilk çağrıda oluşturur"""
+        if self._models is None:
+            self._models = ModelRegistry(base_model_names())
+        
+        return self._models
+    
+    def _detect_pattern_state(self, history, matrix):
+        """Mevcut durum tipini tespit eder"""
+        if not history or len(history) < 3:
+            return "balanced"
+            
+        # Son 3 sonuca bak
+        last_three = [h[2] for h in history[-3:]]
+        
+        if all(v == 1 for v in last_three):
+            return "consecutive_wins"
+        elif all(v == 2 for v in last_three):
+            return "consecutive_losses"
+        elif last_three == [1, 2, 1] or last_three == [2, 1, 2]:
+            return "alternating"
+        
+        # W/L oranına bak
+        values = [v for _, _, v in history]
+        w_count = values.count(1)
+        l_count = values.count(2)
+        
+        if w_count > l_count * 1.5:
+            return "win_dominant"
+        elif l_count > w_count * 1.5:
+            return "loss_dominant"
+            
+        return "balanced"
+    
+    def _calculate_weights(self, model_stats, current_state):
+        """Model ağırlıklarını hesaplar"""
+        weights = {}
+        state_weights = self.pattern_state_weights.get(current_state, {})
+        
+        for model_name, stats in model_stats.items():
+            # Başarı oranı ağırlığı
+            success_weight = stats['success_rate'] / 100.0
+            
+            # Tecrübe ağırlığı - daha fazla tahmin yapmış modeller bonus alır
+            experience_factor = min(stats['total'] / 20.0, 1.0) * 0.2 + 0.8
+            
+            # Durum temelli ağırlık - belirli durumlarda daha iyi çalışan modeller bonus alır
+            state_factor = state_weights.get(model_name, 1.0)
+            
+            # Toplam ağırlık
+            weights[model_name] = success_weight * experience_factor * state_factor
+        
+        return weights
+    
+    def _calibrate_confidence(self, raw_confidence):
+        """Güven değerini kalibre eder - aşırı güveni azaltır"""
+        # Orta değere doğru hafif çekme (regresyon)
+        calibrated = 0.5 + (raw_confidence - 0.5) * 0.8
+        
+        # Sınırlara yaklaşmayı zorlaştır
+        if calibrated > 0.8:
+            calibrated = 0.8 + (calibrated - 0.8) * 0.5
+        elif calibrated < 0.2:
+            calibrated = 0.2 - (0.2 - calibrated) * 0.5
+            
+        return calibrated
@@ -1,104 +1,91 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-W ve L Pattern Analiz Uygulaması
-L-Şekli Pattern Analiz Modeli
-"""
-
-import numpy as np
-from models.base_model import BaseAnalysisModel
-
-class LShapeAnalysis(BaseAnalysisModel):
-    """L şeklindeki patternleri analiz eden model"""
-    
-    def __init__(self):
-        super().__init__()
-        self.name = "L-Şekli Pattern Analizi"
-        self.description = "Matris üzerinde L şeklinde (yatay ve dikey birleşim) ilerleyen patternleri analiz eder."
-        self.min_data_points = 5
-    
-    def analyze(self, matrix, history=None):
-        """
-        L şeklindeki patternleri analiz eder
-        
-        Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
-            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
-            
-        Returns:
-            int: Tahmin (0=belirsiz, 1=W, 2=L)
-        """
-        # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
-        
-        if stats['total'] < self.min_data_points:
-            return 0  # Yetersiz veri
-        
-        # Tüm olası L şekilleri için W/L oranlarını topla
-        l_shapes = []
-        
-        # 4 farklı yönde L şekli oluştur: ┌ ┐ └ ┘
-        for i in range(4):
-            for row in range(3):
-                for col in range(3):
-                    shape = []
-                    if i == 0:  # ┌ şekli
-                        for r in range(3):
-                            if matrix[row+r, col] > 0:
-                                shape.append(matrix[row+r, col])
-                        for c in range(1, 3):
-                            if matrix[row, col+c] > 0:
-                                shape.append(matrix[row, col+c])
-                    elif i == 1:  # ┐ şekli
-                        for r in range(3):
-                            if matrix[row+r, col+2] > 0:
-                                shape.append(matrix[row+r, col+2])
-                        for c in range(2):
-                            if matrix[row, col+c] > 0:
-                                shape.append(matrix[row, col+c])
-                    elif i == 2:  # └ şekli
-                        for r in range(3):
-                            if matrix[row+r, col] > 0:
-                                shape.append(matrix[row+r, col])
-                        for c in range(1, 3):
-                            if matrix[row+2, col+c] > 0:
-                                shape.append(matrix[row+2, col+c])
-                    elif i == 3:  # ┘ şekli
-                        for r in range(3):
-                            if matrix[row+r, col+2] > 0:
-                                shape.append(matrix[row+r, col+2])
-                        for c in range(2):
-                            if matrix[row+2, col+c] > 0:
-                                shape.append(matrix[row+2, col+c])
-                                
-                    if len(shape) >= 4:  # En az 4 değer olmalı
-                        l_shapes.append(shape)
-        
-        # L şekillerine göre tahmin yap
-        w_prob = 0
-        l_prob = 0
-        total_shapes = 0
-        
-        for shape in l_shapes:
-            w_count = shape.count(1)
-            l_count = shape.count(2)
-            total = w_count + l_count
-            
-            if total > 0:
-                w_prob += w_count / total
-                l_prob += l_count / total
-                total_shapes += 1
-        
-        # Sonucu belirle
-        if total_shapes > 0:
-            w_prob /= total_shapes
-            l_prob /= total_shapes
-            
-            if w_prob > l_prob:
-                return 1  # W tahmini
-            elif l_prob > w_prob:
-                return 2  # L tahmini
-        
-        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+L-Şekli Pattern Analiz Modeli
+"""
+
+import numpy as np
+from core.features import ensure_features, membership_bits
+from models.base_model import BaseAnalysisModel
+
+class LShapeAnalysis(BaseAnalysisModel):
+    """L şeklindeki patternleri analiz eden model"""
+    
+    def __init__(self):
+        super().__init__()
+        self.name = "L-Şekli Pattern Analizi"
+        self.description = "Matris üzerinde L şeklinde (yatay ve dikey birleşim) ilerleyen patternleri analiz eder."
+        self.min_data_points = 5
+    
+    def analyze(self, matrix, history=None, features=None):
+        """
+        L şeklindeki patternleri analiz eder
+        
+        Args:
+            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (MatrixFeatures, optional): Bu adım için paylaşılan matris özellikleri
+            
+        Returns:
+            int: Tahmin (0=belirsiz, 1=W, 2=L)
+        """
+        # Temel istatistikler
+        features = ensure_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
+        
+        if stats['total'] < self.min_data_points:
+            return 0  # Yetersiz veri
+        
+        # Tüm olası L şekillerinin (┌ ┐ └ ┘) W/L oranları, şekil maskelerinin bit sayımıyla
+        prediction = self._shape_vote(features, SHAPE_BITS)
+        if prediction != 0:
+            return prediction
+        
+        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
+        return stats['prediction']
+    
+    def analyze_batch(self, boards, last_moves=None):
+        """
+        L şekillerini bir matris yığını için vektörel olarak analiz eder
+        
+        Şekillerin W ve dolu hücre sayıları üyelik matrisiyle çarpılarak bulunur;
+        sonuçlar analyze() ile birebir aynıdır.
+        
+        Args:
+            boards (numpy.ndarray): Nx5x5 matris yığını, 0=boş, 1=W, 2=L
+            last_moves (numpy.ndarray, optional): Nx3 son hamleler (kullanılmaz)
+        
+        Returns:
+            numpy.ndarray: N uzunluğunda tahminler (0=belirsiz, 1=W, 2=L)
+        """
+        boards, last_moves = self._prepare_batch(boards, last_moves)
+        stats = self._batch_basic_stats(boards)
+        return self._batch_shape_vote(boards, stats, SHAPE_MEMBERSHIP)
+
+
+def _build_shape_membership():
+    """L şekillerinin üyelik matrisini oluşturur (36x25; yön, satır, sütun sırasıyla)"""
+    membership = []
+    for i in range(4):
+        for row in range(3):
+            for col in range(3):
+                cells = np.zeros((5, 5), dtype=np.float32)
+                if i == 0:  # ┌ şekli
+                    cells[row:row+3, col] = 1
+                    cells[row, col+1:col+3] = 1
+                elif i == 1:  # ┐ şekli
+                    cells[row:row+3, col+2] = 1
+                    cells[row, col:col+2] = 1
+                elif i == 2:  # └ şekli
+                    cells[row:row+3, col] = 1
+                    cells[row+2, col+1:col+3] = 1
+                else:  # ┘ şekli
+                    cells[row:row+3, col+2] = 1
+                    cells[row+2, col:col+2] = 1
+                membership.append(cells.ravel())
+    return np.array(membership)
+
+SHAPE_MEMBERSHIP = _build_shape_membership()
+SHAPE_BITS = membership_bits(SHAPE_MEMBERSHIP)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Değişken Dereceli Markov (PPM) Analiz Modeli
+"""
+
+from core.ngram_index import NgramIndex
+from models.base_model import BaseAnalysisModel
+
+class MarkovAnalysis(BaseAnalysisModel):
+    """Tüm sonuç akışı üzerinde değişken dereceli Markov (PPM) modeli
+
+    Matristen kaydırılarak silinen sonuçlar da dahil oturumun tüm sonuçlarını
+    kullanır. Son 0..K sonuçtan oluşan bağlamların sayaçları motorun n-gram
+    indeksinden (engine.outcome_index) okunur; indeks K derinliğinde tam bir
+    bağlam ağacıdır ve boyutu oturum uzunluğundan bağımsızdır.
+
+    Olasılık kısa bağlamdan uzun bağlama doğru PPM-C karışımıyla hesaplanır:
+    her bağlam kendi sayaçlarını, görülen farklı sonuç sayısı kadar ağırlıkla
+    bir kısa bağlamın olasılığına karıştırır. Hiç görülmemiş bağlamlar atlanır;
+    böylece kullanılan en uzun derece veriye göre değişir.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.name = "Markov (PPM)"
+        self.description = "Oturumun tüm sonuç akışında son 1-6 sonuçtan sonra gelenleri karıştırarak tahmin yapar."
+        self.min_data_points = 5
+
+    def analyze(self, matrix, history=None, features=None, outcome_index=None):
+        """
+        Sonuç akışına göre tahmin yapar
+
+        Args:
+            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (MatrixFeatures, optional): Bu adım için paylaşılan matris özellikleri
+            outcome_index (NgramIndex, optional): Tüm sonuç akışının indeksi; verilmezse
+                yalnızca matristeki hamlelerden oluşturulur
+
+        Returns:
+            int: Tahmin (0=belirsiz, 1=W, 2=L)
+        """
+        if outcome_index is None:
+            outcome_index = NgramIndex.from_sequence(value for _, _, value in history or ())
+
+        return self.predict(outcome_index)['prediction']
+
+    def predict(self, outcome_index):
+        """
+        İndeksin mevcut bağlamından sonraki sonucun tahmini ve güveni
+
+        İndeksin en uzun bağlam uzunluğu kadar sayaç okunur (O(K)).
+
+        Args:
+            outcome_index (NgramIndex): Sonuç akışının indeksi
+
+        Returns:
+            dict: prediction (0=belirsiz, 1=W, 2=L), confidence (0.5-1),
+                w_probability ve order (kullanılan en uzun bağlam)
+        """
+        if len(outcome_index) < self.min_data_points:
+            return {'prediction': 0, 'confidence': 0.5, 'w_probability': 0.5, 'order': -1}
+
+        w_probability = 0.5
+        order = -1
+        for k in range(min(len(outcome_index), outcome_index.max_order) + 1):
+            w_count, l_count = outcome_index.next_counts(order=k)
+            total = w_count + l_count
+            if total == 0:
+                break  # Daha uzun bağlamlar da görülmemiştir
+
+            # PPM-C: farklı sonuç sayısı kaçış ağırlığıdır
+            distinct = (w_count > 0) + (l_count > 0)
+            w_probability = (w_count + distinct * w_probability) / (total + distinct)
+            order = k
+
+        if w_probability > 0.5:
+            prediction = 1
+        elif w_probability < 0.5:
+            prediction = 2
+        else:
+            prediction = 0
+
+        return {
+            'prediction': prediction,
+            'confidence': max(w_probability, 1 - w_probability),
+            'w_probability': w_probability,
+            'order': order
+        }
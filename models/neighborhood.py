@@ -1,113 +1,159 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-W ve L Pattern Analiz Uygulaması
-Komşuluk Pattern Analiz Modeli
-"""
-
-import numpy as np
-from models.base_model import BaseAnalysisModel
-
-class NeighborhoodAnalysis(BaseAnalysisModel):
-    """Komşuluk patternlerini analiz eden model"""
-    
-    def __init__(self):
-        super().__init__()
-        self.name = "Komşuluk Pattern Analizi"
-        self.description = "Bir hücrenin 8 komşusu içinde W veya L oranının bir sonraki sonucu nasıl etkilediğini analiz eder."
-        self.min_data_points = 5
-    
-    def analyze(self, matrix, history=None):
-        """
-        Komşuluk patternlerini analiz eder
-        
-        Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
-            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
-            
-        Returns:
-            int: Tahmin (0=belirsiz, 1=W, 2=L)
-        """
-        # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
-        
-        if stats['total'] < self.min_data_points or not history:
-            return 0  # Yetersiz veri
-        
-        # Komşuluk oranlarına göre tahmin yapma
-        neighborhood_stats = {}
-        
-        # 8 komşuluktaki W/L oranları
-        for row in range(5):
-            for col in range(5):
-                if matrix[row, col] > 0:
-                    # Bu hücrenin komşularını bul
-                    neighbors = []
-                    for dr in [-1, 0, 1]:
-                        for dc in [-1, 0, 1]:
-                            if dr == 0 and dc == 0:
-                                continue  # Hücrenin kendisi
-                            
-                            r, c = row + dr, col + dc
-                            if 0 <= r < 5 and 0 <= c < 5 and matrix[r, c] > 0:
-                                neighbors.append(matrix[r, c])
-                    
-                    if neighbors:
-                        # Komşuluktaki W/L oranı
-                        w_ratio = neighbors.count(1) / len(neighbors)
-                        l_ratio = neighbors.count(2) / len(neighbors)
-                        
-                        # Bu orana sahip komşuluklar için istatistik tut
-                        key = (round(w_ratio, 2), round(l_ratio, 2))
-                        if key not in neighborhood_stats:
-                            neighborhood_stats[key] = {'w': 0, 'l': 0}
-                        
-                        # Merkez hücrenin değerini ekle
-                        if matrix[row, col] == 1:
-                            neighborhood_stats[key]['w'] += 1
-                        else:
-                            neighborhood_stats[key]['l'] += 1
-        
-        # Son eklenen hücrenin komşuluğunu analiz et
-        if history:
-            last_row, last_col, _ = history[-1]
-            
-            # Boş bir komşuluk bul
-            for dr in [-1, 0, 1]:
-                for dc in [-1, 0, 1]:
-                    if dr == 0 and dc == 0:
-                        continue
-                    
-                    r, c = last_row + dr, last_col + dc
-                    if 0 <= r < 5 and 0 <= c < 5 and matrix[r, c] == 0:
-                        # Bu boş hücrenin komşularını bul
-                        neighbors = []
-                        for d2r in [-1, 0, 1]:
-                            for d2c in [-1, 0, 1]:
-                                if d2r == 0 and d2c == 0:
-                                    continue
-                                
-                                r2, c2 = r + d2r, c + d2c
-                                if 0 <= r2 < 5 and 0 <= c2 < 5 and matrix[r2, c2] > 0:
-                                    neighbors.append(matrix[r2, c2])
-                        
-                        if neighbors:
-                            # Komşuluktaki W/L oranı
-                            w_ratio = neighbors.count(1) / len(neighbors)
-                            l_ratio = neighbors.count(2) / len(neighbors)
-                            
-                            key = (round(w_ratio, 2), round(l_ratio, 2))
-                            if key in neighborhood_stats:
-                                # Bu komşuluk oranında daha önce ne görülmüş?
-                                w_count = neighborhood_stats[key]['w']
-                                l_count = neighborhood_stats[key]['l']
-                                
-                                if w_count + l_count > 0:
-                                    if w_count > l_count:
-                                        return 1  # W tahmini
-                                    elif l_count > w_count:
-                                        return 2  # L tahmini
-        
-        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Komşuluk Pattern Analiz Modeli
+"""
+
+import numpy as np
+from core.features import ensure_features
+from models.base_model import BaseAnalysisModel
+
+class NeighborhoodAnalysis(BaseAnalysisModel):
+    """Komşuluk patternlerini analiz eden model"""
+    
+    def __init__(self):
+        super().__init__()
+        self.name = "Komşuluk Pattern Analizi"
+        self.description = "Bir hücrenin 8 komşusu içinde W veya L oranının bir sonraki sonucu nasıl etkilediğini analiz eder."
+        self.min_data_points = 5
+    
+    def analyze(self, matrix, history=None, features=None):
+        """
+        Komşuluk patternlerini analiz eder
+        
+        Args:
+            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (MatrixFeatures, optional): Bu adım için paylaşılan matris özellikleri
+            
+        Returns:
+            int: Tahmin (0=belirsiz, 1=W, 2=L)
+        """
+        # Temel istatistikler
+        features = ensure_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
+        
+        if stats['total'] < self.min_data_points or not history:
+            return 0  # Yetersiz veri
+        
+        # 8 komşudaki W ve dolu hücre sayıları: paylaşılan 3x3 pencere sayımlarından
+        # hücrenin kendisi çıkarılır
+        w_window, l_window = features.window_counts
+        neighbor_w = (w_window - features.w_mask).ravel().tolist()
+        neighbor_total = (w_window + l_window - features.non_empty).ravel().tolist()
+        cells = features.cells
+        
+        # Komşuluk oranı anahtarı başına dolu merkez hücrelerin W/L sayıları
+        neighborhood_stats = {}
+        for cell in range(25):
+            if cells[cell] > 0 and neighbor_total[cell] > 0:
+                key = KEY_LOOKUP[neighbor_w[cell]][neighbor_total[cell]]
+                if key not in neighborhood_stats:
+                    neighborhood_stats[key] = [0, 0]
+                
+                # Merkez hücrenin değerini ekle
+                neighborhood_stats[key][0 if cells[cell] == 1 else 1] += 1
+        
+        # Son eklenen hücrenin boş komşularını tarama sırasıyla incele
+        last_row, last_col, _ = history[-1]
+        for cell in NEIGHBOR_ORDER[last_row * 5 + last_col]:
+            if cell == 25 or cells[cell] != 0 or neighbor_total[cell] == 0:
+                continue  # Matris dışı, dolu veya komşusu olmayan hücre
+            
+            # Bu komşuluk oranında daha önce ne görülmüş?
+            counts = neighborhood_stats.get(KEY_LOOKUP[neighbor_w[cell]][neighbor_total[cell]])
+            if counts is not None:
+                if counts[0] > counts[1]:
+                    return 1  # W tahmini
+                elif counts[1] > counts[0]:
+                    return 2  # L tahmini
+        
+        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
+        return stats['prediction']
+    
+    def analyze_batch(self, boards, last_moves=None):
+        """
+        Komşuluk patternlerini bir matris yığını için vektörel olarak analiz eder
+        
+        Her hücrenin dolu ve W komşu sayıları komşuluk matrisiyle çarpılarak
+        bulunur; yuvarlanmış oran anahtarları tablodan okunur. Son hamlenin boş
+        komşuları analyze() ile aynı sırada taranır.
+        
+        Args:
+            boards (numpy.ndarray): Nx5x5 matris yığını, 0=boş, 1=W, 2=L
+            last_moves (numpy.ndarray, optional): Nx3 son hamleler (row, col, value)
+        
+        Returns:
+            numpy.ndarray: N uzunluğunda tahminler (0=belirsiz, 1=W, 2=L)
+        """
+        boards, last_moves = self._prepare_batch(boards, last_moves)
+        stats = self._batch_basic_stats(boards)
+        count = len(boards)
+        key_count = len(RATIO_KEYS)
+        
+        flat = boards.reshape(count, 25)
+        filled = (flat != 0).astype(np.float32)
+        neighbor_total = (filled @ ADJACENCY).astype(np.intp)
+        neighbor_w = ((flat == 1).astype(np.float32) @ ADJACENCY).astype(np.intp)
+        keys = KEY_INDEX[neighbor_w, neighbor_total]
+        
+        # Dolu hücrelerin merkez değerleri anahtar başına sayılır: (N, anahtar, W/L)
+        counted = (flat != 0) & (keys >= 0)
+        slots = ((np.arange(count)[:, None] * key_count + keys) * 2 + (flat == 2))[counted]
+        tally = np.bincount(slots, minlength=count * key_count * 2).reshape(count, key_count, 2)
+        
+        # 26. sütun matris dışı komşular içindir; aday olamaz
+        empty_keys = np.where(flat == 0, keys, -1)
+        empty_keys = np.concatenate([empty_keys, np.full((count, 1), -1, dtype=empty_keys.dtype)], axis=1)
+        
+        last_row, last_col, last_val = last_moves.T
+        neighbors = NEIGHBOR_CELLS[last_row * 5 + last_col]
+        
+        # İlk belirgin farklı komşu tahmini verir
+        decided = np.zeros(count, dtype=np.int8)
+        rows = np.arange(count)
+        for k in range(8):
+            key = empty_keys[rows, neighbors[:, k]]
+            w_count, l_count = tally[rows, np.maximum(key, 0)].T
+            candidate = (decided == 0) & (key >= 0) & (w_count != l_count)
+            decided[candidate] = np.where(w_count > l_count, 1, 2)[candidate]
+        
+        result = np.where(decided != 0, decided, stats['prediction']).astype(np.int8)
+        result[(stats['total'] < self.min_data_points) | (last_val == 0)] = 0
+        return result
+
+
+def _build_neighbor_tables():
+    """Komşuluk matrisini, (W, dolu) -> oran anahtarı tablosunu ve komşu sıralarını oluşturur
+    
+    Anahtarlar analyze() ile aynı yuvarlanmış oranlardır; aynı oranı veren
+    sayımlar aynı anahtarı paylaşır. Komşu sırası analyze() içindeki (dr, dc)
+    taramasıdır; matris dışına taşan komşular 25 numaralı hücreye yönlenir.
+    """
+    offsets = [(dr, dc) for dr in [-1, 0, 1] for dc in [-1, 0, 1] if (dr, dc) != (0, 0)]
+    adjacency = np.zeros((25, 25), dtype=np.float32)
+    neighbors = np.full((25, 8), 25, dtype=np.intp)
+    for row in range(5):
+        for col in range(5):
+            for k, (dr, dc) in enumerate(offsets):
+                r, c = row + dr, col + dc
+                if 0 <= r < 5 and 0 <= c < 5:
+                    adjacency[row * 5 + col, r * 5 + c] = 1
+                    neighbors[row * 5 + col, k] = r * 5 + c
+    
+    ratio_keys = {}
+    key_index = np.full((9, 9), -1, dtype=np.intp)
+    for total in range(1, 9):
+        for w_count in range(total + 1):
+            key = (round(w_count / total, 2), round((total - w_count) / total, 2))
+            key_index[w_count, total] = ratio_keys.setdefault(key, len(ratio_keys))
+    
+    return adjacency, key_index, tuple(ratio_keys), neighbors
+
+ADJACENCY, KEY_INDEX, RATIO_KEYS, NEIGHBOR_CELLS = _build_neighbor_tables()
+
+# Skaler yol için Python listeleri
+KEY_LOOKUP = KEY_INDEX.tolist()
+NEIGHBOR_ORDER = NEIGHBOR_CELLS.tolist()
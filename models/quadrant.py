@@ -1,115 +1,191 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-W ve L Pattern Analiz Uygulaması
-Kuadran Analiz Modeli
-"""
-
-import numpy as np
-from models.base_model import BaseAnalysisModel
-
-class QuadrantAnalysis(BaseAnalysisModel):
-    """Kuadran analizini yapan model"""
-    
-    def __init__(self):
-        super().__init__()
-        self.name = "Kuadran Analizi"
-        self.description = "Matrisi 4 eşit parçaya bölerek her bölgedeki W/L oranının diğer bölgelere göre nasıl değiştiğini inceler."
-        self.min_data_points = 5
-    
-    def analyze(self, matrix, history=None):
-        """
-        Kuadran analizini yapar
-        
-        Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
-            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
-            
-        Returns:
-            int: Tahmin (0=belirsiz, 1=W, 2=L)
-        """
-        # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
-        
-        if stats['total'] < self.min_data_points:
-            return 0  # Yetersiz veri
-        
-        # Matrisi 4 kuadranta böl
-        # Q1: Sol üst, Q2: Sağ üst, Q3: Sol alt, Q4: Sağ alt
-        q1 = matrix[0:3, 0:3]
-        q2 = matrix[0:3, 2:5]
-        q3 = matrix[2:5, 0:3]
-        q4 = matrix[2:5, 2:5]
-        
-        # Her kuadranttaki W ve L sayılarını hesapla
-        quadrants = [q1, q2, q3, q4]
-        quadrant_stats = []
-        
-        for i, q in enumerate(quadrants):
-            w_count = np.sum(q == 1)
-            l_count = np.sum(q == 2)
-            total = w_count + l_count
-            
-            if total > 0:
-                w_ratio = w_count / total
-                l_ratio = l_count / total
-                
-                quadrant_stats.append({
-                    'quadrant': i+1,
-                    'w_count': w_count,
-                    'l_count': l_count,
-                    'total': total,
-                    'w_ratio': w_ratio,
-                    'l_ratio': l_ratio
-                })
-            else:
-                quadrant_stats.append({
-                    'quadrant': i+1,
-                    'w_count': 0,
-                    'l_count': 0,
-                    'total': 0,
-                    'w_ratio': 0,
-                    'l_ratio': 0
-                })
-        
-        # Son eklenen konum hangi kuadranda?
-        if history:
-            last_row, last_col, _ = history[-1]
-            last_quadrant = 0
-            
-            if last_row < 3 and last_col < 3:
-                last_quadrant = 1  # Q1
-            elif last_row < 3 and last_col >= 2:
-                last_quadrant = 2  # Q2
-            elif last_row >= 2 and last_col < 3:
-                last_quadrant = 3  # Q3
-            else:
-                last_quadrant = 4  # Q4
-            
-            # Son kuadranda W/L oranlarına bakarak tahmin yap
-            last_q_stats = quadrant_stats[last_quadrant-1]
-            
-            if last_q_stats['total'] >= 3:
-                if last_q_stats['w_ratio'] > last_q_stats['l_ratio']:
-                    return 1  # W
-                elif last_q_stats['l_ratio'] > last_q_stats['w_ratio']:
-                    return 2  # L
-            
-            # Kuadranlar arası karşılaştırma
-            # En yüksek ve en düşük oranlı kuadranları bul
-            valid_quadrants = [q for q in quadrant_stats if q['total'] > 0]
-            if valid_quadrants:
-                max_w_ratio = max(valid_quadrants, key=lambda x: x['w_ratio'])
-                max_l_ratio = max(valid_quadrants, key=lambda x: x['l_ratio'])
-                
-                # Son kuadran maksimum W oranına sahipse
-                if last_quadrant == max_w_ratio['quadrant'] and max_w_ratio['w_ratio'] > 0.6:
-                    return 1  # W
-                
-                # Son kuadran maksimum L oranına sahipse
-                if last_quadrant == max_l_ratio['quadrant'] and max_l_ratio['l_ratio'] > 0.6:
-                    return 2  # L
-        
-        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Kuadran Analiz Modeli
+"""
+
+import numpy as np
+from core.features import ensure_features, membership_bits, popcount
+from models.base_model import BaseAnalysisModel
+
+# Q1: Sol üst, Q2: Sağ üst, Q3: Sol alt, Q4: Sağ alt (ortadaki satır ve sütun ortaktır)
+QUADRANTS = [
+    (slice(0, 3), slice(0, 3)),
+    (slice(0, 3), slice(2, 5)),
+    (slice(2, 5), slice(0, 3)),
+    (slice(2, 5), slice(2, 5))
+]
+
+def _last_quadrant(row, col):
+    """Bir konumun ait sayıldığı kuadranı (1-4) döndürür"""
+    if row < 3 and col < 3:
+        return 1  # Q1
+    elif row < 3 and col >= 2:
+        return 2  # Q2
+    elif row >= 2 and col < 3:
+        return 3  # Q3
+    else:
+        return 4  # Q4
+
+def _build_quadrant_tables():
+    """Kuadran üyelik matrisini, hücre -> son kuadran tablosunu ve kuadran bit maskelerini oluşturur"""
+    membership = np.zeros((25, 4), dtype=np.float32)
+    for i, q in enumerate(QUADRANTS):
+        cells = np.zeros((5, 5), dtype=np.float32)
+        cells[q] = 1
+        membership[:, i] = cells.ravel()
+    
+    last_quadrants = np.array([_last_quadrant(cell // 5, cell % 5) - 1 for cell in range(25)])
+    
+    # Kuadran başına 9 hücrenin 25 bitlik maskesi
+    bits = membership_bits(membership.T)
+    return membership, last_quadrants, bits
+
+QUADRANT_MEMBERSHIP, LAST_QUADRANT, QUADRANT_BITS = _build_quadrant_tables()
+
+class QuadrantAnalysis(BaseAnalysisModel):
+    """Kuadran analizini yapan model"""
+    
+    def __init__(self):
+        super().__init__()
+        self.name = "Kuadran Analizi"
+        self.description = "Matrisi 4 eşit parçaya bölerek her bölgedeki W/L oranının diğer bölgelere göre nasıl değiştiğini inceler."
+        self.min_data_points = 5
+    
+    def analyze(self, matrix, history=None, features=None):
+        """
+        Kuadran analizini yapar
+        
+        Args:
+            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (MatrixFeatures, optional): Bu adım için paylaşılan matris özellikleri
+            
+        Returns:
+            int: Tahmin (0=belirsiz, 1=W, 2=L)
+        """
+        # Temel istatistikler
+        features = ensure_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
+        
+        if stats['total'] < self.min_data_points:
+            return 0  # Yetersiz veri
+        
+        # Her kuadranttaki W ve L sayılarını hesapla (kuadran maskesiyle bit sayımı)
+        quadrant_stats = []
+        w_bits = features.w_bits
+        l_bits = features.l_bits
+        
+        for i, bits in enumerate(QUADRANT_BITS):
+            w_count = popcount(w_bits & bits)
+            l_count = popcount(l_bits & bits)
+            total = w_count + l_count
+            
+            if total > 0:
+                w_ratio = w_count / total
+                l_ratio = l_count / total
+                
+                quadrant_stats.append({
+                    'quadrant': i+1,
+                    'w_count': w_count,
+                    'l_count': l_count,
+                    'total': total,
+                    'w_ratio': w_ratio,
+                    'l_ratio': l_ratio
+                })
+            else:
+                quadrant_stats.append({
+                    'quadrant': i+1,
+                    'w_count': 0,
+                    'l_count': 0,
+                    'total': 0,
+                    'w_ratio': 0,
+                    'l_ratio': 0
+                })
+        
+        # Son eklenen konum hangi kuadranda?
+        if history:
+            last_row, last_col, _ = history[-1]
+            last_quadrant = _last_quadrant(last_row, last_col)
+            
+            # Son kuadranda W/L oranlarına bakarak tahmin yap
+            last_q_stats = quadrant_stats[last_quadrant-1]
+            
+            if last_q_stats['total'] >= 3:
+                if last_q_stats['w_ratio'] > last_q_stats['l_ratio']:
+                    return 1  # W
+                elif last_q_stats['l_ratio'] > last_q_stats['w_ratio']:
+                    return 2  # L
+            
+            # Kuadranlar arası karşılaştırma
+            # En yüksek ve en düşük oranlı kuadranları bul
+            valid_quadrants = [q for q in quadrant_stats if q['total'] > 0]
+            if valid_quadrants:
+                max_w_ratio = max(valid_quadrants, key=lambda x: x['w_ratio'])
+                max_l_ratio = max(valid_quadrants, key=lambda x: x['l_ratio'])
+                
+                # Son kuadran maksimum W oranına sahipse
+                if last_quadrant == max_w_ratio['quadrant'] and max_w_ratio['w_ratio'] > 0.6:
+                    return 1  # W
+                
+                # Son kuadran maksimum L oranına sahipse
+                if last_quadrant == max_l_ratio['quadrant'] and max_l_ratio['l_ratio'] > 0.6:
+                    return 2  # L
+        
+        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
+        return stats['prediction']
+    
+    def analyze_batch(self, boards, last_moves=None):
+        """
+        Kuadran analizini bir matris yığını için vektörel olarak yapar
+        
+        Args:
+            boards (numpy.ndarray): Nx5x5 matris yığını, 0=boş, 1=W, 2=L
+            last_moves (numpy.ndarray, optional): Nx3 son hamleler (row, col, value)
+        
+        Returns:
+            numpy.ndarray: N uzunluğunda tahminler (0=belirsiz, 1=W, 2=L)
+        """
+        boards, last_moves = self._prepare_batch(boards, last_moves)
+        stats = self._batch_basic_stats(boards)
+        count = len(boards)
+        rows = np.arange(count)
+        
+        # Her kuadranttaki W ve L sayıları (Nx4)
+        w_count = stats['w_mask'].reshape(count, 25).astype(np.float32) @ QUADRANT_MEMBERSHIP
+        l_count = stats['l_mask'].reshape(count, 25).astype(np.float32) @ QUADRANT_MEMBERSHIP
+        total = w_count + l_count
+        
+        valid = total > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            w_ratio = np.where(valid, w_count.astype(np.float64) / total, 0.0)
+            l_ratio = np.where(valid, l_count.astype(np.float64) / total, 0.0)
+        
+        # Son eklenen konumun kuadranı
+        last_row, last_col, last_val = last_moves.T
+        has_last = last_val != 0
+        last_quadrant = LAST_QUADRANT[last_row * 5 + last_col]
+        
+        # Kuadranlar arası karşılaştırma: en yüksek oranlı ilk geçerli kuadran
+        max_w = np.argmax(np.where(valid, w_ratio, -1.0), axis=1)
+        max_l = np.argmax(np.where(valid, l_ratio, -1.0), axis=1)
+        
+        result = stats['prediction'].copy()
+        
+        # Kurallar öncelik sırasının tersiyle uygulanır; öncelikli kural üzerine yazar
+        l_rule = has_last & (last_quadrant == max_l) & (l_ratio[rows, max_l] > 0.6)
+        result[l_rule] = 2
+        w_rule = has_last & (last_quadrant == max_w) & (w_ratio[rows, max_w] > 0.6)
+        result[w_rule] = 1
+        
+        # Son kuadranda W/L oranlarına bakarak tahmin
+        last_w = w_ratio[rows, last_quadrant]
+        last_l = l_ratio[rows, last_quadrant]
+        decisive = has_last & (total[rows, last_quadrant] >= 3)
+        result[decisive & (last_l > last_w)] = 2
+        result[decisive & (last_w > last_l)] = 1
+        
+        result[stats['total'] < self.min_data_points] = 0
+        return result
@@ -1,83 +1,172 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-W ve L Pattern Analiz Uygulaması
-Dikdörtgen/Kare Bölge Analiz Modeli
-"""
-
-import numpy as np
-from models.base_model import BaseAnalysisModel
-from itertools import product
-
-class RectangleAnalysis(BaseAnalysisModel):
-    """Dikdörtgen/kare bölgelerdeki patternleri analiz eden model"""
-    
-    def __init__(self):
-        super().__init__()
-        self.name = "Dikdörtgen/Kare Bölge Analizi"
-        self.description = "Matris üzerinde 2x2, 2x3, 3x2, 3x3 gibi dikdörtgen alanlar içindeki sonuçları analiz eder."
-        self.min_data_points = 5
-    
-    def analyze(self, matrix, history=None):
-        """
-        Dikdörtgen bölgeleri analiz eder
-        
-        Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
-            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
-            
-        Returns:
-            int: Tahmin (0=belirsiz, 1=W, 2=L)
-        """
-        # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
-        
-        if stats['total'] < self.min_data_points:
-            return 0  # Yetersiz veri
-        
-        # Analiz edilecek dikdörtgen boyutları
-        rectangle_sizes = [(2, 2), (2, 3), (3, 2), (3, 3)]
-        
-        w_weight = 0
-        l_weight = 0
-        total_weight = 0
-        
-        for rows, cols in rectangle_sizes:
-            # Tüm olası başlangıç noktaları
-            for i in range(6 - rows):
-                for j in range(6 - cols):
-                    # Dikdörtgen bölgeyi al
-                    rect = matrix[i:i+rows, j:j+cols]
-                    
-                    # Boş olmayan hücreleri say
-                    non_empty = np.sum(rect > 0)
-                    
-                    # Yeterli veri varsa analiz et
-                    if non_empty >= 4:
-                        w_count = np.sum(rect == 1)
-                        l_count = np.sum(rect == 2)
-                        
-                        if w_count + l_count > 0:
-                            # Bölgedeki W/L oranı
-                            w_ratio = w_count / (w_count + l_count)
-                            l_ratio = l_count / (w_count + l_count)
-                            
-                            # Ağırlıklı toplama ekle
-                            weight = non_empty / (rows * cols)  # Doluluk oranı kadar ağırlık
-                            w_weight += w_ratio * weight
-                            l_weight += l_ratio * weight
-                            total_weight += weight
-        
-        # Sonucu belirle
-        if total_weight > 0:
-            w_prob = w_weight / total_weight
-            l_prob = l_weight / total_weight
-            
-            if w_prob > l_prob:
-                return 1  # W tahmini
-            elif l_prob > w_prob:
-                return 2  # L tahmini
-        
-        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Dikdörtgen/Kare Bölge Analiz Modeli
+"""
+
+import numpy as np
+from core.features import ensure_features, membership_bits, popcount
+from models.base_model import BaseAnalysisModel
+from itertools import product
+
+# Analiz edilecek dikdörtgen boyutları
+RECTANGLE_SIZES = [(2, 2), (2, 3), (3, 2), (3, 3)]
+
+class RectangleAnalysis(BaseAnalysisModel):
+    """Dikdörtgen/kare bölgelerdeki patternleri analiz eden model"""
+    
+    def __init__(self):
+        super().__init__()
+        self.name = "Dikdörtgen/Kare Bölge Analizi"
+        self.description = "Matris üzerinde 2x2, 2x3, 3x2, 3x3 gibi dikdörtgen alanlar içindeki sonuçları analiz eder."
+        self.min_data_points = 5
+    
+    def analyze(self, matrix, history=None, features=None):
+        """
+        Dikdörtgen bölgeleri analiz eder
+        
+        Args:
+            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (MatrixFeatures, optional): Bu adım için paylaşılan matris özellikleri
+            
+        Returns:
+            int: Tahmin (0=belirsiz, 1=W, 2=L)
+        """
+        # Temel istatistikler
+        features = ensure_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
+        
+        if stats['total'] < self.min_data_points:
+            return 0  # Yetersiz veri
+        
+        w_weight = 0
+        l_weight = 0
+        total_weight = 0
+        
+        w_bits = features.w_bits
+        l_bits = features.l_bits
+        
+        # Tüm boyutlar ve başlangıç noktaları, bölge maskeleriyle
+        for bits, lookup in WINDOW_LOOKUP:
+            # Dikdörtgen bölgedeki W ve L sayıları
+            weights = lookup[popcount(w_bits & bits) * 10 + popcount(l_bits & bits)]
+            
+            # Yeterli veri varsa ağırlıklı toplama ekle
+            if weights is not None:
+                w_weight += weights[0]
+                l_weight += weights[1]
+                total_weight += weights[2]
+        
+        # Sonucu belirle
+        if total_weight > 0:
+            w_prob = w_weight / total_weight
+            l_prob = l_weight / total_weight
+            
+            if w_prob > l_prob:
+                return 1  # W tahmini
+            elif l_prob > w_prob:
+                return 2  # L tahmini
+        
+        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
+        return stats['prediction']
+    
+    def analyze_batch(self, boards, last_moves=None):
+        """
+        Dikdörtgen bölgeleri bir matris yığını için vektörel olarak analiz eder
+        
+        Tüm bölgelerin W/L sayımları tek bir matris çarpımıyla hesaplanır, bölge
+        katkıları önceden hesaplanmış tablodan alınır ve skaler yoldaki bölge
+        sırasıyla toplanır; böylece sonuçlar analyze() ile birebir aynıdır.
+        
+        Args:
+            boards (numpy.ndarray): Nx5x5 matris yığını, 0=boş, 1=W, 2=L
+            last_moves (numpy.ndarray, optional): Nx3 son hamleler (kullanılmaz)
+        
+        Returns:
+            numpy.ndarray: N uzunluğunda tahminler (0=belirsiz, 1=W, 2=L)
+        """
+        boards, last_moves = self._prepare_batch(boards, last_moves)
+        stats = self._batch_basic_stats(boards)
+        
+        # Her hücre W için 10, L için 1 sayılır; üyelik matrisiyle çarpım her
+        # bölge için W*10+L kodunu verir (float32 bu küçük tamsayılarda kesindir)
+        cells = (stats['w_mask'] * np.float32(10) + stats['l_mask']).reshape(len(boards), 25)
+        codes = (WINDOW_MEMBERSHIP @ cells.T).astype(np.intp) + WINDOW_OFFSETS
+        
+        # Bölgeler skaler döngüdeki sırayla eklenir; cumsum her zaman sırayla toplar
+        # (sum() tek matrislik yığında ikili toplama yapıp farklı yuvarlayabilir)
+        w_weight = np.cumsum(WINDOW_TABLE[0][codes], axis=0)[-1]
+        l_weight = np.cumsum(WINDOW_TABLE[1][codes], axis=0)[-1]
+        total_weight = np.cumsum(WINDOW_TABLE[2][codes], axis=0)[-1]
+        
+        has_weight = total_weight > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            w_prob = w_weight / total_weight
+            l_prob = l_weight / total_weight
+        
+        # Sonucu belirle
+        result = stats['prediction'].copy()
+        result[has_weight & (w_prob > l_prob)] = 1
+        result[has_weight & (l_prob > w_prob)] = 2
+        result[stats['total'] < self.min_data_points] = 0
+        return result
+
+
+def _window_weights(w_count, l_count, area):
+    """Bir bölgenin (W katkısı, L katkısı, ağırlık) değerlerini döndürür
+    
+    Bölgede 4'ten az dolu hücre varsa None döner.
+    """
+    # Boş olmayan hücreleri say
+    non_empty = w_count + l_count
+    if non_empty < 4:
+        return None
+    
+    # Bölgedeki W/L oranı
+    w_ratio = w_count / non_empty
+    l_ratio = l_count / non_empty
+    
+    weight = non_empty / area  # Doluluk oranı kadar ağırlık
+    return w_ratio * weight, l_ratio * weight, weight
+
+def _build_window_tables():
+    """Bölge konumları ve (boyut, W, L) -> katkı tablolarını oluşturur"""
+    membership = []
+    offsets = []
+    for size_index, (rows, cols) in enumerate(RECTANGLE_SIZES):
+        for i in range(6 - rows):
+            for j in range(6 - cols):
+                cells = np.zeros((5, 5), dtype=np.float32)
+                cells[i:i+rows, j:j+cols] = 1
+                membership.append(cells.ravel())
+                offsets.append(size_index * 100)
+    
+    # Katkısı olmayan bölgeler 0.0 ekler; bu toplamı değiştirmez
+    table = np.zeros((3, len(RECTANGLE_SIZES) * 100))
+    for size_index, (rows, cols) in enumerate(RECTANGLE_SIZES):
+        for w_count in range(rows * cols + 1):
+            for l_count in range(rows * cols + 1 - w_count):
+                weights = _window_weights(w_count, l_count, rows * cols)
+                if weights is not None:
+                    table[:, size_index * 100 + w_count * 10 + l_count] = weights
+    
+    return np.array(membership), np.array(offsets)[:, None], table
+
+def _build_window_lookup():
+    """Bölge başına (25 bitlik maske, W*10+L -> katkı veya None) çiftleri, bölge sırasıyla"""
+    lookup_by_size = []
+    for rows, cols in RECTANGLE_SIZES:
+        lookup = [None] * 100
+        for w_count in range(rows * cols + 1):
+            for l_count in range(rows * cols + 1 - w_count):
+                lookup[w_count * 10 + l_count] = _window_weights(w_count, l_count, rows * cols)
+        lookup_by_size.append(tuple(lookup))
+    
+    return tuple((bits, lookup_by_size[offset // 100])
+                 for bits, offset in zip(membership_bits(WINDOW_MEMBERSHIP), WINDOW_OFFSETS[:, 0]))
+
+WINDOW_MEMBERSHIP, WINDOW_OFFSETS, WINDOW_TABLE = _build_window_tables()
+WINDOW_LOOKUP = _build_window_lookup()
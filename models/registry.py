@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Tembel yüklenen model kayıt defteri
+
+Modeller görünen adları ve "modül:sınıf" biçimindeki giriş noktalarıyla
+tanımlanır; modül yalnızca model ilk kez kullanıldığında içe aktarılır.
+"""
+
+import importlib
+import threading
+from collections.abc import Mapping
+
+COMBINED_MODEL = "Karma Analiz"
+HIBRIT_MODEL = "Hibrit Analiz"
+
+# Matris yerine motorun tüm sonuç akışı indeksiyle çalışan model
+MARKOV_MODEL = "Markov (PPM)"
+
+# Görünen ad -> giriş noktası (arayüzdeki ve istatistiklerdeki model sırası)
+MODEL_ENTRY_POINTS = {
+    "Çapraz (Diagonal)": "models.diagonal:DiagonalAnalysis",
+    "Dikdörtgen": "models.rectangle:RectangleAnalysis",
+    "L-Şekli": "models.lshape:LShapeAnalysis",
+    "T-Şekli": "models.tshape:TShapeAnalysis",
+    "Spiral": "models.spiral:SpiralAnalysis",
+    "Komşuluk": "models.neighborhood:NeighborhoodAnalysis",
+    "Zig-Zag": "models.zigzag:ZigzagAnalysis",
+    "Serpme": "models.scatter:ScatterAnalysis",
+    "Kuadran": "models.quadrant:QuadrantAnalysis",
+    "Simetri": "models.symmetry:SymmetryAnalysis",
+    "Sınır": "models.border:BorderAnalysis",
+    "Isı Haritası": "models.heatmap:HeatmapAnalysis",
+    MARKOV_MODEL: "models.markov:MarkovAnalysis",
+    COMBINED_MODEL: "models.combined:CombinedAnalysis",
+    HIBRIT_MODEL: "models.hibrit:HibritAnalysis"
+}
+
+
+def base_model_names():
+    """Topluluk modelleri (Karma, Hibrit) ve Markov dışındaki matris modellerinin adlarını döndürür"""
+    return [name for name in MODEL_ENTRY_POINTS
+            if name != COMBINED_MODEL and name != HIBRIT_MODEL and name != MARKOV_MODEL]
+
+
+def register_model(name, entry_point):
+    """
+    Yeni bir modeli (veya mevcut bir modelin yerine başkasını) kaydeder
+
+    Kayıt, bundan sonra oluşturulan kayıt defterlerini etkiler. Yeni modeller
+    Karma ve Hibrit'ten önce yer alır.
+
+    Args:
+        name (str): Görünen ad
+        entry_point (str): "paket.modül:Sınıf" biçiminde giriş noktası
+    """
+    if ":" not in entry_point:
+        raise ValueError(f"Giriş noktası 'modül:sınıf' biçiminde olmalıdır: {entry_point!r}")
+
+    if name in MODEL_ENTRY_POINTS:
+        MODEL_ENTRY_POINTS[name] = entry_point
+        return
+
+    ensembles = {model_name: MODEL_ENTRY_POINTS.pop(model_name)
+                 for model_name in (COMBINED_MODEL, HIBRIT_MODEL) if model_name in MODEL_ENTRY_POINTS}
+    MODEL_ENTRY_POINTS[name] = entry_point
+    MODEL_ENTRY_POINTS.update(ensembles)
+
+
+def load_model_class(entry_point):
+    """Giriş noktasındaki model sınıfını içe aktarır ve döndürür"""
+    module_name, _, class_name = entry_point.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+class ModelRegistry(Mapping):
+    """Görünen ad -> model nesnesi eşlemesi; her model ilk erişimde oluşturulur
+
+    Adlar, uzunluk ve sıra modül içe aktarılmadan bilinir; yalnızca değerlere
+    (registry[ad], items(), values()) erişildiğinde ilgili model yüklenir.
+    """
+
+    def __init__(self, names=None):
+        """
+        Args:
+            names (iterable, optional): Kayıt defterindeki model adları (sırasıyla);
+                verilmezse tüm kayıtlı modeller
+        """
+        if names is None:
+            names = MODEL_ENTRY_POINTS
+        self._entry_points = {name: MODEL_ENTRY_POINTS[name] for name in names}
+        self._models = {}
+        self._lock = threading.Lock()
+        self._loaded = None  # Tüm modeller yüklendikten sonra kayıt sırasıyla ad -> model
+
+    def __getitem__(self, name):
+        model = self._models.get(name)
+        if model is None:
+            entry_point = self._entry_points[name]
+            with self._lock:
+                model = self._models.get(name)
+                if model is None:
+                    model = load_model_class(entry_point)()
+                    self._models[name] = model
+        return model
+
+    def __iter__(self):
+        return iter(self._entry_points)
+
+    def __len__(self):
+        return len(self._entry_points)
+
+    def __contains__(self, name):
+        return name in self._entry_points
+
+    def items(self):
+        """Tüm modelleri yükleyip (ad, model) çiftlerini kayıt sırasıyla döndürür"""
+        return self.load_all()._loaded.items()
+
+    def values(self):
+        """Tüm modelleri yükleyip kayıt sırasıyla döndürür"""
+        return self.load_all()._loaded.values()
+
+    def loaded(self):
+        """Şimdiye kadar oluşturulmuş modellerin adlarını döndürür"""
+        return [name for name in self._entry_points if name in self._models]
+
+    def load_all(self):
+        """Tüm modelleri oluşturur (ör. ilk analizden önce ısınma için)"""
+        if self._loaded is None:
+            self._loaded = {name: self[name] for name in self._entry_points}
+        return self
@@ -1,124 +1,207 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-W ve L Pattern Analiz Uygulaması
-Serpme Analiz Modeli
-"""
-
-import numpy as np
-from models.base_model import BaseAnalysisModel
-import math
-
-class ScatterAnalysis(BaseAnalysisModel):
-    """Serpme analizini yapan model"""
-    
-    def __init__(self):
-        super().__init__()
-        self.name = "Serpme Analizi"
-        self.description = "Belirli bir sonucun (W veya L) matristeki dağılımını ve kümelenme seviyesini ölçerek bir sonraki sonucu tahmin eder."
-        self.min_data_points = 5
-    
-    def analyze(self, matrix, history=None):
-        """
-        Serpme analizini yapar
-        
-        Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
-            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
-            
-        Returns:
-            int: Tahmin (0=belirsiz, 1=W, 2=L)
-        """
-        # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
-        
-        if stats['total'] < self.min_data_points:
-            return 0  # Yetersiz veri
-        
-        # W ve L konumlarını topla
-        w_positions = []
-        l_positions = []
-        
-        for row in range(5):
-            for col in range(5):
-                if matrix[row, col] == 1:
-                    w_positions.append((row, col))
-                elif matrix[row, col] == 2:
-                    l_positions.append((row, col))
-        
-        # Kümelenme seviyesini hesapla
-        w_clustering = self._calculate_clustering(w_positions)
-        l_clustering = self._calculate_clustering(l_positions)
-        
-        # Kümelenme eğilimine göre tahmin yap
-        if w_clustering > 0.3 and l_clustering > 0.3:
-            # Her iki değer de kümelenme eğiliminde
-            # Son değere göre tahmin yap
-            if history and history[-1][2] == 1:
-                return 1  # W
-            elif history and history[-1][2] == 2:
-                return 2  # L
-        elif w_clustering > 0.3:
-            # W kümelenme eğiliminde
-            return 1  # W
-        elif l_clustering > 0.3:
-            # L kümelenme eğiliminde
-            return 2  # L
-        
-        # Dağılım merkezlerini hesapla
-        if w_positions:
-            w_center = np.mean(w_positions, axis=0)
-        else:
-            w_center = (2, 2)  # Merkez
-            
-        if l_positions:
-            l_center = np.mean(l_positions, axis=0)
-        else:
-            l_center = (2, 2)  # Merkez
-        
-        # En son eklenen konumlara göre merkeze yakınlık analizi
-        if history and len(history) >= 2:
-            last_row, last_col, last_val = history[-1]
-            if last_val == 1:
-                # Son W eklendiyse, bir sonraki W tahmin et
-                distance_to_w = self._calculate_distance((last_row, last_col), w_center)
-                if distance_to_w < 1.5:  # Merkeze yakınsa
-                    return 1  # W
-                else:
-                    return 2  # L
-            else:
-                # Son L eklendiyse, bir sonraki L tahmin et
-                distance_to_l = self._calculate_distance((last_row, last_col), l_center)
-                if distance_to_l < 1.5:  # Merkeze yakınsa
-                    return 2  # L
-                else:
-                    return 1  # W
-        
-        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
-    
-    def _calculate_clustering(self, positions):
-        """Pozisyonlar arasındaki kümelenme seviyesini hesaplar"""
-        if len(positions) < 2:
-            return 0
-        
-        # Tüm noktalar arası mesafeleri hesapla
-        distances = []
-        for i in range(len(positions)):
-            for j in range(i+1, len(positions)):
-                dist = self._calculate_distance(positions[i], positions[j])
-                distances.append(dist)
-        
-        # Ortalama mesafe
-        avg_distance = np.mean(distances)
-        
-        # Kümelenme oranı (1'e yaklaştıkça daha fazla kümelenme var)
-        # 5x5 matris için max mesafe sqrt(8) = 2.83
-        clustering = 1 - (avg_distance / 2.83)
-        
-        return clustering
-    
-    def _calculate_distance(self, pos1, pos2):
-        """İki nokta arasındaki Öklid mesafesini hesaplar"""
-        return math.sqrt((pos2[0] - pos1[0])**2 + (pos2[1] - pos1[1])**2)
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Serpme Analiz Modeli
+"""
+
+import numpy as np
+from core.features import ensure_features
+from models.base_model import BaseAnalysisModel
+import math
+
+# Hücreler arası Öklid mesafeleri (25x25, düz indeksler)
+CELL_DISTANCES = np.array([[math.sqrt((b // 5 - a // 5)**2 + (b % 5 - a % 5)**2)
+                            for b in range(25)] for a in range(25)])
+CELL_DISTANCES_32 = CELL_DISTANCES.astype(np.float32)
+
+# n konum için kümelenmedeki çiftlerin (i < j) sırası, n = 0..25
+PAIR_INDICES = tuple(np.triu_indices(n, k=1) for n in range(26))
+
+# Toplu yolda kümelenme seviyesi float32 matris çarpımıyla bulunur; eşiğe bundan
+# yakın olanlar skaler yoldaki gibi yeniden hesaplanır (ölçülen yuvarlama farkı ~1e-7)
+CLUSTERING_TOLERANCE = 1e-4
+
+# Hücrelerin (satır, sütun) koordinatları (25x2)
+CELL_COORDINATES = np.stack([np.arange(25) // 5, np.arange(25) % 5], axis=1).astype(np.float32)
+
+class ScatterAnalysis(BaseAnalysisModel):
+    """Serpme analizini yapan model"""
+    
+    def __init__(self):
+        super().__init__()
+        self.name = "Serpme Analizi"
+        self.description = "Belirli bir sonucun (W veya L) matristeki dağılımını ve kümelenme seviyesini ölçerek bir sonraki sonucu tahmin eder."
+        self.min_data_points = 5
+    
+    def analyze(self, matrix, history=None, features=None):
+        """
+        Serpme analizini yapar
+        
+        Args:
+            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (MatrixFeatures, optional): Bu adım için paylaşılan matris özellikleri
+            
+        Returns:
+            int: Tahmin (0=belirsiz, 1=W, 2=L)
+        """
+        # Temel istatistikler
+        features = ensure_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
+        
+        if stats['total'] < self.min_data_points:
+            return 0  # Yetersiz veri
+        
+        # W ve L hücrelerini topla (satır sırasıyla, düz indeksler)
+        w_cells = np.flatnonzero(features.w_mask)
+        l_cells = np.flatnonzero(features.l_mask)
+        
+        # Kümelenme seviyesini hesapla
+        w_clustering = self._calculate_clustering(w_cells)
+        l_clustering = self._calculate_clustering(l_cells)
+        
+        # Kümelenme eğilimine göre tahmin yap
+        if w_clustering > 0.3 and l_clustering > 0.3:
+            # Her iki değer de kümelenme eğiliminde
+            # Son değere göre tahmin yap
+            if history and history[-1][2] == 1:
+                return 1  # W
+            elif history and history[-1][2] == 2:
+                return 2  # L
+        elif w_clustering > 0.3:
+            # W kümelenme eğiliminde
+            return 1  # W
+        elif l_clustering > 0.3:
+            # L kümelenme eğiliminde
+            return 2  # L
+        
+        # Dağılım merkezlerini hesapla
+        w_center = self._calculate_center(w_cells)
+        l_center = self._calculate_center(l_cells)
+        
+        # En son eklenen konumlara göre merkeze yakınlık analizi
+        if history and len(history) >= 2:
+            last_row, last_col, last_val = history[-1]
+            if last_val == 1:
+                # Son W eklendiyse, bir sonraki W tahmin et
+                distance_to_w = self._calculate_distance((last_row, last_col), w_center)
+                if distance_to_w < 1.5:  # Merkeze yakınsa
+                    return 1  # W
+                else:
+                    return 2  # L
+            else:
+                # Son L eklendiyse, bir sonraki L tahmin et
+                distance_to_l = self._calculate_distance((last_row, last_col), l_center)
+                if distance_to_l < 1.5:  # Merkeze yakınsa
+                    return 2  # L
+                else:
+                    return 1  # W
+        
+        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
+        return stats['prediction']
+    
+    def _calculate_clustering(self, cells):
+        """Hücreler (düz indeksler) arasındaki kümelenme seviyesini hesaplar
+        
+        Tüm çiftlerin mesafeleri mesafe tablosundan (i < j) sırasıyla tek seferde
+        okunur; ortalama, mesafeler tek tek hesaplanıp listelenmiş gibi aynıdır.
+        """
+        if len(cells) < 2:
+            return 0
+        
+        # Tüm noktalar arası mesafeler ve ortalaması
+        first, second = PAIR_INDICES[len(cells)]
+        avg_distance = np.mean(CELL_DISTANCES[cells[first], cells[second]])
+        
+        # Kümelenme oranı (1'e yaklaştıkça daha fazla kümelenme var)
+        # 5x5 matris için max mesafe sqrt(8) = 2.83
+        clustering = 1 - (avg_distance / 2.83)
+        
+        return clustering
+    
+    def _calculate_center(self, cells):
+        """Hücrelerin (düz indeksler) ortalama (satır, sütun) konumu; hücre yoksa merkez"""
+        if len(cells) == 0:
+            return (2, 2)  # Merkez
+        
+        # Koordinat toplamları tamsayıdır; bölme np.mean ile aynı sonucu verir
+        return (int((cells // 5).sum()) / len(cells), int((cells % 5).sum()) / len(cells))
+    
+    def _calculate_distance(self, pos1, pos2):
+        """İki nokta arasındaki Öklid mesafesini hesaplar"""
+        return math.sqrt((pos2[0] - pos1[0])**2 + (pos2[1] - pos1[1])**2)
+    
+    def analyze_batch(self, boards, last_moves=None):
+        """
+        Serpme analizini bir matris yığını için vektörel olarak yapar
+        
+        Args:
+            boards (numpy.ndarray): Nx5x5 matris yığını, 0=boş, 1=W, 2=L
+            last_moves (numpy.ndarray, optional): Nx3 son hamleler (row, col, value)
+        
+        Returns:
+            numpy.ndarray: N uzunluğunda tahminler (0=belirsiz, 1=W, 2=L)
+        """
+        boards, last_moves = self._prepare_batch(boards, last_moves)
+        stats = self._batch_basic_stats(boards)
+        count = len(boards)
+        w_mask = stats['w_mask'].reshape(count, 25)
+        l_mask = stats['l_mask'].reshape(count, 25)
+        
+        # Kümelenme eğilimleri (W ve L maskeleri tek yığında)
+        clustered = self._batch_clustered(np.concatenate([w_mask, l_mask]),
+                                          np.concatenate([stats['w_count'], stats['l_count']]))
+        w_clustered = clustered[:count]
+        l_clustered = clustered[count:]
+        
+        last_row, last_col, last_val = last_moves.T
+        has_last = last_val != 0
+        
+        # En son eklenen konumun kendi değerinin dağılım merkezine uzaklığı
+        w_distance = self._batch_center_distance(w_mask, stats['w_count'], last_row, last_col)
+        l_distance = self._batch_center_distance(l_mask, stats['l_count'], last_row, last_col)
+        near_w = has_last & (last_val == 1) & (w_distance < 1.5)
+        near_l = has_last & (last_val != 1) & (l_distance < 1.5)
+        
+        result = stats['prediction'].copy()
+        result[has_last] = np.where(last_val[has_last] == 1, 2, 1)
+        result[near_w] = 1
+        result[near_l] = 2
+        
+        # Kümelenme eğilimi merkez kuralından önce gelir
+        both = w_clustered & l_clustered
+        result[both & has_last] = last_val[both & has_last]
+        result[w_clustered & ~l_clustered] = 1
+        result[l_clustered & ~w_clustered] = 2
+        
+        result[stats['total'] < self.min_data_points] = 0
+        return result
+    
+    def _batch_clustered(self, masks, counts):
+        """Nx25 maske yığınında kümelenme seviyesinin 0.3'ü geçip geçmediğini bulur
+        
+        Çiftlerin mesafe toplamı mesafe tablosuyla tek matris çarpımından okunur.
+        Toplama sırası _calculate_clustering()'den farklı olduğundan eşiğe
+        CLUSTERING_TOLERANCE'tan yakın matrisler skaler yolla yeniden hesaplanır;
+        sonuç skaler karşılaştırmayla aynıdır.
+        """
+        cells = masks.astype(np.float32)
+        pair_sums = np.einsum('ij,ij->i', cells @ CELL_DISTANCES_32, cells, dtype=np.float64) / 2
+        pairs = counts * (counts - 1) // 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            clustering = np.where(counts >= 2, 1 - (pair_sums / pairs / 2.83), 0)
+        
+        for index in np.flatnonzero(np.abs(clustering - 0.3) < CLUSTERING_TOLERANCE):
+            clustering[index] = self._calculate_clustering(np.flatnonzero(masks[index]))
+        
+        return clustering > 0.3
+    
+    def _batch_center_distance(self, masks, counts, rows, cols):
+        """Her matris için (rows, cols) konumunun dağılım merkezine uzaklığını hesaplar"""
+        sums = masks.astype(np.float32) @ CELL_COORDINATES
+        with np.errstate(divide='ignore', invalid='ignore'):
+            center_row = np.where(counts > 0, sums[:, 0] / counts, 2)
+            center_col = np.where(counts > 0, sums[:, 1] / counts, 2)
+        return np.sqrt((center_row - rows)**2 + (center_col - cols)**2)
@@ -1,116 +1,118 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-W ve L Pattern Analiz Uygulaması
-Spiral Pattern Analiz Modeli
-"""
-
-import numpy as np
-from models.base_model import BaseAnalysisModel
-
-class SpiralAnalysis(BaseAnalysisModel):
-    """Spiral şeklindeki patternleri analiz eden model"""
-    
-    def __init__(self):
-        super().__init__()
-        self.name = "Spiral Pattern Analizi"
-        self.description = "Matriste dıştan içe veya içten dışa spiral şeklinde ilerleyen sonuçları analiz eder."
-        self.min_data_points = 5
-    
-    def analyze(self, matrix, history=None):
-        """
-        Spiral patternleri analiz eder
-        
-        Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
-            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
-            
-        Returns:
-            int: Tahmin (0=belirsiz, 1=W, 2=L)
-        """
-        # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
-        
-        if stats['total'] < self.min_data_points:
-            return 0  # Yetersiz veri
-        
-        # Dıştan içe doğru spiral oluştur
-        spiral_outside_in = []
-        
-        n = 5  # 5x5 matris
-        row_start, col_start = 0, 0
-        row_end, col_end = n-1, n-1
-        
-        while row_start <= row_end and col_start <= col_end:
-            # Üst satır
-            for i in range(col_start, col_end + 1):
-                if matrix[row_start, i] > 0:
-                    spiral_outside_in.append(matrix[row_start, i])
-            row_start += 1
-            
-            # Sağ sütun
-            for i in range(row_start, row_end + 1):
-                if matrix[i, col_end] > 0:
-                    spiral_outside_in.append(matrix[i, col_end])
-            col_end -= 1
-            
-            # Alt satır
-            if row_start <= row_end:
-                for i in range(col_end, col_start - 1, -1):
-                    if matrix[row_end, i] > 0:
-                        spiral_outside_in.append(matrix[row_end, i])
-                row_end -= 1
-            
-            # Sol sütun
-            if col_start <= col_end:
-                for i in range(row_end, row_start - 1, -1):
-                    if matrix[i, col_start] > 0:
-                        spiral_outside_in.append(matrix[i, col_start])
-                col_start += 1
-        
-        # İçten dışa doğru spiral (dıştan içe spirali ters çevirerek elde edilir)
-        spiral_inside_out = spiral_outside_in[::-1]
-        
-        # Her iki spiral için pattern analizi yap
-        spirals = [spiral_outside_in, spiral_inside_out]
-        
-        best_prediction = 0
-        best_confidence = 0
-        
-        for spiral in spirals:
-            if len(spiral) < 3:
-                continue
-            
-            # Son iki elemanı pattern olarak kullan
-            pattern = (spiral[-3], spiral[-2])
-            
-            # Bu pattern sonrası gelen W/L olasılıklarını hesapla
-            w_count = 0
-            l_count = 0
-            
-            for i in range(len(spiral) - 2):
-                if spiral[i] == pattern[0] and spiral[i+1] == pattern[1]:
-                    if i+2 < len(spiral):
-                        if spiral[i+2] == 1:
-                            w_count += 1
-                        elif spiral[i+2] == 2:
-                            l_count += 1
-            
-            # Olasılıkları hesapla
-            total = w_count + l_count
-            if total > 0:
-                w_prob = w_count / total
-                l_prob = l_count / total
-                
-                # En yüksek güvenle tahmini seç
-                confidence = max(w_prob, l_prob)
-                if confidence > best_confidence:
-                    best_confidence = confidence
-                    best_prediction = 1 if w_prob > l_prob else 2
-        
-        if best_prediction != 0:
-            return best_prediction
-        
-        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Spiral Pattern Analiz Modeli
+"""
+
+import numpy as np
+from core.features import SPIRAL_CELLS, ensure_features
+from models.base_model import BaseAnalysisModel
+
+class SpiralAnalysis(BaseAnalysisModel):
+    """Spiral şeklindeki patternleri analiz eden model"""
+    
+    def __init__(self):
+        super().__init__()
+        self.name = "Spiral Pattern Analizi"
+        self.description = "Matriste dıştan içe veya içten dışa spiral şeklinde ilerleyen sonuçları analiz eder."
+        self.min_data_points = 5
+    
+    def analyze(self, matrix, history=None, features=None):
+        """
+        Spiral patternleri analiz eder
+        
+        Args:
+            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (MatrixFeatures, optional): Bu adım için paylaşılan matris özellikleri
+            
+        Returns:
+            int: Tahmin (0=belirsiz, 1=W, 2=L)
+        """
+        # Temel istatistikler
+        features = ensure_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
+        
+        if stats['total'] < self.min_data_points:
+            return 0  # Yetersiz veri
+        
+        # Dıştan içe doğru spiral (boş hücreler hariç)
+        spiral_outside_in = [v for v in features.spiral.tolist() if v > 0]
+        
+        # İçten dışa doğru spiral (dıştan içe spirali ters çevirerek elde edilir)
+        spiral_inside_out = spiral_outside_in[::-1]
+        
+        # Her iki spiral için pattern analizi yap
+        spirals = [spiral_outside_in, spiral_inside_out]
+        
+        best_prediction = 0
+        best_confidence = 0
+        
+        for spiral in spirals:
+            if len(spiral) < 3:
+                continue
+            
+            # Son iki elemanı pattern olarak kullan
+            pattern = (spiral[-3], spiral[-2])
+            
+            # Bu pattern sonrası gelen W/L olasılıklarını hesapla
+            w_count = 0
+            l_count = 0
+            
+            for i in range(len(spiral) - 2):
+                if spiral[i] == pattern[0] and spiral[i+1] == pattern[1]:
+                    if i+2 < len(spiral):
+                        if spiral[i+2] == 1:
+                            w_count += 1
+                        elif spiral[i+2] == 2:
+                            l_count += 1
+            
+            # Olasılıkları hesapla
+            total = w_count + l_count
+            if total > 0:
+                w_prob = w_count / total
+                l_prob = l_count / total
+                
+                # En yüksek güvenle tahmini seç
+                confidence = max(w_prob, l_prob)
+                if confidence > best_confidence:
+                    best_confidence = confidence
+                    best_prediction = 1 if w_prob > l_prob else 2
+        
+        if best_prediction != 0:
+            return best_prediction
+        
+        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
+        return stats['prediction']
+    
+    def analyze_batch(self, boards, last_moves=None):
+        """
+        Spiral patternleri bir matris yığını için vektörel olarak analiz eder
+        
+        Args:
+            boards (numpy.ndarray): Nx5x5 matris yığını, 0=boş, 1=W, 2=L
+            last_moves (numpy.ndarray, optional): Nx3 son hamleler (kullanılmaz)
+        
+        Returns:
+            numpy.ndarray: N uzunluğunda tahminler (0=belirsiz, 1=W, 2=L)
+        """
+        boards, last_moves = self._prepare_batch(boards, last_moves)
+        stats = self._batch_basic_stats(boards)
+        
+        outside_in = boards.reshape(len(boards), 25)[:, SPIRAL_CELLS]
+        
+        # Dıştan içe ve içten dışa spiral; eşit güvende ilk spiral kalır
+        best_prediction = np.zeros(len(boards), dtype=np.int8)
+        best_confidence = np.zeros(len(boards))
+        for spiral in (outside_in, outside_in[:, ::-1]):
+            prediction, confidence = self._batch_sequence_vote(spiral)
+            better = confidence > best_confidence
+            best_prediction[better] = prediction[better]
+            best_confidence[better] = confidence[better]
+        
+        result = np.where(best_prediction != 0, best_prediction, stats['prediction']).astype(np.int8)
+        result[stats['total'] < self.min_data_points] = 0
+        return result
+
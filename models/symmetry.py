@@ -1,149 +1,234 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-W ve L Pattern Analiz Uygulaması
-Simetri Analiz Modeli
-"""
-
-import numpy as np
-from models.base_model import BaseAnalysisModel
-
-class SymmetryAnalysis(BaseAnalysisModel):
-    """Simetri analizini yapan model"""
-    
-    def __init__(self):
-        super().__init__()
-        self.name = "Simetri Analizi"
-        self.description = "Matristeki sonuçların yatay, dikey veya çapraz simetri gösterip göstermediğini ve bunun sonuçları nasıl etkilediğini inceler."
-        self.min_data_points = 5
-    
-    def analyze(self, matrix, history=None):
-        """
-        Simetri analizini yapar
-        
-        Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
-            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
-            
-        Returns:
-            int: Tahmin (0=belirsiz, 1=W, 2=L)
-        """
-        # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
-        
-        if stats['total'] < self.min_data_points:
-            return 0  # Yetersiz veri
-        
-        # Boş olmayan hücreleri işaretle
-        non_empty = matrix > 0
-        
-        # Yatay simetri skoru (yatay eksene göre)
-        h_sym_score = 0
-        h_sym_total = 0
-        
-        for row in range(2):  # Sadece üst yarıyı kontrol et (orta satır hariç)
-            for col in range(5):
-                mirror_row = 4 - row  # Alttan ayna görüntüsü
-                
-                # Her iki hücre de doluysa karşılaştır
-                if non_empty[row, col] and non_empty[mirror_row, col]:
-                    h_sym_total += 1
-                    if matrix[row, col] == matrix[mirror_row, col]:
-                        h_sym_score += 1
-        
-        h_symmetry = h_sym_score / h_sym_total if h_sym_total > 0 else 0
-        
-        # Dikey simetri skoru (dikey eksene göre)
-        v_sym_score = 0
-        v_sym_total = 0
-        
-        for row in range(5):
-            for col in range(2):  # Sadece sol yarıyı kontrol et (orta sütun hariç)
-                mirror_col = 4 - col  # Sağdan ayna görüntüsü
-                
-                # Her iki hücre de doluysa karşılaştır
-                if non_empty[row, col] and non_empty[row, mirror_col]:
-                    v_sym_total += 1
-                    if matrix[row, col] == matrix[row, mirror_col]:
-                        v_sym_score += 1
-        
-        v_symmetry = v_sym_score / v_sym_total if v_sym_total > 0 else 0
-        
-        # Çapraz simetri skoru (ana köşegen ve ters köşegene göre)
-        d1_sym_score = 0
-        d1_sym_total = 0
-        
-        for i in range(2):  # Sadece köşegenin üst kısmını kontrol et (orta hariç)
-            for j in range(i, 5):
-                if i != j:  # Köşegendeki hücreleri hariç tut
-                    # Ana köşegene göre simetri
-                    if non_empty[i, j] and non_empty[j, i]:
-                        d1_sym_total += 1
-                        if matrix[i, j] == matrix[j, i]:
-                            d1_sym_score += 1
-        
-        d1_symmetry = d1_sym_score / d1_sym_total if d1_sym_total > 0 else 0
-        
-        # Ters köşegen simetrisi
-        d2_sym_score = 0
-        d2_sym_total = 0
-        
-        for i in range(2):  # Sadece köşegenin üst kısmını kontrol et (orta hariç)
-            for j in range(5-i-1):
-                if i != 4-j:  # Köşegendeki hücreleri hariç tut
-                    # Ters köşegene göre simetri
-                    if non_empty[i, j] and non_empty[4-j, 4-i]:
-                        d2_sym_total += 1
-                        if matrix[i, j] == matrix[4-j, 4-i]:
-                            d2_sym_score += 1
-        
-        d2_symmetry = d2_sym_score / d2_sym_total if d2_sym_total > 0 else 0
-        
-        # Genel simetri skoru
-        symmetry_scores = [h_symmetry, v_symmetry, d1_symmetry, d2_symmetry]
-        valid_scores = [s for s in symmetry_scores if s > 0]
-        
-        if valid_scores:
-            overall_symmetry = sum(valid_scores) / len(valid_scores)
-        else:
-            overall_symmetry = 0
-        
-        # Simetri analizi sonuçlarına göre tahmin
-        if overall_symmetry > 0.7:
-            # Yüksek simetri var, simetriye göre pattern devam eder
-            if history and len(history) > 0:
-                last_row, last_col, last_val = history[-1]
-                
-                # Yatay simetri yüksekse, yatay ayna noktasına bak
-                if h_symmetry > 0.6:
-                    mirror_row = 4 - last_row
-                    if 0 <= mirror_row < 5 and matrix[mirror_row, last_col] > 0:
-                        return matrix[mirror_row, last_col]  # Ayna görüntüsü değeri
-                
-                # Dikey simetri yüksekse, dikey ayna noktasına bak
-                if v_symmetry > 0.6:
-                    mirror_col = 4 - last_col
-                    if 0 <= mirror_col < 5 and matrix[last_row, mirror_col] > 0:
-                        return matrix[last_row, mirror_col]  # Ayna görüntüsü değeri
-                
-                # Çapraz simetri yüksekse, çapraz ayna noktasına bak
-                if d1_symmetry > 0.6:
-                    if matrix[last_col, last_row] > 0:
-                        return matrix[last_col, last_row]  # Ana köşegen ayna görüntüsü
-                
-                if d2_symmetry > 0.6:
-                    if matrix[4-last_col, 4-last_row] > 0:
-                        return matrix[4-last_col, 4-last_row]  # Ters köşegen ayna görüntüsü
-        
-        # Simetri kırılma eğilimi
-        if 0.3 < overall_symmetry < 0.7 and history and len(history) > 0:
-            # Kısmi simetri var, kırılma eğilimi olabilir
-            last_val = history[-1][2]  # Son hamlenin değerini al
-            if last_val == 1:
-                return 2  # W sonrası L
-            elif last_val == 2:
-                return 1  # L sonrası W
-        
-        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Simetri Analiz Modeli
+"""
+
+import numpy as np
+from core.features import ensure_features
+from models.base_model import BaseAnalysisModel
+
+def _build_symmetry_tables():
+    """Simetri hücre çiftlerini ve hücre -> ayna hücre tablosunu oluşturur
+    
+    Çiftler analyze() içindeki yatay, dikey, ana köşegen ve ters köşegen
+    karşılaştırmalarıyla aynıdır (düz indeks olarak); dört simetrinin çiftleri
+    tek dizide art arda durur ve her simetrinin aralığı ayrıca döndürülür.
+    """
+    horizontal = [(row * 5 + col, (4 - row) * 5 + col) for row in range(2) for col in range(5)]
+    vertical = [(row * 5 + col, row * 5 + 4 - col) for row in range(5) for col in range(2)]
+    diagonal = [(i * 5 + j, j * 5 + i) for i in range(2) for j in range(i, 5) if i != j]
+    anti_diagonal = [(i * 5 + j, (4 - j) * 5 + 4 - i)
+                     for i in range(2) for j in range(5 - i - 1) if i != 4 - j]
+    groups = (horizontal, vertical, diagonal, anti_diagonal)
+    pairs = np.array([pair for group in groups for pair in group]).T
+    ends = np.cumsum([len(group) for group in groups]).tolist()
+    bounds = tuple(zip((0, *ends[:-1]), ends))
+    
+    # Son hamlenin yatay, dikey, ana köşegen ve ters köşegen ayna hücreleri
+    mirrors = np.array([[(4 - row) * 5 + col, row * 5 + 4 - col,
+                         col * 5 + row, (4 - col) * 5 + 4 - row]
+                        for row in range(5) for col in range(5)])
+    return pairs, bounds, mirrors
+
+SYMMETRY_PAIRS, PAIR_BOUNDS, MIRROR_CELLS = _build_symmetry_tables()
+
+class SymmetryAnalysis(BaseAnalysisModel):
+    """Simetri analizini yapan model"""
+    
+    def __init__(self):
+        super().__init__()
+        self.name = "Simetri Analizi"
+        self.description = "Matristeki sonuçların yatay, dikey veya çapraz simetri gösterip göstermediğini ve bunun sonuçları nasıl etkilediğini inceler."
+        self.min_data_points = 5
+    
+    def analyze(self, matrix, history=None, features=None):
+        """
+        Simetri analizini yapar
+        
+        Args:
+            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (MatrixFeatures, optional): Bu adım için paylaşılan matris özellikleri
+            
+        Returns:
+            int: Tahmin (0=belirsiz, 1=W, 2=L)
+        """
+        # Temel istatistikler
+        features = ensure_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
+        
+        if stats['total'] < self.min_data_points:
+            return 0  # Yetersiz veri
+        
+        # Boş olmayan hücreleri işaretle
+        non_empty = features.non_empty
+        
+        # Yatay simetri skoru (yatay eksene göre)
+        h_sym_score = 0
+        h_sym_total = 0
+        
+        for row in range(2):  # Sadece üst yarıyı kontrol et (orta satır hariç)
+            for col in range(5):
+                mirror_row = 4 - row  # Alttan ayna görüntüsü
+                
+                # Her iki hücre de doluysa karşılaştır
+                if non_empty[row, col] and non_empty[mirror_row, col]:
+                    h_sym_total += 1
+                    if matrix[row, col] == matrix[mirror_row, col]:
+                        h_sym_score += 1
+        
+        h_symmetry = h_sym_score / h_sym_total if h_sym_total > 0 else 0
+        
+        # Dikey simetri skoru (dikey eksene göre)
+        v_sym_score = 0
+        v_sym_total = 0
+        
+        for row in range(5):
+            for col in range(2):  # Sadece sol yarıyı kontrol et (orta sütun hariç)
+                mirror_col = 4 - col  # Sağdan ayna görüntüsü
+                
+                # Her iki hücre de doluysa karşılaştır
+                if non_empty[row, col] and non_empty[row, mirror_col]:
+                    v_sym_total += 1
+                    if matrix[row, col] == matrix[row, mirror_col]:
+                        v_sym_score += 1
+        
+        v_symmetry = v_sym_score / v_sym_total if v_sym_total > 0 else 0
+        
+        # Çapraz simetri skoru (ana köşegen ve ters köşegene göre)
+        d1_sym_score = 0
+        d1_sym_total = 0
+        
+        for i in range(2):  # Sadece köşegenin üst kısmını kontrol et (orta hariç)
+            for j in range(i, 5):
+                if i != j:  # Köşegendeki hücreleri hariç tut
+                    # Ana köşegene göre simetri
+                    if non_empty[i, j] and non_empty[j, i]:
+                        d1_sym_total += 1
+                        if matrix[i, j] == matrix[j, i]:
+                            d1_sym_score += 1
+        
+        d1_symmetry = d1_sym_score / d1_sym_total if d1_sym_total > 0 else 0
+        
+        # Ters köşegen simetrisi
+        d2_sym_score = 0
+        d2_sym_total = 0
+        
+        for i in range(2):  # Sadece köşegenin üst kısmını kontrol et (orta hariç)
+            for j in range(5-i-1):
+                if i != 4-j:  # Köşegendeki hücreleri hariç tut
+                    # Ters köşegene göre simetri
+                    if non_empty[i, j] and non_empty[4-j, 4-i]:
+                        d2_sym_total += 1
+                        if matrix[i, j] == matrix[4-j, 4-i]:
+                            d2_sym_score += 1
+        
+        d2_symmetry = d2_sym_score / d2_sym_total if d2_sym_total > 0 else 0
+        
+        # Genel simetri skoru
+        symmetry_scores = [h_symmetry, v_symmetry, d1_symmetry, d2_symmetry]
+        valid_scores = [s for s in symmetry_scores if s > 0]
+        
+        if valid_scores:
+            overall_symmetry = sum(valid_scores) / len(valid_scores)
+        else:
+            overall_symmetry = 0
+        
+        # Simetri analizi sonuçlarına göre tahmin
+        if overall_symmetry > 0.7:
+            # Yüksek simetri var, simetriye göre pattern devam eder
+            if history and len(history) > 0:
+                last_row, last_col, last_val = history[-1]
+                
+                # Yatay simetri yüksekse, yatay ayna noktasına bak
+                if h_symmetry > 0.6:
+                    mirror_row = 4 - last_row
+                    if 0 <= mirror_row < 5 and matrix[mirror_row, last_col] > 0:
+                        return matrix[mirror_row, last_col]  # Ayna görüntüsü değeri
+                
+                # Dikey simetri yüksekse, dikey ayna noktasına bak
+                if v_symmetry > 0.6:
+                    mirror_col = 4 - last_col
+                    if 0 <= mirror_col < 5 and matrix[last_row, mirror_col] > 0:
+                        return matrix[last_row, mirror_col]  # Ayna görüntüsü değeri
+                
+                # Çapraz simetri yüksekse, çapraz ayna noktasına bak
+                if d1_symmetry > 0.6:
+                    if matrix[last_col, last_row] > 0:
+                        return matrix[last_col, last_row]  # Ana köşegen ayna görüntüsü
+                
+                if d2_symmetry > 0.6:
+                    if matrix[4-last_col, 4-last_row] > 0:
+                        return matrix[4-last_col, 4-last_row]  # Ters köşegen ayna görüntüsü
+        
+        # Simetri kırılma eğilimi
+        if 0.3 < overall_symmetry < 0.7 and history and len(history) > 0:
+            # Kısmi simetri var, kırılma eğilimi olabilir
+            last_val = history[-1][2]  # Son hamlenin değerini al
+            if last_val == 1:
+                return 2  # W sonrası L
+            elif last_val == 2:
+                return 1  # L sonrası W
+        
+        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
+        return stats['prediction']
+    
+    def analyze_batch(self, boards, last_moves=None):
+        """
+        Simetri analizini bir matris yığını için vektörel olarak yapar
+        
+        Args:
+            boards (numpy.ndarray): Nx5x5 matris yığını, 0=boş, 1=W, 2=L
+            last_moves (numpy.ndarray, optional): Nx3 son hamleler (row, col, value)
+        
+        Returns:
+            numpy.ndarray: N uzunluğunda tahminler (0=belirsiz, 1=W, 2=L)
+        """
+        boards, last_moves = self._prepare_batch(boards, last_moves)
+        stats = self._batch_basic_stats(boards)
+        count = len(boards)
+        flat = boards.reshape(count, 25)
+        
+        # Yatay, dikey, ana köşegen ve ters köşegen simetri skorları (4xN): tüm
+        # çiftler hücre satırlarından tek seferde okunur, sayımlar her simetrinin
+        # çift aralığı boyunca toplanır
+        cells = np.ascontiguousarray(flat.T)
+        a = cells[SYMMETRY_PAIRS[0]]
+        b = cells[SYMMETRY_PAIRS[1]]
+        both = (a > 0) & (b > 0)
+        filled = both.view(np.uint8)
+        matched = (both & (a == b)).view(np.uint8)
+        sym_total = np.stack([filled[start:end].sum(axis=0, dtype=np.uint8) for start, end in PAIR_BOUNDS])
+        sym_score = np.stack([matched[start:end].sum(axis=0, dtype=np.uint8) for start, end in PAIR_BOUNDS])
+        
+        # Karşılaştırma yoksa skor da 0'dır; 0 / 1 skaler yoldaki 0 ile aynıdır
+        symmetry = sym_score / np.maximum(sym_total, 1)
+        
+        # Genel simetri skoru: pozitif skorların sırayla toplamı / sayısı (0 skorlar
+        # toplamı değiştirmez)
+        valid_count = np.count_nonzero(symmetry > 0, axis=0)
+        score_sum = symmetry[0] + symmetry[1] + symmetry[2] + symmetry[3]
+        overall_symmetry = score_sum / np.maximum(valid_count, 1)
+        
+        last_row, last_col, last_val = last_moves.T
+        has_last = last_val != 0
+        
+        result = stats['prediction'].copy()
+        
+        # Simetri kırılma eğilimi: kısmi simetride son değerin tersi (1 <-> 2)
+        breaking = has_last & (overall_symmetry > 0.3) & (overall_symmetry < 0.7)
+        result[breaking] = 3 - last_val[breaking]
+        
+        # Yüksek simetride ilk uygun ayna görüntüsünün değeri (yalnızca bu matrisler için okunur)
+        high = np.flatnonzero(has_last & (overall_symmetry > 0.7))
+        mirror_values = flat[high[:, None], MIRROR_CELLS[last_row[high] * 5 + last_col[high]]]
+        use_mirror = (symmetry[:, high].T > 0.6) & (mirror_values > 0)
+        chosen = use_mirror.any(axis=1)
+        first = np.argmax(use_mirror, axis=1)
+        result[high[chosen]] = mirror_values[chosen, first[chosen]]
+        
+        result[stats['total'] < self.min_data_points] = 0
+        return result
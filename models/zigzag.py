@@ -1,119 +1,127 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-W ve L Pattern Analiz Uygulaması
-Zig-Zag Pattern Analiz Modeli
-"""
-
-import numpy as np
-from models.base_model import BaseAnalysisModel
-
-class ZigzagAnalysis(BaseAnalysisModel):
-    """Zig-zag patternlerini analiz eden model"""
-    
-    def __init__(self):
-        super().__init__()
-        self.name = "Zig-Zag Pattern Analizi"
-        self.description = "Matris üzerinde zig-zag şeklinde ilerleyen sonuçları inceler."
-        self.min_data_points = 5
-    
-    def analyze(self, matrix, history=None):
-        """
-        Zig-zag patternleri analiz eder
-        
-        Args:
-            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
-            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
-            
-        Returns:
-            int: Tahmin (0=belirsiz, 1=W, 2=L)
-        """
-        # Temel istatistikler
-        stats = self._calculate_basic_stats(matrix)
-        
-        if stats['total'] < self.min_data_points:
-            return 0  # Yetersiz veri
-        
-        # Farklı zig-zag patternleri oluştur
-        zigzags = []
-        
-        # Yatay zigzag (soldan sağa, sağdan sola alternatif olarak)
-        horizontal_zigzag = []
-        for row in range(5):
-            if row % 2 == 0:  # Soldan sağa
-                for col in range(5):
-                    if matrix[row, col] > 0:
-                        horizontal_zigzag.append(matrix[row, col])
-            else:  # Sağdan sola
-                for col in range(4, -1, -1):
-                    if matrix[row, col] > 0:
-                        horizontal_zigzag.append(matrix[row, col])
-        
-        zigzags.append(horizontal_zigzag)
-        
-        # Dikey zigzag (yukarıdan aşağı, aşağıdan yukarı alternatif olarak)
-        vertical_zigzag = []
-        for col in range(5):
-            if col % 2 == 0:  # Yukarıdan aşağı
-                for row in range(5):
-                    if matrix[row, col] > 0:
-                        vertical_zigzag.append(matrix[row, col])
-            else:  # Aşağıdan yukarı
-                for row in range(4, -1, -1):
-                    if matrix[row, col] > 0:
-                        vertical_zigzag.append(matrix[row, col])
-        
-        zigzags.append(vertical_zigzag)
-        
-        # Çapraz zigzag (ana köşegen boyunca)
-        diagonal_zigzag = []
-        for i in range(5):
-            if matrix[i, i] > 0:
-                diagonal_zigzag.append(matrix[i, i])
-        for i in range(3, -1, -1):
-            if matrix[i, 4-i] > 0:
-                diagonal_zigzag.append(matrix[i, 4-i])
-        
-        zigzags.append(diagonal_zigzag)
-        
-        # Her zigzag pattern için analiz yap
-        best_prediction = 0
-        best_confidence = 0
-        
-        for zigzag in zigzags:
-            if len(zigzag) < 3:
-                continue
-            
-            # Son iki elemanı pattern olarak kullan
-            pattern = (zigzag[-3], zigzag[-2])
-            
-            # Bu pattern sonrası gelen W/L olasılıklarını hesapla
-            w_count = 0
-            l_count = 0
-            
-            for i in range(len(zigzag) - 2):
-                if zigzag[i] == pattern[0] and zigzag[i+1] == pattern[1]:
-                    if i+2 < len(zigzag):
-                        if zigzag[i+2] == 1:
-                            w_count += 1
-                        elif zigzag[i+2] == 2:
-                            l_count += 1
-            
-            # Olasılıkları hesapla
-            total = w_count + l_count
-            if total > 0:
-                w_prob = w_count / total
-                l_prob = l_count / total
-                
-                # En yüksek güvenle tahmini seç
-                confidence = max(w_prob, l_prob)
-                if confidence > best_confidence:
-                    best_confidence = confidence
-                    best_prediction = 1 if w_prob > l_prob else 2
-        
-        if best_prediction != 0:
-            return best_prediction
-        
-        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
-        return stats['prediction']
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Zig-Zag Pattern Analiz Modeli
+"""
+
+import numpy as np
+from core.features import ensure_features
+from models.base_model import BaseAnalysisModel
+
+class ZigzagAnalysis(BaseAnalysisModel):
+    """Zig-zag patternlerini analiz eden model"""
+    
+    def __init__(self):
+        super().__init__()
+        self.name = "Zig-Zag Pattern Analizi"
+        self.description = "Matris üzerinde zig-zag şeklinde ilerleyen sonuçları inceler."
+        self.min_data_points = 5
+    
+    def analyze(self, matrix, history=None, features=None):
+        """
+        Zig-zag patternleri analiz eder
+        
+        Args:
+            matrix (numpy.ndarray): 5x5 matris, 0=boş, 1=W, 2=L
+            history (list, optional): Geçmiş hamlelerin listesi (row, col, value)
+            features (MatrixFeatures, optional): Bu adım için paylaşılan matris özellikleri
+            
+        Returns:
+            int: Tahmin (0=belirsiz, 1=W, 2=L)
+        """
+        # Temel istatistikler
+        features = ensure_features(matrix, history, features)
+        stats = self._calculate_basic_stats(matrix, features)
+        
+        if stats['total'] < self.min_data_points:
+            return 0  # Yetersiz veri
+        
+        # Yatay, dikey ve çapraz zig-zag sıralarındaki dolu hücreler
+        cells = features.cells
+        zigzags = [[cells[cell] for cell in order if cells[cell] > 0] for order in ZIGZAG_ORDERS]
+        
+        # Her zigzag pattern için analiz yap
+        best_prediction = 0
+        best_confidence = 0
+        
+        for zigzag in zigzags:
+            if len(zigzag) < 3:
+                continue
+            
+            # Son iki elemanı pattern olarak kullan
+            pattern = (zigzag[-3], zigzag[-2])
+            
+            # Bu pattern sonrası gelen W/L olasılıklarını hesapla
+            w_count = 0
+            l_count = 0
+            
+            for i in range(len(zigzag) - 2):
+                if zigzag[i] == pattern[0] and zigzag[i+1] == pattern[1]:
+                    if i+2 < len(zigzag):
+                        if zigzag[i+2] == 1:
+                            w_count += 1
+                        elif zigzag[i+2] == 2:
+                            l_count += 1
+            
+            # Olasılıkları hesapla
+            total = w_count + l_count
+            if total > 0:
+                w_prob = w_count / total
+                l_prob = l_count / total
+                
+                # En yüksek güvenle tahmini seç
+                confidence = max(w_prob, l_prob)
+                if confidence > best_confidence:
+                    best_confidence = confidence
+                    best_prediction = 1 if w_prob > l_prob else 2
+        
+        if best_prediction != 0:
+            return best_prediction
+        
+        # Belirgin bir pattern yoksa genel istatistiklere göre tahmin yap
+        return stats['prediction']
+    
+    def analyze_batch(self, boards, last_moves=None):
+        """
+        Zig-zag patternleri bir matris yığını için vektörel olarak analiz eder
+        
+        Args:
+            boards (numpy.ndarray): Nx5x5 matris yığını, 0=boş, 1=W, 2=L
+            last_moves (numpy.ndarray, optional): Nx3 son hamleler (kullanılmaz)
+        
+        Returns:
+            numpy.ndarray: N uzunluğunda tahminler (0=belirsiz, 1=W, 2=L)
+        """
+        boards, last_moves = self._prepare_batch(boards, last_moves)
+        stats = self._batch_basic_stats(boards)
+        flat = boards.reshape(len(boards), 25)
+        
+        # Eşit güvende önce gelen zig-zag kalır
+        best_prediction = np.zeros(len(boards), dtype=np.int8)
+        best_confidence = np.zeros(len(boards))
+        for cells in ZIGZAG_CELLS:
+            prediction, confidence = self._batch_sequence_vote(flat[:, cells])
+            better = confidence > best_confidence
+            best_prediction[better] = prediction[better]
+            best_confidence[better] = confidence[better]
+        
+        result = np.where(best_prediction != 0, best_prediction, stats['prediction']).astype(np.int8)
+        result[stats['total'] < self.min_data_points] = 0
+        return result
+
+
+def _build_zigzag_cells():
+    """Yatay, dikey ve çapraz zig-zag sıralarındaki düz hücre indeksleri"""
+    horizontal = [row * 5 + (col if row % 2 == 0 else 4 - col)
+                  for row in range(5) for col in range(5)]
+    vertical = [(row if col % 2 == 0 else 4 - row) * 5 + col
+                for col in range(5) for row in range(5)]
+    
+    # Çapraz zig-zag merkez hücreyi iki kez içerir
+    diagonal = [i * 5 + i for i in range(5)] + [i * 5 + 4 - i for i in range(3, -1, -1)]
+    return tuple(np.array(cells) for cells in (horizontal, vertical, diagonal))
+
+ZIGZAG_CELLS = _build_zigzag_cells()
+ZIGZAG_ORDERS = tuple(tuple(cells.tolist()) for cells in ZIGZAG_CELLS)
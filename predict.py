@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Komut satırı tahmin aracı (Qt gerektirmez)
+
+Girdinin her satırı W/L (veya 1/2) karakterleri ya da bir JSON değeri olabilir:
+"W", 1, ["W", "L"] veya {"outcome": "W"}. Her sonuç için tüm modellerin
+oylarını ve Hibrit güvenini içeren bir JSON satırı yazılır.
+
+Kullanım (depo kök dizininden):
+    python predict.py sonuclar.txt
+    tail -f sonuclar.txt | python predict.py
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from core.backtest import parse_outcomes
+from core.engine import AnalysisEngine, HIBRIT_MODEL
+
+# Bir seferde okunan en fazla bayt sayısı
+READ_SIZE = 65536
+
+# Tahmin kodu -> JSON oyu
+VOTES = {0: None, 1: "W", 2: "L"}
+
+# JSON girdisindeki sonuç değerleri
+_JSON_OUTCOMES = {"W": 1, "w": 1, "1": 1, 1: 1, "L": 2, "l": 2, "2": 2, 2: 2}
+
+# JSON girdisinde sonucu taşıyabilen alanlar
+_JSON_FIELDS = ("outcome", "value", "result")
+
+
+def json_outcomes(value):
+    """JSON değerindeki sonuçları listeye çevirir"""
+    if isinstance(value, list):
+        return [outcome for item in value for outcome in json_outcomes(item)]
+
+    if isinstance(value, dict):
+        for field in _JSON_FIELDS:
+            if field in value:
+                return json_outcomes(value[field])
+        raise ValueError(f"JSON nesnesinde sonuç alanı yok ({', '.join(_JSON_FIELDS)})")
+
+    if isinstance(value, str) and len(value) > 1:
+        return parse_outcomes(value.encode("ascii", errors="replace")).tolist()
+
+    if isinstance(value, bool) or value not in _JSON_OUTCOMES:
+        raise ValueError(f"Geçersiz sonuç değeri: {value!r}")
+    return [_JSON_OUTCOMES[value]]
+
+
+def parse_line(line):
+    """
+    Bir girdi satırındaki sonuçları döndürür
+
+    Args:
+        line (bytes): W/L karakterleri veya JSON değeri
+
+    Returns:
+        list: Sonuçlar (1=W, 2=L)
+    """
+    stripped = line.strip()
+    if stripped[:1] in (b"{", b"[", b'"'):
+        return json_outcomes(json.loads(stripped))
+    return parse_outcomes(stripped).tolist()
+
+
+def parse_lines(lines, first_line=1):
+    """
+    Bir satır grubundaki sonuçları sırayla döndürür
+
+    JSON içermeyen gruplar tek seferde çevrilir; hata varsa hatalı satır
+    numarasıyla bildirilir.
+
+    Args:
+        lines (list): bytes satırları
+        first_line (int, optional): İlk satırın girdideki numarası
+
+    Returns:
+        list: Sonuçlar (1=W, 2=L)
+    """
+    data = b"\n".join(lines)
+    if b"{" not in data and b"[" not in data and b'"' not in data:
+        try:
+            return parse_outcomes(data).tolist()
+        except ValueError:
+            pass  # Hatalı satır aşağıda satır satır bulunur
+
+    outcomes = []
+    for number, line in enumerate(lines, first_line):
+        try:
+            outcomes.extend(parse_line(line))
+        except ValueError as error:
+            raise ValueError(f"Satır {number}: {error}") from None
+    return outcomes
+
+
+def iter_line_batches(stream):
+    """
+    Girdiden o anda okunabilen tam satırları toplu olarak verir
+
+    Boru hattında her satır geldiği anda işlenir; dosyadan okunurken satırlar
+    büyük parçalar halinde gelir ve modeller toplu çalışır.
+
+    Yields:
+        list: bytes satırları
+    """
+    descriptor = stream.fileno()
+    pending = b""
+
+    while True:
+        data = os.read(descriptor, READ_SIZE)
+        if not data:
+            break
+
+        pending += data
+        end = pending.rfind(b"\n")
+        if end < 0:
+            continue
+
+        lines, pending = pending[:end + 1], pending[end + 1:]
+        yield lines.splitlines()
+
+    if pending.strip():
+        yield [pending]
+
+
+def step_record(step, value, row, col, predictions, confidence):
+    """Bir adımın JSON çıktısını oluşturur"""
+    return {
+        "step": step,
+        "outcome": VOTES[value],
+        "row": row,
+        "col": col,
+        "votes": {model_name: VOTES[prediction] for model_name, prediction in predictions.items()
+                  if model_name != HIBRIT_MODEL},
+        "hibrit": VOTES[predictions.get(HIBRIT_MODEL, 0)],
+        "confidence": confidence if predictions else None
+    }
+
+
+def run(stream, output, engine=None):
+    """
+    Girdideki sonuçları oynatır ve her adım için bir JSON satırı yazar
+
+    Args:
+        stream (file): Okunacak ikili dosya (fileno() desteklemeli)
+        output (file): JSON satırlarının yazılacağı metin dosyası
+        engine (AnalysisEngine, optional): Kullanılacak motor
+
+    Returns:
+        int: İşlenen sonuç sayısı
+    """
+    if engine is None:
+        engine = AnalysisEngine(cache_size=0)
+
+    step = 0
+    line_number = 1
+    for lines in iter_line_batches(stream):
+        outcomes = parse_lines(lines, line_number)
+        line_number += len(lines)
+
+        for value, (row, col, predictions, confidence) in zip(outcomes, engine.step_batch(outcomes)):
+            step += 1
+            output.write(json.dumps(step_record(step, value, row, col, predictions, confidence),
+                                    ensure_ascii=False) + "\n")
+            output.flush()
+
+    return step
+
+
+def main():
+    parser = argparse.ArgumentParser(description="W/L sonuçlarından adım adım JSONL tahminleri üretir")
+    parser.add_argument("source", nargs="?", default="-",
+                        help="Sonuç dosyası ('-' veya verilmezse standart girdi)")
+    args = parser.parse_args()
+
+    try:
+        if args.source == "-":
+            run(sys.stdin.buffer, sys.stdout)
+        else:
+            with open(args.source, "rb") as stream:
+                run(stream, sys.stdout)
+    except ValueError as error:
+        print(f"Hata: {error}", file=sys.stderr)
+        sys.exit(1)
+    except BrokenPipeError:
+        # Okuyan taraf kapandı (ör. head); sessizce çık
+        sys.stderr.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması
+Çok oturumlu yerel tahmin sunucusu (asyncio, HTTP/JSON; Qt gerektirmez)
+
+Uç noktalar:
+    POST   /sessions                   Yeni oturum açar ({"name": ...} isteğe bağlı)
+    GET    /sessions                   Açık oturumları listeler
+    GET    /sessions/<kimlik>          Oturumun matrisi ve bekleyen Hibrit tahmini
+    POST   /sessions/<kimlik>/outcome  Sonuç(lar)ı ekler, her biri için tahmin döndürür
+    DELETE /sessions/<kimlik>          Oturumu kapatır
+    GET    /stats                      İstek ve toplu iş sayaçları
+
+Sonuç gövdesi predict.py girdisiyle aynıdır: "W", ["W", "L"], {"outcome": "L"}
+veya düz W/L karakterleri.
+
+Kullanım (depo kök dizininden):
+    python server.py --port 8765
+    curl -X POST http://127.0.0.1:8765/sessions
+    curl -d '"W"' http://127.0.0.1:8765/sessions/<kimlik>/outcome
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+from core.engine import HIBRIT_MODEL, AnalysisEngine, step_engines
+from core.session_state import SessionState
+from predict import VOTES, parse_line, step_record
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Analiz iş parçacığı sayısı; oturumlar bu sayıda gruba dağıtılır
+DEFAULT_WORKERS = 1
+
+# İstek gövdesinin en fazla boyutu (bayt)
+MAX_BODY_SIZE = 1 << 20
+
+# Bir toplu işte aynı anda motora yüklenen en fazla oturum; daha büyük toplu işler
+# bu boyutta parçalar halinde analiz edilir (grubun motor sayısı da bununla sınırlıdır)
+MAX_BATCH_SESSIONS = 256
+
+# Bir istekte kabul edilen en fazla başlık satırı
+MAX_HEADER_LINES = 100
+
+
+class HTTPError(Exception):
+    """İstemciye durum koduyla bildirilen istek hatası"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class Session:
+    """Sunucudaki bir oturum: kendi matrisi, geçmişi ve model istatistikleri
+
+    Boştaki oturum yalnızca sıkıştırılmış bir SessionState tutar; analiz sırasında
+    durum grubun paylaşılan motorlarından birine yüklenir ve toplu işin sonunda
+    yeni bir SessionState olarak geri alınır. Olay döngüsü yalnızca bu değişmeyen
+    anlık görüntüyü okur.
+    """
+
+    __slots__ = ('id', 'name', 'shard', 'steps', 'state')
+
+    def __init__(self, session_id, name=None, shard=0):
+        """
+        Args:
+            session_id (str): Oturum kimliği
+            name (str, optional): Oturum adı
+            shard (int, optional): Oturumun analiz edildiği grup
+        """
+        self.id = session_id
+        self.name = name
+        self.shard = shard
+        self.steps = 0
+        self.state = SessionState()
+
+    def describe(self, model_names):
+        """Oturumun matrisini ve bir sonraki sonuç için bekleyen tahminleri döndürür"""
+        state = self.state
+        predictions = (dict(zip(model_names, state.predictions))
+                       if state.predictions is not None else {})
+        return {"session": self.id, "name": self.name, "steps": self.steps,
+                "board": state.board().tolist(),
+                "hibrit": VOTES[predictions.get(HIBRIT_MODEL, 0)],
+                "confidence": state.confidence if predictions else None}
+
+
+class _Shard:
+    """Aynı anda en fazla bir toplu işi çalışan oturum grubu ve paylaşılan motorları"""
+
+    __slots__ = ('pending', 'running', 'engines')
+
+    def __init__(self):
+        self.pending = []  # (oturum, sonuçlar, future)
+        self.running = False
+        self.engines = [AnalysisEngine(cache_size=0)]
+
+    def working_engines(self, count):
+        """Toplu işteki oturum sayısı kadar motor döndürür; modeller paylaşılır"""
+        models = self.engines[0].analysis_models
+        while len(self.engines) < count:
+            self.engines.append(AnalysisEngine(cache_size=0, models=models))
+        return self.engines[:count]
+
+
+def _step_sessions(shard, batch):
+    """
+    Bir toplu işi çalıştırır (havuz iş parçacığında)
+
+    Aynı oturumun istekleri geliş sırasıyla birleştirilir; oturum durumları
+    grubun motorlarına yüklenir ve matrisler step_engines() ile en fazla
+    MAX_BATCH_SESSIONS oturumluk parçalar halinde analiz edilir. Oturumlar burada
+    değiştirilmez; yeni adım sayıları ve durumlar olay döngüsünde birlikte atanır.
+
+    Args:
+        shard (_Shard): Oturumların grubu
+        batch (list): (oturum, sonuçlar, future) üçlüleri
+
+    Returns:
+        tuple: (her istek için adım kayıtları listesi, (oturum, adım sayısı, durum) listesi)
+    """
+    grouped = {}
+    for session, outcomes, _ in batch:
+        grouped.setdefault(session, []).extend(outcomes)
+
+    sessions = list(grouped)
+    steps = {}
+    updates = []
+    for start in range(0, len(sessions), MAX_BATCH_SESSIONS):
+        chunk = sessions[start:start + MAX_BATCH_SESSIONS]
+        engines = shard.working_engines(len(chunk))
+        for engine, session in zip(engines, chunk):
+            session.state.restore(engine)
+
+        results = step_engines([(engine, grouped[session]) for engine, session in zip(engines, chunk)])
+        for engine, session, result in zip(engines, chunk, results):
+            steps[session] = iter(result)
+            updates.append((session, session.steps + len(result), SessionState.snapshot(engine)))
+
+    counters = {session: session.steps for session in sessions}
+    records = []
+    for session, outcomes, _ in batch:
+        session_records = []
+        for value in outcomes:
+            row, col, predictions, confidence = next(steps[session])
+            counters[session] += 1
+            session_records.append(step_record(counters[session], value, row, col, predictions, confidence))
+        records.append(session_records)
+
+    return records, updates
+
+
+class PredictionServer:
+    """Birçok bağımsız oturumu barındıran asyncio tahmin sunucusu
+
+    Analiz olay döngüsünü bloklamadan iş parçacığı havuzunda çalışır. Bir grubun
+    toplu işi çalışırken (veya aynı döngü turunda) gelen sonuç istekleri birikir
+    ve bir sonraki toplu işte birlikte analiz edilir; böylece yük arttıkça
+    vektörel model yolları daha büyük yığınlarla çalışır. Bir oturum hep aynı
+    gruptadır, bu yüzden motoru aynı anda tek iş parçacığı kullanır.
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS):
+        """
+        Args:
+            workers (int, optional): Analiz iş parçacığı (ve oturum grubu) sayısı
+        """
+        if workers <= 0:
+            raise ValueError("İş parçacığı sayısı pozitif olmalıdır")
+
+        self.sessions = {}
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="PredictionWorker")
+        self.requests = 0
+        self.batches = 0
+
+        self._shards = [_Shard() for _ in range(workers)]
+        self.model_names = list(self._shards[0].engines[0].model_stats.names)
+        self._next_shard = 0
+        self._server = None
+        self._connections = {}  # Açık bağlantıların görevleri -> yazıcıları
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """
+        Dinlemeye başlar
+
+        Returns:
+            int: Dinlenen port (port=0 verildiyse işletim sisteminin seçtiği)
+        """
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """Sunucu kapatılana kadar bağlantıları kabul eder"""
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Dinlemeyi bırakır, açık bağlantıları kapatır ve çalışan analizlerin bitmesini bekler"""
+        if self._server is not None:
+            self._server.close()
+            for writer in self._connections.values():
+                writer.close()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+        await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+
+    # Oturumlar
+
+    def create_session(self, name=None):
+        """Yeni bir oturum açar"""
+        session = Session(uuid.uuid4().hex, name, self._next_shard)
+        self._next_shard = (self._next_shard + 1) % len(self._shards)
+        self.sessions[session.id] = session
+        return session
+
+    def _session(self, session_id):
+        """Oturumu döndürür, yoksa 404 hatası verir"""
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Oturum bulunamadı: {session_id}")
+        return session
+
+    async def record(self, session, outcomes):
+        """
+        Sonuçları oturuma ekler ve her adımın tahmin kaydını döndürür
+
+        Args:
+            session (Session): Oturum
+            outcomes (list): 1 (W) ve 2 (L) değerleri
+
+        Returns:
+            list: Her sonuç için predict.step_record() kaydı
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        shard = self._shards[session.shard]
+        shard.pending.append((session, outcomes, future))
+        self.requests += 1
+
+        if not shard.running:
+            shard.running = True
+            # Görev bir sonraki turda başlar; bu turda gelen istekler de toplu işe katılır
+            loop.create_task(self._drain(shard))
+
+        return await future
+
+    async def _drain(self, shard):
+        """Grubun bekleyen isteklerini toplu işler halinde havuzda çalıştırır"""
+        loop = asyncio.get_running_loop()
+        try:
+            while shard.pending:
+                batch, shard.pending = shard.pending, []
+                self.batches += 1
+
+                try:
+                    results, updates = await loop.run_in_executor(self.executor, _step_sessions, shard, batch)
+                except Exception as error:
+                    for _, _, future in batch:
+                        if not future.done():
+                            future.set_exception(error)
+                    continue
+
+                # Adım sayısı ve durum birlikte değişir; describe() hep tutarlı bir çift okur
+                for session, steps, state in updates:
+                    session.steps = steps
+                    session.state = state
+
+                # Bağlantısı kapanan isteklerin sonucu yine de oturuma işlenmiştir
+                for (_, _, future), records in zip(batch, results):
+                    if not future.done():
+                        future.set_result(records)
+        finally:
+            shard.running = False
+
+    # HTTP
+
+    async def handle(self, method, target, body=b""):
+        """
+        Bir isteği yanıtlar (soket olmadan da çağrılabilir)
+
+        Args:
+            method (str): HTTP metodu
+            target (str): İstek yolu
+            body (bytes, optional): İstek gövdesi
+
+        Returns:
+            tuple: (HTTP durum kodu, JSON yükü)
+        """
+        try:
+            return await self._route(method.upper(), target.split("?", 1)[0], body)
+        except HTTPError as error:
+            return error.status, {"error": str(error)}
+        except Exception as error:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(error).__name__}: {error}"}
+
+    async def _route(self, method, path, body):
+        """İsteği yola ve metoda göre işler"""
+        parts = [part for part in path.split("/") if part]
+
+        if parts == ["sessions"]:
+            if method == "POST":
+                options = _json_body(body) if body.strip() else {}
+                if not isinstance(options, dict):
+                    raise HTTPError(HTTPStatus.BAD_REQUEST, "Gövde bir JSON nesnesi olmalıdır")
+                session = self.create_session(options.get("name"))
+                return HTTPStatus.CREATED, session.describe(self.model_names)
+            if method == "GET":
+                return HTTPStatus.OK, {"sessions": [
+                    {"session": session.id, "name": session.name, "steps": session.steps}
+                    for session in self.sessions.values()]}
+
+        elif len(parts) == 2 and parts[0] == "sessions":
+            if method == "GET":
+                return HTTPStatus.OK, self._session(parts[1]).describe(self.model_names)
+            if method == "DELETE":
+                session = self._session(parts[1])
+                del self.sessions[session.id]
+                return HTTPStatus.OK, {"session": session.id, "closed": True}
+
+        elif len(parts) == 3 and parts[0] == "sessions" and parts[2] == "outcome":
+            if method == "POST":
+                session = self._session(parts[1])
+                try:
+                    outcomes = parse_line(body)
+                except (ValueError, UnicodeDecodeError) as error:
+                    raise HTTPError(HTTPStatus.BAD_REQUEST, str(error)) from None
+                if not outcomes:
+                    raise HTTPError(HTTPStatus.BAD_REQUEST, "Gövdede sonuç yok")
+                return HTTPStatus.OK, {"session": session.id,
+                                       "results": await self.record(session, outcomes)}
+
+        elif parts == ["stats"]:
+            if method == "GET":
+                return HTTPStatus.OK, {"sessions": len(self.sessions), "requests": self.requests,
+                                       "batches": self.batches}
+
+        else:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Bilinmeyen yol: {path}")
+
+        raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} bu yolda desteklenmiyor")
+
+    async def _handle_connection(self, reader, writer):
+        """Bir bağlantıdaki istekleri sırayla yanıtlar (HTTP/1.1, kalıcı bağlantı)"""
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                try:
+                    head = await _read_head(reader)
+                except HTTPError as error:
+                    self._write_response(writer, error.status, {"error": str(error)}, False)
+                    break
+                if head is None:
+                    break
+                method, target, version, headers, length = head
+
+                body = await reader.readexactly(length) if length > 0 else b""
+                status, payload = await self.handle(method, target, body)
+
+                keep_alive = (version == "HTTP/1.1"
+                              and headers.get("connection", "").lower() != "close")
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            del self._connections[task]
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    def _write_response(writer, status, payload, keep_alive):
+        """JSON yanıtını yazar"""
+        status = HTTPStatus(status)
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                "Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + data)
+
+
+async def _read_head(reader):
+    """İstek satırını ve başlıkları okuyup çözer
+
+    Args:
+        reader (asyncio.StreamReader): Bağlantının okuyucusu
+
+    Returns:
+        tuple | None: (method, target, version, başlıklar, gövde uzunluğu); bağlantı
+            kapandıysa None
+
+    Raises:
+        HTTPError: İstek hatalıysa 400, istek satırı çok uzunsa 414, başlıklar çok
+            uzun ya da çok fazlaysa 431, gövde çok büyükse 413
+    """
+    # readline() okuyucu sınırını aşan satırda ValueError verir
+    try:
+        request_line = await reader.readline()
+    except (ValueError, asyncio.LimitOverrunError):
+        raise HTTPError(HTTPStatus.REQUEST_URI_TOO_LONG, "İstek satırı çok uzun") from None
+    if not request_line:
+        return None
+
+    headers = {}
+    try:
+        for count in itertools.count():
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            if count >= MAX_HEADER_LINES:
+                raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Başlık sayısı çok fazla")
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+    except (ValueError, asyncio.LimitOverrunError):
+        raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Başlık satırı çok uzun") from None
+
+    try:
+        method, target, version = request_line.decode("latin-1").split()
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Geçersiz HTTP isteği") from None
+    if length < 0:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Geçersiz Content-Length")
+    if length > MAX_BODY_SIZE:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "İstek gövdesi çok büyük")
+    return method, target, version, headers, length
+
+
+def _json_body(body):
+    """İstek gövdesini JSON olarak çözer, hatalıysa 400 hatası verir"""
+    try:
+        return json.loads(body)
+    except (ValueError, UnicodeDecodeError) as error:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"Geçersiz JSON: {error}") from None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Çok oturumlu yerel W/L tahmin sunucusu")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Dinlenecek adres (varsayılan: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT,
+                        help=f"Dinlenecek port (varsayılan: {DEFAULT_PORT})")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Analiz iş parçacığı sayısı (varsayılan: {DEFAULT_WORKERS})")
+    args = parser.parse_args()
+
+    async def serve():
+        server = PredictionServer(args.workers)
+        port = await server.start(args.host, args.port)
+        print(f"Dinleniyor: http://{args.host}:{port}", flush=True)
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
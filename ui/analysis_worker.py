@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+W ve L Pattern Analiz Uygulaması - Modern UI
+Analizi arayüz iş parçacığı dışında çalıştıran zamanlayıcı
+"""
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+# Art arda gelen hamlelerin tek analizde birleştirildiği süre (ms)
+DEFAULT_COALESCE_MS = 40
+
+
+class AnalysisTask(QRunnable):
+    """Ara durumları puanlayıp en güncel matris durumunu arka plan iş parçacığında analiz eden görev"""
+
+    def __init__(self, scheduler, ready, model_stats, state, generation):
+        """
+        Args:
+            scheduler (AnalysisScheduler): Görevi başlatan zamanlayıcı
+            ready (list): Motordan alınmış, sonucu gelmiş ertelenen durumlar (take_deferred)
+            model_stats (ModelStats): Durumlar alındığında motorun istatistikleri
+            state (AnalysisSnapshot): En güncel durum; yetersiz veride None
+            generation (int): İsteğin nesli
+        """
+        super().__init__()
+        self.scheduler = scheduler
+        self.ready = ready
+        self.model_stats = model_stats
+        self.state = state
+        self.generation = generation
+
+    def run(self):
+        engine = self.scheduler.engine
+
+        # Ara durumlar motordan alındığı için nesil eskimiş olsa da puanlanır
+        engine.score_deferred(self.ready, self.model_stats)
+
+        # Sırada beklerken yeni bir durum geldiyse en güncel durumu analiz etmeden çık
+        if self.generation != self.scheduler.generation:
+            return
+
+        if self.state is None:
+            predictions, confidence = {}, 0.5
+        else:
+            # Hibrit, ara durumların puanlarını da içeren istatistiklerle çalışır
+            state = self.state._replace(model_stats=self.model_stats.copy())
+            predictions, confidence = engine.analyze_snapshot(state)
+        self.scheduler.task_finished.emit(self.generation, predictions, confidence)
+
+
+class AnalysisScheduler(QObject):
+    """Analiz isteklerini birleştirip tek iş parçacıklı havuza gönderen ve eski sonuçları atan zamanlayıcı
+
+    İlk istekten sonra `window_ms` içinde gelen istekler tek analizde birleştirilir.
+    Her hamlenin durumu motorda ertelenir (defer). Gönderimde sonucu gelmiş ara
+    durumlar motordan alınıp (take_deferred) göreve verilir; görev bunları havuz
+    iş parçacığında toplu hesaplayıp sırayla puanlar ve ardından en güncel durumu
+    analiz eder. Böylece model istatistikleri her hamle ayrı analiz edilmiş gibi
+    kalır ve arayüz iş parçacığında yalnızca kopyalama ve sayaç işleri yapılır.
+
+    Her istek nesil sayacını artırır. Görevler motorun snapshot() kopyası üzerinde
+    çalışır; sonuç geldiğinde nesli hâlâ güncelse result_ready yayınlanır, değilse
+    sonuç atılır (durum ertelenmiş kaldığı için bir sonraki analizde puanlanır).
+    Modeller ve önbellek paylaşıldığı için havuz tek iş parçacıklıdır.
+    """
+
+    # (nesil, tahminler, Hibrit güveni) - görevden arayüz iş parçacığına
+    task_finished = pyqtSignal(int, object, float)
+
+    # (tahminler, Hibrit güveni) - yalnızca en güncel durum için
+    result_ready = pyqtSignal(object, float)
+
+    def __init__(self, engine, parent=None, window_ms=DEFAULT_COALESCE_MS):
+        """
+        Args:
+            engine (AnalysisEngine): Analiz motoru
+            parent (QObject, optional): Üst nesne
+            window_ms (int, optional): Birleştirme süresi, 0 ise her istek hemen analiz edilir
+        """
+        super().__init__(parent)
+        self.engine = engine
+        self.generation = 0
+        self.window_ms = window_ms
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._dispatch)
+
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+        self.task_finished.connect(self._on_task_finished)
+
+    def request(self):
+        """Motorun mevcut durumu için analiz ister; bekleyen eski istekler geçersizleşir"""
+        self.generation += 1
+        self.engine.defer()
+
+        if self.window_ms <= 0:
+            self._dispatch()
+        elif not self._timer.isActive():
+            self._timer.start(self.window_ms)
+
+    def invalidate(self):
+        """Bekleyen ve çalışan analizlerin sonuçlarını geçersiz kılar"""
+        self.generation += 1
+        self._timer.stop()
+
+    def wait(self, msecs=-1):
+        """Birleştirme süresini beklemeden analizi başlatır ve tüm görevler bitene kadar bekler"""
+        if self._timer.isActive():
+            self._timer.stop()
+            self._dispatch()
+        return self.pool.waitForDone(msecs)
+
+    def _dispatch(self):
+        """Ara durumları ve en güncel durumu puanlanmak ve analiz edilmek üzere havuza gönderir"""
+        ready = self.engine.take_deferred()
+        enough = len(self.engine.history) >= 5
+
+        # Puanlanacak ara durum yoksa yetersiz veride analiz gerekmez, sonuç hemen verilir
+        if not ready and not enough:
+            self.result_ready.emit({}, 0.5)
+            return
+
+        # İstatistikler görevde ara durumlar puanlandıktan sonra kopyalanır
+        state = self.engine.snapshot(model_stats=False) if enough else None
+        self.pool.start(AnalysisTask(self, ready, self.engine.model_stats, state, self.generation))
+
+    def _on_task_finished(self, generation, predictions, confidence):
+        """Görev sonucunu yalnızca en güncel istek içinse iletir"""
+        if generation != self.generation:
+            return
+        self.result_ready.emit(predictions, confidence)